@@ -5,11 +5,13 @@
 import argparse
 import importlib
 import ipaddress
+import json
 import logging
 import os.path
 import socket
 import sys
 import tempfile
+import threading
 from functools import wraps
 from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
 from urllib.parse import urlparse
@@ -17,7 +19,7 @@ from urllib.parse import urlparse
 from airbyte_cdk.connector import TConfig
 from airbyte_cdk.exception_handler import init_uncaught_exception_handler
 from airbyte_cdk.logger import init_logger
-from airbyte_cdk.models import AirbyteMessage, Status, Type
+from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage, Status, Type
 from airbyte_cdk.models.airbyte_protocol import ConnectorSpecification  # type: ignore [attr-defined]
 from airbyte_cdk.sources import Source
 from airbyte_cdk.sources.utils.schema_helpers import check_config_against_spec_or_exit, split_config
@@ -30,6 +32,11 @@ logger = init_logger("airbyte")
 VALID_URL_SCHEMES = ["https"]
 CLOUD_DEPLOYMENT_MODE = "cloud"
 
+# Records are written to stdout in batches of this size. Any other message, e.g. a STATE, is written along with the records before it
+RECORD_BATCH_SIZE = 1000
+_RECORD_MESSAGE_PREFIX = '{"type": "RECORD"'
+_RECORD_FIELDS = list(AirbyteRecordMessage.__fields__)
+
 
 class AirbyteEntrypoint(object):
     def __init__(self, source: Source):
@@ -172,6 +179,10 @@ class AirbyteEntrypoint(object):
 
     @staticmethod
     def airbyte_message_to_string(airbyte_message: AirbyteMessage) -> Any:
+        if airbyte_message.type == Type.RECORD and airbyte_message.__fields_set__ == {"type", "record"}:
+            serialized_record = _record_message_to_string(airbyte_message.record)
+            if serialized_record is not None:
+                return serialized_record
         return airbyte_message.json(exclude_unset=True)
 
     @classmethod
@@ -194,11 +205,84 @@ class AirbyteEntrypoint(object):
         return
 
 
+def _record_message_to_string(record: Optional[AirbyteRecordMessage]) -> Optional[str]:
+    """
+    Serializes the AirbyteMessage of a record the same way as `AirbyteMessage.json(exclude_unset=True)` does, without going through pydantic
+    which converts the whole record to a dict before encoding it. Returns None if the record has fields this does not account for.
+
+    The stdlib json encoder is used on purpose rather than orjson: the output has to be identical to pydantic's, and orjson differs from it in
+    separators, float formatting and the handling of non-string keys.
+    """
+    if not isinstance(record, AirbyteRecordMessage) or not record.__fields_set__.issubset(_RECORD_FIELDS):
+        return None
+    fields = ", ".join(
+        f'"{field}": {json.dumps(getattr(record, field), default=AirbyteMessage.__json_encoder__)}'
+        for field in _RECORD_FIELDS
+        if field in record.__fields_set__
+    )
+    return f'{{"type": "RECORD", "record": {{{fields}}}}}'
+
+
+class _RecordBatch(logging.Filter):
+    """
+    Records waiting to be written to stdout. It is registered as a filter on the logging handlers so that the pending records are written
+    before any log message, which is written to stdout directly by the handler, and the messages keep the order they were emitted in.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._records: List[str] = []
+        self._lock = threading.Lock()
+
+    def add(self, record: str) -> None:
+        with self._lock:
+            self._records.append(record)
+            if len(self._records) >= RECORD_BATCH_SIZE:
+                self._write()
+
+    def flush(self, message: Optional[str] = None) -> None:
+        with self._lock:
+            if message is not None:
+                self._records.append(message)
+            self._write()
+            sys.stdout.flush()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        with self._lock:
+            self._write()
+        return True
+
+    def _write(self) -> None:
+        if self._records:
+            sys.stdout.write("\n".join(self._records) + "\n")
+            self._records.clear()
+
+
+def _write_messages(messages: Iterable[str]) -> None:
+    """
+    Writes the messages to stdout, one per line. Records are written in batches instead of one write per message, and the output is flushed
+    whenever another type of message is written so that state checkpoints are not held back.
+    """
+    batch = _RecordBatch()
+    handlers = logging.getLogger().handlers
+    for handler in handlers:
+        handler.addFilter(batch)
+    try:
+        for message in messages:
+            if message.startswith(_RECORD_MESSAGE_PREFIX):
+                batch.add(message)
+            else:
+                batch.flush(message)
+    finally:
+        for handler in handlers:
+            handler.removeFilter(batch)
+        batch.flush()
+
+
 def launch(source: Source, args: List[str]) -> None:
     source_entrypoint = AirbyteEntrypoint(source)
     parsed_args = source_entrypoint.parse_args(args)
-    for message in source_entrypoint.run(parsed_args):
-        print(message)
+    _write_messages(source_entrypoint.run(parsed_args))
 
 
 def _init_internal_request_filter() -> None:
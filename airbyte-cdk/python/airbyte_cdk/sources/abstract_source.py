@@ -4,7 +4,7 @@
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 from airbyte_cdk.models import (
     AirbyteCatalog,
@@ -24,10 +24,12 @@ from airbyte_cdk.sources.source import Source
 from airbyte_cdk.sources.streams import Stream
 from airbyte_cdk.sources.streams.core import StreamData
 from airbyte_cdk.sources.streams.http.http import HttpStream
+from airbyte_cdk.sources.utils.concurrent_slice_reader import ConcurrentSliceReader, StreamSlice
 from airbyte_cdk.sources.utils.record_helper import stream_data_to_airbyte_message
 from airbyte_cdk.sources.utils.schema_helpers import InternalConfig, split_config
 from airbyte_cdk.sources.utils.slice_logger import DebugSliceLogger, SliceLogger
-from airbyte_cdk.utils.event_timing import create_timer
+from airbyte_cdk.sources.utils.transform import TransformConfig
+from airbyte_cdk.utils.event_timing import EventTimer, create_timer
 from airbyte_cdk.utils.stream_status_utils import as_airbyte_message as stream_status_as_airbyte_message
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 
@@ -99,55 +101,132 @@ class AbstractSource(Source, ABC):
         stream_instances = {s.name: s for s in self.streams(config)}
         state_manager = ConnectorStateManager(stream_instance_map=stream_instances, state=state)
         self._stream_to_instance_map = stream_instances
+        self._size_http_transports(catalog, stream_instances)
         with create_timer(self.name) as timer:
-            for configured_stream in catalog.streams:
-                stream_instance = stream_instances.get(configured_stream.stream.name)
-                if not stream_instance:
-                    raise KeyError(
-                        f"The requested stream {configured_stream.stream.name} was not found in the source."
-                        f" Available streams: {stream_instances.keys()}"
+            if self.stream_concurrency_limit > 1:
+                yield from self._read_streams_concurrently(logger, catalog, stream_instances, state_manager, internal_config, timer)
+            else:
+                for configured_stream in catalog.streams:
+                    yield from self._read_configured_stream(
+                        logger, configured_stream, stream_instances, state_manager, internal_config, timer
                     )
 
-                try:
-                    timer.start_event(f"Syncing stream {configured_stream.stream.name}")
-                    stream_is_available, reason = stream_instance.check_availability(logger, self)
-                    if not stream_is_available:
-                        logger.warning(f"Skipped syncing stream '{stream_instance.name}' because it was unavailable. {reason}")
-                        continue
-                    logger.info(f"Marking stream {configured_stream.stream.name} as STARTED")
-                    yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.STARTED)
-                    yield from self._read_stream(
-                        logger=logger,
-                        stream_instance=stream_instance,
-                        configured_stream=configured_stream,
-                        state_manager=state_manager,
-                        internal_config=internal_config,
-                    )
-                    logger.info(f"Marking stream {configured_stream.stream.name} as STOPPED")
-                    yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.COMPLETE)
-                except AirbyteTracedException as e:
-                    yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.INCOMPLETE)
-                    raise e
-                except Exception as e:
-                    yield from self._emit_queued_messages()
-                    logger.exception(f"Encountered an exception while reading stream {configured_stream.stream.name}")
-                    logger.info(f"Marking stream {configured_stream.stream.name} as STOPPED")
-                    yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.INCOMPLETE)
-                    display_message = stream_instance.get_error_display_message(e)
-                    if display_message:
-                        raise AirbyteTracedException.from_exception(e, message=display_message) from e
-                    raise e
-                finally:
-                    timer.finish_event()
-                    logger.info(f"Finished syncing {configured_stream.stream.name}")
-                    logger.info(timer.report())
-
         logger.info(f"Finished syncing {self.name}")
 
     @property
     def per_stream_state_enabled(self) -> bool:
         return True
 
+    @property
+    def stream_concurrency_limit(self) -> int:
+        """
+        Maximum number of streams read concurrently. With the default value of 1, the configured streams are read one after the other.
+
+        Streams are read on a pool of threads and their messages are interleaved on the output, so sources overriding this should only do so
+        if their streams are independent from one another.
+        """
+        return 1
+
+    def _size_http_transports(self, catalog: ConfiguredAirbyteCatalog, stream_instances: Mapping[str, Stream]) -> None:
+        """
+        Grows the connection pools shared by the HTTP streams so that every request sent concurrently can keep its connection
+        """
+        configured_streams = [stream_instances[s.stream.name] for s in catalog.streams if s.stream.name in stream_instances]
+        http_streams = [stream for stream in configured_streams if isinstance(stream, HttpStream)]
+        if not http_streams:
+            return
+        concurrent_requests = self.stream_concurrency_limit * max(stream.slice_concurrency_limit for stream in http_streams)
+        registries = [stream.transport_registry for stream in http_streams]
+        for registry in {id(registry): registry for registry in registries if registry is not None}.values():
+            registry.ensure_pool_size(concurrent_requests)
+
+    def _read_streams_concurrently(
+        self,
+        logger: logging.Logger,
+        catalog: ConfiguredAirbyteCatalog,
+        stream_instances: Mapping[str, Stream],
+        state_manager: ConnectorStateManager,
+        internal_config: InternalConfig,
+        timer: EventTimer,
+    ) -> Iterator[AirbyteMessage]:
+        """
+        Reads the configured streams on a pool of threads, emitting the messages of each stream in the order that stream produces them.
+
+        As when streams are read one after the other, the first stream failing aborts the sync. The streams that are still being read at that
+        point are marked as INCOMPLETE before the exception is raised.
+        """
+        streams_in_progress: Dict[str, ConfiguredAirbyteStream] = {}
+        try:
+            for message in ConcurrentSliceReader(self.stream_concurrency_limit).read_unordered(
+                catalog.streams,
+                lambda configured_stream: self._read_configured_stream(
+                    logger, configured_stream, stream_instances, state_manager, internal_config, timer
+                ),
+            ):
+                if message.type == MessageType.TRACE and message.trace.stream_status:
+                    stream_name = message.trace.stream_status.stream_descriptor.name
+                    if message.trace.stream_status.status == AirbyteStreamStatus.STARTED:
+                        streams_in_progress[stream_name] = next(s for s in catalog.streams if s.stream.name == stream_name)
+                    elif message.trace.stream_status.status in (AirbyteStreamStatus.COMPLETE, AirbyteStreamStatus.INCOMPLETE):
+                        streams_in_progress.pop(stream_name, None)
+                yield message
+        except Exception:
+            for configured_stream in streams_in_progress.values():
+                logger.info(f"Marking stream {configured_stream.stream.name} as STOPPED")
+                yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.INCOMPLETE)
+            raise
+
+    def _read_configured_stream(
+        self,
+        logger: logging.Logger,
+        configured_stream: ConfiguredAirbyteStream,
+        stream_instances: Mapping[str, Stream],
+        state_manager: ConnectorStateManager,
+        internal_config: InternalConfig,
+        timer: EventTimer,
+    ) -> Iterator[AirbyteMessage]:
+        stream_instance = stream_instances.get(configured_stream.stream.name)
+        if not stream_instance:
+            raise KeyError(
+                f"The requested stream {configured_stream.stream.name} was not found in the source."
+                f" Available streams: {stream_instances.keys()}"
+            )
+
+        event_name = f"Syncing stream {configured_stream.stream.name}"
+        try:
+            timer.start_event(event_name)
+            stream_is_available, reason = stream_instance.check_availability(logger, self)
+            if not stream_is_available:
+                logger.warning(f"Skipped syncing stream '{stream_instance.name}' because it was unavailable. {reason}")
+                return
+            logger.info(f"Marking stream {configured_stream.stream.name} as STARTED")
+            yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.STARTED)
+            yield from self._read_stream(
+                logger=logger,
+                stream_instance=stream_instance,
+                configured_stream=configured_stream,
+                state_manager=state_manager,
+                internal_config=internal_config,
+            )
+            logger.info(f"Marking stream {configured_stream.stream.name} as STOPPED")
+            yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.COMPLETE)
+        except AirbyteTracedException as e:
+            yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.INCOMPLETE)
+            raise e
+        except Exception as e:
+            yield from self._emit_queued_messages()
+            logger.exception(f"Encountered an exception while reading stream {configured_stream.stream.name}")
+            logger.info(f"Marking stream {configured_stream.stream.name} as STOPPED")
+            yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.INCOMPLETE)
+            display_message = stream_instance.get_error_display_message(e)
+            if display_message:
+                raise AirbyteTracedException.from_exception(e, message=display_message) from e
+            raise e
+        finally:
+            timer.finish_event(event_name)
+            logger.info(f"Finished syncing {configured_stream.stream.name}")
+            logger.info(timer.report())
+
     def _read_stream(
         self,
         logger: logging.Logger,
@@ -234,18 +313,21 @@ class AbstractSource(Source, ABC):
         )
         logger.debug(f"Processing stream slices for {stream_name} (sync_mode: incremental)", extra={"stream_slices": slices})
 
-        total_records_counter = 0
-        has_slices = False
-        for _slice in slices:
-            has_slices = True
-            if self._slice_logger.should_log_slice_message(logger):
-                yield self._slice_logger.create_slice_log_message(_slice)
-            records = stream_instance.read_records(
+        def read_slice(_slice: StreamSlice) -> Iterable[StreamData]:
+            return stream_instance.read_records(
                 sync_mode=SyncMode.incremental,
                 stream_slice=_slice,
                 stream_state=stream_state,
                 cursor_field=configured_stream.cursor_field or None,
             )
+
+        total_records_counter = 0
+        has_slices = False
+        # Records are always read in the order of the slices so that state is only checkpointed past slices that have been fully read
+        for _slice, records in self._read_slices(stream_instance, slices, read_slice):
+            has_slices = True
+            if self._slice_logger.should_log_slice_message(logger):
+                yield self._slice_logger.create_slice_log_message(_slice)
             record_counter = 0
             for message_counter, record_data_or_message in enumerate(records, start=1):
                 message = self._get_message(record_data_or_message, stream_instance)
@@ -292,15 +374,27 @@ class AbstractSource(Source, ABC):
         logger.debug(
             f"Processing stream slices for {configured_stream.stream.name} (sync_mode: full_refresh)", extra={"stream_slices": slices}
         )
-        total_records_counter = 0
-        for _slice in slices:
-            if self._slice_logger.should_log_slice_message(logger):
-                yield self._slice_logger.create_slice_log_message(_slice)
-            record_data_or_messages = stream_instance.read_records(
+
+        def read_slice(_slice: StreamSlice) -> Iterable[StreamData]:
+            return stream_instance.read_records(
                 stream_slice=_slice,
                 sync_mode=SyncMode.full_refresh,
                 cursor_field=configured_stream.cursor_field,
             )
+
+        slices_and_records: Iterable[Tuple[StreamSlice, Iterable[StreamData]]]
+        if stream_instance.slice_concurrency_limit > 1 and not stream_instance.emit_slices_in_order:
+            # Records from different slices interleave so they can't be grouped under slice log messages
+            slices_and_records = [(None, ConcurrentSliceReader(stream_instance.slice_concurrency_limit).read_unordered(slices, read_slice))]
+            log_slices = False
+        else:
+            slices_and_records = self._read_slices(stream_instance, slices, read_slice)
+            log_slices = True
+
+        total_records_counter = 0
+        for _slice, record_data_or_messages in slices_and_records:
+            if log_slices and self._slice_logger.should_log_slice_message(logger):
+                yield self._slice_logger.create_slice_log_message(_slice)
             for record_data_or_message in record_data_or_messages:
                 message = self._get_message(record_data_or_message, stream_instance)
                 yield message
@@ -309,6 +403,23 @@ class AbstractSource(Source, ABC):
                     if internal_config.is_limit_reached(total_records_counter):
                         return
 
+    @staticmethod
+    def _read_slices(
+        stream_instance: Stream, slices: Iterable[StreamSlice], read_slice: Callable[[StreamSlice], Iterable[StreamData]]
+    ) -> Iterator[Tuple[StreamSlice, Iterable[StreamData]]]:
+        """
+        Returns the records of each slice in the order of the slices. If the stream allows for it, the slices ahead are read concurrently.
+        """
+        if stream_instance.slice_concurrency_limit > 1:
+            yield from ConcurrentSliceReader(stream_instance.slice_concurrency_limit).read_ordered(slices, read_slice)
+        else:
+            for _slice in slices:
+                yield _slice, AbstractSource._read_slice_lazily(read_slice, _slice)
+
+    @staticmethod
+    def _read_slice_lazily(read_slice: Callable[[StreamSlice], Iterable[StreamData]], _slice: StreamSlice) -> Iterator[StreamData]:
+        yield from read_slice(_slice)
+
     def _checkpoint_state(self, stream: Stream, stream_state: Mapping[str, Any], state_manager: ConnectorStateManager) -> AirbyteMessage:
         # First attempt to retrieve the current state using the stream's state property. We receive an AttributeError if the state
         # property is not implemented by the stream instance and as a fallback, use the stream_state retrieved from the stream
@@ -336,7 +447,9 @@ class AbstractSource(Source, ABC):
         if isinstance(record_data_or_message, AirbyteMessage):
             return record_data_or_message
         else:
-            return stream_data_to_airbyte_message(stream.name, record_data_or_message, stream.transformer, stream.get_json_schema())
+            # The schema is only used to transform records so it is not loaded, which can mean reading a file, when there is nothing to transform
+            schema = {} if TransformConfig.NoTransform in stream.transformer.config else stream.get_json_schema()
+            return stream_data_to_airbyte_message(stream.name, record_data_or_message, stream.transformer, schema)
 
     @property
     def message_repository(self) -> Union[None, MessageRepository]:
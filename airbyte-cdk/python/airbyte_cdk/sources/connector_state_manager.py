@@ -3,6 +3,7 @@
 #
 
 import copy
+import threading
 from typing import Any, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 from airbyte_cdk.models import AirbyteMessage, AirbyteStateBlob, AirbyteStateMessage, AirbyteStateType, AirbyteStreamState, StreamDescriptor
@@ -44,6 +45,8 @@ class ConnectorStateManager:
                 "state messages with shared_state will not be processed correctly. "
             )
         self.per_stream_states = per_stream_states
+        # Streams can be read concurrently so their states are updated and read from different threads
+        self._lock = threading.RLock()
 
     def get_stream_state(self, stream_name: str, namespace: Optional[str]) -> MutableMapping[str, Any]:
         """
@@ -65,7 +68,8 @@ class ConnectorStateManager:
         :param value: A stream state mapping that is being updated for a stream
         """
         stream_descriptor = HashableStreamDescriptor(name=stream_name, namespace=namespace)
-        self.per_stream_states[stream_descriptor] = AirbyteStateBlob.parse_obj(value)
+        with self._lock:
+            self.per_stream_states[stream_descriptor] = AirbyteStateBlob.parse_obj(value)
 
     def create_state_message(self, stream_name: str, namespace: Optional[str], send_per_stream_state: bool) -> AirbyteMessage:
         """
@@ -169,7 +173,8 @@ class ConnectorStateManager:
         Using the current per-stream state, creates a mapping of all the stream states for the connector being synced
         :return: A deep copy of the mapping of stream name to stream state value
         """
-        return {descriptor.name: state.dict() if state else {} for descriptor, state in self.per_stream_states.items()}
+        with self._lock:
+            return {descriptor.name: state.dict() if state else {} for descriptor, state in self.per_stream_states.items()}
 
     @staticmethod
     def _is_legacy_dict_state(state: Union[List[AirbyteStateMessage], MutableMapping[str, Any]]) -> bool:
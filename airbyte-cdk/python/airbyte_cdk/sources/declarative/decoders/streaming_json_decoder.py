@@ -0,0 +1,201 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import codecs
+import json
+import re
+from dataclasses import InitVar, dataclass
+from typing import Any, Dict, Generator, Iterable, Iterator, List, Mapping, NoReturn, Optional, Sequence, Union
+
+import dpath.util
+import requests
+from airbyte_cdk.sources.declarative.decoders.decoder import Decoder
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Any character which cannot be part of a number, used to know whether a number could continue in the next chunk
+_NUMBER_END = re.compile(r"[^0-9eE.+\-]")
+_DECODER = json.JSONDecoder()
+
+
+@dataclass
+class StreamingJsonDecoder(Decoder):
+    """
+    Decoder strategy that parses the json-encoded content of a response as it is downloaded so records can be extracted one at a time.
+
+    When used by a DpathExtractor, the response is streamed and neither the whole body nor the whole decoded document is held in
+    memory: only the record being parsed and the fields of the response outside of the records are. Once the records have been read,
+    the content of the response is replaced by the document without the records, i.e. with an empty array at the field path, so that
+    the pagination can still read the other fields of the response. Interpolations reading the records from the response see that empty
+    array and should use `last_records` instead.
+    """
+
+    parameters: InitVar[Mapping[str, Any]]
+
+    CHUNK_SIZE = 64 * 1024
+
+    def decode(self, response: requests.Response) -> Union[Mapping[str, Any], List[Any]]:
+        try:
+            decoded: Union[Mapping[str, Any], List[Any]] = response.json()
+            return decoded
+        except requests.exceptions.JSONDecodeError:
+            return {}
+
+    def iterate_items(self, response: requests.Response, field_path: Sequence[str]) -> Iterator[Any]:
+        """
+        Yield the records found at `field_path` in the response without decoding the whole response. If the path points to an array, its
+        items are yielded. If it points to any other value, that value is yielded unless it is empty. An empty response has no records.
+
+        Unlike decode, a response which is not valid json raises a json.JSONDecodeError once the records before the error have been yielded:
+        its content has been consumed while parsing it, so the records which could not be read would otherwise be silently missed.
+
+        :param response: the response to read
+        :param field_path: the keys of the nested objects leading to the records. Keys are matched exactly, without globbing
+        """
+        chunks = response.iter_content(chunk_size=self.CHUNK_SIZE)
+        reader = _JsonItemsReader(_decode_chunks(chunks, response.encoding or "utf-8"))
+        yield from reader.read_items(field_path)
+        response._content = json.dumps(reader.document).encode("utf-8")  # type: ignore  # the content of the response was consumed
+        response.encoding = "utf-8"
+
+
+def _decode_chunks(chunks: Iterable[bytes], encoding: str) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    for chunk in chunks:
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    text = decoder.decode(b"", final=True)
+    if text:
+        yield text
+
+
+class _JsonItemsReader:
+    """
+    Incremental json parser extracting the items at a path of a document while it is read.
+
+    The document is read from a buffer which is refilled with chunks as the parsing needs more data. Values outside of the path are
+    decoded whole and kept in `document`, values along the path are parsed token by token so that the items at the path are yielded one
+    by one and are not kept.
+    """
+
+    def __init__(self, chunks: Iterator[str]):
+        self._chunks = chunks
+        self._buffer = ""
+        self._position = 0
+        self._exhausted = False
+        self.document: Any = {}
+
+    def read_items(self, path: Sequence[str]) -> Iterator[Any]:
+        if self._peek() == "":
+            # An empty body has no records
+            return
+        self.document = yield from self._read_items_at(path)
+        if self._peek() != "":
+            self._raise("Extra data")
+
+    def _read_items_at(self, path: Sequence[str]) -> Generator[Any, None, Any]:
+        """
+        Yield the items at `path` from the value starting at the current position and return that value without the items
+        """
+        next_character = self._peek()
+        if not path:
+            if next_character == "[":
+                yield from self._read_array_items()
+                return []
+            value = self._read_value()
+            if value:
+                yield value
+            return value
+
+        if next_character != "{":
+            # Keys cannot be read one by one, e.g. the path indexes an array: fall back to decoding the value whole
+            value = self._read_value()
+            extracted = dpath.util.get(value, list(path), default=[]) if isinstance(value, (dict, list)) else []
+            if isinstance(extracted, list):
+                yield from extracted
+            elif extracted:
+                yield extracted
+            return value
+
+        self._expect("{")
+        value_without_items: Dict[str, Any] = {}
+        if self._peek() == "}":
+            self._position += 1
+            return value_without_items
+        while True:
+            key = self._read_value()
+            if not isinstance(key, str):
+                self._raise("Expecting property name enclosed in double quotes")
+            self._expect(":")
+            if key == path[0]:
+                value_without_items[key] = yield from self._read_items_at(path[1:])
+            else:
+                value_without_items[key] = self._read_value()
+            if self._peek() == ",":
+                self._position += 1
+                continue
+            self._expect("}")
+            return value_without_items
+
+    def _read_array_items(self) -> Iterator[Any]:
+        self._expect("[")
+        if self._peek() == "]":
+            self._position += 1
+            return
+        while True:
+            yield self._read_value()
+            if self._peek() == ",":
+                self._position += 1
+                continue
+            self._expect("]")
+            return
+
+    def _read_value(self) -> Any:
+        next_character = self._peek()
+        if next_character and next_character in "-0123456789":
+            # A number is only complete once a character which cannot be part of it has been read
+            while not _NUMBER_END.search(self._buffer, self._position) and self._read_more():
+                pass
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buffer, self._position)
+                self._position = end
+                return value
+            except json.JSONDecodeError:
+                if self._exhausted:
+                    raise
+            # The value is incomplete. Grow the buffer by at least what is already buffered so that large values are not decoded again
+            # for every chunk
+            unread_size = len(self._buffer) - self._position
+            while len(self._buffer) - self._position < 2 * unread_size and self._read_more():
+                pass
+
+    def _peek(self) -> str:
+        """
+        Skip whitespaces and return the next character, or an empty string at the end of the document
+        """
+        while True:
+            self._position = _WHITESPACE.match(self._buffer, self._position).end()  # type: ignore  # the pattern matches empty strings
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._read_more():
+                return ""
+
+    def _expect(self, character: str) -> None:
+        if self._peek() != character:
+            self._raise(f"Expecting '{character}' delimiter")
+        self._position += 1
+
+    def _read_more(self) -> bool:
+        chunk: Optional[str] = next(self._chunks, None)
+        if chunk is None:
+            self._exhausted = True
+            return False
+        # Drop what was already parsed so the buffer only holds the value being parsed
+        self._buffer = self._buffer[self._position :] + chunk
+        self._position = 0
+        return True
+
+    def _raise(self, message: str) -> NoReturn:
+        raise json.JSONDecodeError(message, self._buffer, self._position)
@@ -2,6 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import re
 from dataclasses import InitVar, dataclass
 from typing import Any, List, Mapping, Union
 
@@ -9,10 +10,14 @@ import dpath.util
 import requests
 from airbyte_cdk.sources.declarative.decoders.decoder import Decoder
 from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders.streaming_json_decoder import StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.extractors.record_extractor import RecordExtractor
 from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
 from airbyte_cdk.sources.declarative.types import Config
 
+# dpath matches each key of the path as a glob pattern
+_GLOB_CHARACTERS = re.compile(r"[*?[\]]")
+
 
 @dataclass
 class DpathExtractor(RecordExtractor):
@@ -24,6 +29,9 @@ class DpathExtractor(RecordExtractor):
     If the field path points to an empty object, an empty array is returned.
     If the field path points to a non-existing path, an empty array is returned.
 
+    With a StreamingJsonDecoder, records are parsed from the response as it is downloaded instead of decoding the whole response first,
+    unless the field path contains wildcards.
+
     Examples of instantiating this transform:
     ```
       extractor:
@@ -64,11 +72,13 @@ class DpathExtractor(RecordExtractor):
                 self.field_path[path_index] = InterpolatedString.create(self.field_path[path_index], parameters=parameters)
 
     def extract_records(self, response: requests.Response) -> List[Mapping[str, Any]]:
+        path = [path.eval(self.config) for path in self.field_path]
+        if isinstance(self.decoder, StreamingJsonDecoder) and not any(_GLOB_CHARACTERS.search(key) for key in path):
+            return list(self.decoder.iterate_items(response, path))
         response_body = self.decoder.decode(response)
         if len(self.field_path) == 0:
             extracted = response_body
         else:
-            path = [path.eval(self.config) for path in self.field_path]
             if "*" in path:
                 extracted = dpath.util.values(response_body, path)
             else:
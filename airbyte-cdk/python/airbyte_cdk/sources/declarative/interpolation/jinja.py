@@ -3,13 +3,16 @@
 #
 
 import ast
-from typing import Optional
+from threading import Lock
+from typing import Any, FrozenSet, Optional, Tuple
+
+from cachetools import LRUCache
 
 from airbyte_cdk.sources.declarative.interpolation.filters import filters
 from airbyte_cdk.sources.declarative.interpolation.interpolation import Interpolation
 from airbyte_cdk.sources.declarative.interpolation.macros import macros
 from airbyte_cdk.sources.declarative.types import Config
-from jinja2 import meta
+from jinja2 import Template, meta
 from jinja2.exceptions import UndefinedError
 from jinja2.sandbox import Environment
 
@@ -48,6 +51,9 @@ class JinjaInterpolation(Interpolation):
     # Please add a unit test to test_jinja.py when adding a restriction.
     RESTRICTED_BUILTIN_FUNCTIONS = ["range"]  # The range function can cause very expensive computations
 
+    # Templates are evaluated for every request and record, so compiled templates are cached to avoid re-parsing them on every call
+    MAX_CACHED_TEMPLATES = 1024
+
     def __init__(self):
         self._environment = Environment()
         self._environment.filters.update(**filters)
@@ -58,6 +64,14 @@ class JinjaInterpolation(Interpolation):
         for builtin in self.RESTRICTED_BUILTIN_FUNCTIONS:
             self._environment.globals.pop(builtin, None)
 
+        self._template_markers = (
+            self._environment.variable_start_string,
+            self._environment.block_start_string,
+            self._environment.comment_start_string,
+        )
+        self._compiled_templates: "LRUCache[str, Tuple[Template, FrozenSet[str]]]" = LRUCache(maxsize=self.MAX_CACHED_TEMPLATES)
+        self._compiled_templates_lock = Lock()
+
     def eval(self, input_str: str, config: Config, default: Optional[str] = None, **additional_parameters):
         context = {"config": config, **additional_parameters}
 
@@ -91,13 +105,32 @@ class JinjaInterpolation(Interpolation):
 
     def _eval(self, s: str, context):
         try:
-            ast = self._environment.parse(s)
-            undeclared = meta.find_undeclared_variables(ast)
+            if self._is_static(s):
+                return s
+            template, undeclared = self._compile(s)
             undeclared_not_in_context = {var for var in undeclared if var not in context}
             if undeclared_not_in_context:
                 raise ValueError(f"Jinja macro has undeclared variables: {undeclared_not_in_context}. Context: {context}")
-            return self._environment.from_string(s).render(context)
+            return template.render(context)
         except TypeError:
             # The string is a static value, not a jinja template
             # It can be returned as is
             return s
+
+    def _is_static(self, s: Any) -> bool:
+        """
+        Returns True if the string has no jinja markup and would be rendered as is, in which case the template engine can be skipped.
+        Strings ending with a newline still go through jinja because it strips a single trailing newline when rendering.
+        """
+        return isinstance(s, str) and not any(marker in s for marker in self._template_markers) and not s.endswith(("\n", "\r"))
+
+    def _compile(self, s: str) -> Tuple[Template, FrozenSet[str]]:
+        with self._compiled_templates_lock:
+            compiled = self._compiled_templates.get(s)
+        if compiled is None:
+            ast = self._environment.parse(s)
+            undeclared = frozenset(meta.find_undeclared_variables(ast))
+            compiled = (self._environment.from_string(ast), undeclared)
+            with self._compiled_templates_lock:
+                self._compiled_templates[s] = compiled
+        return compiled
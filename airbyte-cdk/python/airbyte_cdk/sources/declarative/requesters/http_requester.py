@@ -46,6 +46,7 @@ class HttpRequester(Requester):
         authenticator (DeclarativeAuthenticator): Authenticator defining how to authenticate to the source
         error_handler (Optional[ErrorHandler]): Error handler defining how to detect and handle errors
         config (Config): The user-provided configuration as specified by the source's spec
+        stream_response (bool): Whether the body of the responses is downloaded as it is read instead of before the response is returned
     """
 
     name: str
@@ -59,6 +60,7 @@ class HttpRequester(Requester):
     error_handler: Optional[ErrorHandler] = None
     disable_retries: bool = False
     message_repository: MessageRepository = NoopMessageRepository()
+    stream_response: bool = False
 
     _DEFAULT_MAX_RETRY = 5
     _DEFAULT_RETRY_FACTOR = 5
@@ -461,8 +463,12 @@ class HttpRequester(Requester):
         self.logger.debug(
             "Making outbound API request", extra={"headers": request.headers, "url": request.url, "request_body": request.body}
         )
-        response: requests.Response = self._session.send(request)
-        self.logger.debug("Receiving response", extra={"headers": response.headers, "status": response.status_code, "body": response.text})
+        response: requests.Response = self._session.send(request, stream=self.stream_response)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            # Reading the text of the response downloads the whole body
+            self.logger.debug(
+                "Receiving response", extra={"headers": response.headers, "status": response.status_code, "body": response.text}
+            )
         if log_formatter:
             formatter = log_formatter
             self.message_repository.log_message(
@@ -15,6 +15,11 @@ class InferenceType(Enum):
     PRIMITIVE_TYPES_ONLY = "Primitive Types Only"
 
 
+class CsvEngine(Enum):
+    PYTHON = "Python"
+    PYARROW = "PyArrow"
+
+
 class CsvHeaderDefinitionType(Enum):
     FROM_CSV = "From CSV"
     AUTOGENERATED = "Autogenerated"
@@ -125,6 +130,11 @@ class CsvFormat(BaseModel):
         default=DEFAULT_FALSE_VALUES,
         description="A set of case-sensitive strings that should be interpreted as false values.",
     )
+    engine: CsvEngine = Field(
+        title="Parsing Engine",
+        default=CsvEngine.PYTHON,
+        description="The engine parsing the CSV data. `PyArrow` parses the files by blocks of rows and casts the values column by column, which is faster for large files. Both engines read the same records, but `PyArrow` does not support rows larger than 1 MB.",
+    )
     inference_type: InferenceType = Field(
         title="Inference Type",
         default=InferenceType.NONE,
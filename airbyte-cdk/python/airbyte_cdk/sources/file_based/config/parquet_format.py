@@ -17,3 +17,9 @@ class ParquetFormat(BaseModel):
         description="Whether to convert decimal fields to floats. There is a loss of precision when converting decimals to floats, so this is not recommended.",
         default=False,
     )
+    batch_size: int = Field(
+        title="Record Batch Size",
+        description="The maximum number of rows read from the file at once. Smaller batches use less memory when rows are wide or row groups are large.",
+        default=10000,
+        gt=0,
+    )
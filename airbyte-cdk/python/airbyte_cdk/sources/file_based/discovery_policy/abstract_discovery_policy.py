@@ -9,6 +9,7 @@ class AbstractDiscoveryPolicy(ABC):
     """
     Used during discovery; allows the developer to configure the number of concurrent
     requests to send to the source, and the number of files to use for schema discovery.
+    Also allows the developer to configure the number of files read concurrently during syncs.
     """
 
     @property
@@ -20,3 +21,11 @@ class AbstractDiscoveryPolicy(ABC):
     @abstractmethod
     def max_n_files_for_schema_inference(self) -> int:
         ...
+
+    @property
+    def n_concurrent_file_reads(self) -> int:
+        """
+        The number of files of a slice that are opened and parsed concurrently during reads. Records are still emitted file by
+        file, in the order of the slice. With the default value of 1, files are read one after the other.
+        """
+        return 1
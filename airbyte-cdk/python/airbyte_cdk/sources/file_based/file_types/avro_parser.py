@@ -2,16 +2,19 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import json
 import logging
 import uuid
-from typing import Any, Dict, Iterable, Mapping, Optional
+from typing import Any, Dict, Iterable, Mapping, Optional, Set
 
 import fastavro
+from fastavro.schema import SchemaParseException, UnknownType
 from airbyte_cdk.sources.file_based.config.avro_format import AvroFormat
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
 from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader, FileReadMode
 from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+from airbyte_cdk.sources.file_based.rewindable_file import RewindableFile
 from airbyte_cdk.sources.file_based.schema_helpers import SchemaType
 
 AVRO_TYPE_TO_JSON_TYPE = {
@@ -139,10 +142,16 @@ class AvroParser(FileTypeParser):
         if not isinstance(avro_format, AvroFormat):
             raise ValueError(f"Expected ParquetFormat, got {avro_format}")
 
+        selected_columns = self.get_selected_columns(config, discovered_schema)
         with stream_reader.open_file(file, self.file_read_mode, self.ENCODING, logger) as fp:
-            avro_reader = fastavro.reader(fp)
+            if selected_columns is None:
+                avro_reader = fastavro.reader(fp)
+            else:
+                avro_reader = self._open_projected_reader(fp, selected_columns, logger)
             schema = avro_reader.writer_schema
-            schema_field_name_to_type = {field["name"]: field["type"] for field in schema["fields"]}
+            schema_field_name_to_type = {
+                field["name"]: field["type"] for field in schema["fields"] if selected_columns is None or field["name"] in selected_columns
+            }
             for record in avro_reader:
                 yield {
                     record_field: self._to_output_value(avro_format, schema_field_name_to_type[record_field], record[record_field])
@@ -153,6 +162,33 @@ class AvroParser(FileTypeParser):
     def file_read_mode(self) -> FileReadMode:
         return FileReadMode.READ_BINARY
 
+    @staticmethod
+    def _open_projected_reader(fp: Any, selected_columns: Set[str], logger: logging.Logger) -> fastavro.reader:
+        """
+        Open a reader which only decodes the fields of the records which are selected. The values of the other fields are skipped while the
+        records are read.
+
+        The reader schema has to be given to fastavro before it reads the header of the file, so the header is read a first time to get the
+        writer schema and then read again from the bytes which were recorded.
+        """
+        rewindable_file = RewindableFile(fp)
+        writer_schema = json.loads(fastavro.reader(rewindable_file).metadata["avro.schema"])
+        rewindable_file.rewind()
+        if not isinstance(writer_schema, Mapping) or writer_schema.get("type") != "record":
+            return fastavro.reader(rewindable_file)
+        fields = writer_schema["fields"]
+        selected_fields = [field for field in fields if field["name"] in selected_columns]
+        if len(selected_fields) == len(fields):
+            return fastavro.reader(rewindable_file)
+        reader_schema = {**writer_schema, "fields": selected_fields}
+        try:
+            fastavro.parse_schema(reader_schema)
+        except (SchemaParseException, UnknownType) as exc:
+            # e.g. a selected field refers to a named type which is only defined by a field which is not selected
+            logger.info(f"Reading all the fields of the records as the fields could not be projected: {exc}")
+            return fastavro.reader(rewindable_file)
+        return fastavro.reader(rewindable_file, reader_schema=reader_schema)
+
     @staticmethod
     def _to_output_value(avro_format: AvroFormat, record_type: Mapping[str, Any], record_value: Any) -> Any:
         if not isinstance(record_type, Mapping):
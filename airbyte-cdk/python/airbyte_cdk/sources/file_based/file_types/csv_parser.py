@@ -2,24 +2,39 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import codecs
 import csv
+import io
 import json
 import logging
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from functools import partial
 from io import IOBase
-from typing import Any, Callable, Dict, Generator, Iterable, List, Mapping, Optional, Set
-
-from airbyte_cdk.sources.file_based.config.csv_format import CsvFormat, CsvHeaderAutogenerated, CsvHeaderUserProvided, InferenceType
+from typing import Any, Callable, Dict, Generator, Iterable, List, Mapping, Optional, Set, Tuple
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+from airbyte_cdk.sources.file_based.config.csv_format import (
+    CsvEngine,
+    CsvFormat,
+    CsvHeaderAutogenerated,
+    CsvHeaderUserProvided,
+    InferenceType,
+)
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
 from airbyte_cdk.sources.file_based.exceptions import FileBasedSourceError, RecordParseError
 from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader, FileReadMode
 from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+from airbyte_cdk.sources.file_based.rewindable_file import RewindableFile
 from airbyte_cdk.sources.file_based.schema_helpers import TYPE_PYTHON_MAPPING, SchemaType
 
 DIALECT_NAME = "_config_dialect"
+# Values which pyarrow parses exactly like int() and float() do. Other values, e.g. with a leading "+", are cast by Python
+_INTEGER_PATTERN = r"^-?[0-9]+$"
+_NUMBER_PATTERN = r"^-?([0-9]+\.?[0-9]*|\.[0-9]+)([eE][+-]?[0-9]+)?$"
 
 
 class _CsvReader:
@@ -30,7 +45,12 @@ class _CsvReader:
         stream_reader: AbstractFileBasedStreamReader,
         logger: logging.Logger,
         file_read_mode: FileReadMode,
+        columns: Optional[Set[str]] = None,
     ) -> Generator[Dict[str, Any], None, None]:
+        """
+        Yield the rows of the file as dicts. If `columns` is set, the rows only contain these columns: the values of the other columns are
+        not copied into the rows.
+        """
         config_format = _extract_format(config)
 
         # Formats are configured individually per-stream so a unique dialect should be registered for each stream.
@@ -55,18 +75,41 @@ class _CsvReader:
             )
             self._skip_rows(fp, rows_to_skip)
 
-            reader = csv.DictReader(fp, dialect=dialect_name, fieldnames=headers)  # type: ignore
             try:
-                for row in reader:
-                    # The row was not properly parsed if any of the values are None. This will most likely occur if there are more columns
-                    # than headers or more headers dans columns
-                    if None in row or None in row.values():
-                        raise RecordParseError(FileBasedSourceError.ERROR_PARSING_RECORD)
-                    yield row
+                if columns is None:
+                    yield from self._read_rows(fp, dialect_name, headers)
+                else:
+                    yield from self._read_selected_columns(fp, dialect_name, headers, columns)
             finally:
                 # due to RecordParseError or GeneratorExit
                 csv.unregister_dialect(dialect_name)
 
+    @staticmethod
+    def _read_rows(fp: IOBase, dialect_name: str, headers: List[str]) -> Generator[Dict[str, Any], None, None]:
+        reader = csv.DictReader(fp, dialect=dialect_name, fieldnames=headers)  # type: ignore
+        for row in reader:
+            # The row was not properly parsed if any of the values are None. This will most likely occur if there are more columns
+            # than headers or more headers dans columns
+            if None in row or None in row.values():
+                raise RecordParseError(FileBasedSourceError.ERROR_PARSING_RECORD)
+            yield row
+
+    @staticmethod
+    def _read_selected_columns(
+        fp: IOBase, dialect_name: str, headers: List[str], columns: Set[str]
+    ) -> Generator[Dict[str, Any], None, None]:
+        # Same as _read_rows, but only the values of the selected columns are put in the rows
+        selected = [(index, header) for index, header in enumerate(headers) if header in columns]
+        n_headers = len(headers)
+        reader = csv.reader(fp, dialect=dialect_name)  # type: ignore
+        for values in reader:
+            if not values:
+                # Like csv.DictReader, skip empty lines
+                continue
+            if len(values) != n_headers:
+                raise RecordParseError(FileBasedSourceError.ERROR_PARSING_RECORD)
+            yield {header: values[index] for index, header in selected}
+
     def _get_headers(self, fp: IOBase, config_format: CsvFormat, dialect_name: str) -> List[str]:
         """
         Assumes the fp is pointing to the beginning of the files and will reset it as such
@@ -104,11 +147,198 @@ class _CsvReader:
             fp.readline()
 
 
+class _StoppableFile(io.RawIOBase):
+    """
+    Read-only file which ends as soon as it is stopped
+    """
+
+    def __init__(self, file: io.RawIOBase):
+        super().__init__()
+        self._file = file
+        self._stopped = False
+
+    def readable(self) -> bool:
+        return True
+
+    def stop(self) -> None:
+        self._stopped = True
+
+    def readinto(self, buffer: bytearray) -> int:  # type: ignore  # RawIOBase accepts any writable buffer
+        if self._stopped:
+            return 0
+        return self._file.readinto(buffer) or 0
+
+
+class _PyArrowCsvReader:
+    """
+    Reads CSV files by blocks of rows with pyarrow. The values are not converted: every column of the batches is a string column, so that
+    the values are cast like the rows read by _CsvReader.
+    """
+
+    BLOCK_SIZE = 1024 * 1024
+
+    def read_batches(
+        self,
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+        columns: Optional[Set[str]] = None,
+    ) -> Generator[pa.RecordBatch, None, None]:
+        """
+        Yield the rows of the file as record batches of string columns named after the headers. If `columns` is set, the batches only
+        contain these columns. Like _CsvReader.read_data, the rows before a row not having as many values as there are headers are yielded
+        and a RecordParseError is raised instead of that row.
+        """
+        config_format = _extract_format(config)
+        encoding = config_format.encoding or "utf8"
+        if codecs.lookup(encoding).name == "utf-8":
+            # pyarrow decodes utf8 itself and transcodes the other encodings with Python codecs
+            encoding = "utf8"
+        with stream_reader.open_file(file, FileReadMode.READ_BINARY, None, logger) as fp:
+            rows_to_skip = (
+                config_format.skip_rows_before_header
+                + (1 if config_format.header_definition.has_header_row() else 0)
+                + config_format.skip_rows_after_header
+            )
+            rewindable_file = RewindableFile(fp)  # type: ignore  # the file is opened in binary mode
+            headers, is_empty = self._read_headers(rewindable_file, config_format, encoding, rows_to_skip)
+            rewindable_file.rewind()
+            if is_empty:
+                return
+            if not headers:
+                raise RecordParseError(FileBasedSourceError.ERROR_PARSING_RECORD)
+
+            # Like with csv.DictReader, the value of a header which is repeated is the value of its last column
+            index_by_header: Dict[str, int] = {}
+            for index, header in enumerate(headers):
+                index_by_header[header] = index
+            if columns is not None:
+                index_by_header = {header: index for header, index in index_by_header.items() if header in columns}
+            # The columns are named after their index as headers can be repeated
+            column_names = [str(index) for index in range(len(headers))]
+            # pyarrow reads all the columns when none is included, in which case the first column is read and dropped
+            included_columns = [column_names[index] for index in index_by_header.values()] or column_names[:1]
+            invalid_row_numbers: List[Optional[int]] = []
+
+            def skip_invalid_row(row: pa_csv.InvalidRow) -> str:
+                invalid_row_numbers.append(row.number)
+                return "skip"
+
+            stoppable_file = _StoppableFile(rewindable_file)
+            reader = pa_csv.open_csv(
+                stoppable_file,
+                read_options=pa_csv.ReadOptions(
+                    block_size=self.BLOCK_SIZE,
+                    skip_rows=rows_to_skip,
+                    column_names=column_names,
+                    encoding=encoding,
+                    # The invalid row handler is called more than once for a row when the blocks are parsed by several threads
+                    use_threads=False,
+                ),
+                parse_options=pa_csv.ParseOptions(
+                    delimiter=config_format.delimiter,
+                    quote_char=config_format.quote_char,
+                    double_quote=config_format.double_quote,
+                    escape_char=config_format.escape_char or False,
+                    newlines_in_values=True,
+                    invalid_row_handler=skip_invalid_row,
+                ),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={name: pa.string() for name in column_names},
+                    include_columns=included_columns,
+                    null_values=[],
+                    strings_can_be_null=False,
+                    quoted_strings_can_be_null=False,
+                ),
+            )
+            selected_headers = list(index_by_header)
+            try:
+                n_rows = 0
+                for batch in reader:
+                    if invalid_row_numbers:
+                        # The row numbers count the skipped rows, but not the empty lines which are ignored like with csv.DictReader
+                        first_invalid_row_number = invalid_row_numbers[0]
+                        n_valid_rows = first_invalid_row_number - rows_to_skip - 1 if first_invalid_row_number is not None else n_rows
+                        if n_rows + batch.num_rows >= n_valid_rows:
+                            yield self._select_columns(batch.slice(0, max(0, n_valid_rows - n_rows)), selected_headers)
+                            raise RecordParseError(FileBasedSourceError.ERROR_PARSING_RECORD)
+                    n_rows += batch.num_rows
+                    yield self._select_columns(batch, selected_headers)
+                if invalid_row_numbers:
+                    raise RecordParseError(FileBasedSourceError.ERROR_PARSING_RECORD)
+            except pa.ArrowInvalid as exc:
+                raise RecordParseError(FileBasedSourceError.ERROR_PARSING_RECORD) from exc
+            finally:
+                self._stop(reader, stoppable_file)
+
+    @staticmethod
+    def _stop(reader: pa_csv.CSVStreamingReader, stoppable_file: "_StoppableFile") -> None:
+        """
+        Closing a reader which is still reading ahead from a Python file can deadlock, e.g. when the records of a file are not all read. The
+        file is made to end instead, so that the reader stops reading ahead by itself before being closed.
+        """
+        stoppable_file.stop()
+        try:
+            for _ in reader:
+                pass
+        except pa.ArrowInvalid:
+            # The last row was cut
+            pass
+        reader.close()
+
+    @staticmethod
+    def _select_columns(batch: pa.RecordBatch, selected_headers: List[str]) -> pa.RecordBatch:
+        if not selected_headers:
+            return batch.select([])
+        return pa.RecordBatch.from_arrays(batch.columns, names=selected_headers)
+
+    @staticmethod
+    def _read_headers(fp: RewindableFile, config_format: CsvFormat, encoding: str, rows_to_skip: int) -> Tuple[List[str], bool]:
+        """
+        Same as _CsvReader._get_headers, reading the beginning of a binary file.
+
+        :return: the headers and whether the file ends before its first row, in which case pyarrow fails to skip the rows before it
+        """
+        text_file = io.TextIOWrapper(io.BufferedReader(fp), encoding=encoding, newline="")  # type: ignore  # RewindableFile is a raw file
+        try:
+            for _ in range(config_format.skip_rows_before_header):
+                text_file.readline()
+            n_read_lines = config_format.skip_rows_before_header
+            if isinstance(config_format.header_definition, CsvHeaderUserProvided):
+                headers = config_format.header_definition.column_names
+            else:
+                reader = csv.reader(
+                    text_file,
+                    delimiter=config_format.delimiter,
+                    quotechar=config_format.quote_char,
+                    escapechar=config_format.escape_char,
+                    doublequote=config_format.double_quote,
+                    quoting=csv.QUOTE_MINIMAL,
+                )
+                first_row = next(reader, [])
+                n_read_lines += reader.line_num
+                if isinstance(config_format.header_definition, CsvHeaderAutogenerated):
+                    headers = [f"f{i}" for i in range(len(first_row))]
+                else:
+                    headers = first_row
+            if n_read_lines > rows_to_skip:
+                # The first row was read to generate the headers
+                return headers, False
+            for _ in range(rows_to_skip - n_read_lines):
+                text_file.readline()
+            return headers, text_file.read(1) == ""
+        finally:
+            # Detach the wrappers so that they do not close the file when they are garbage collected
+            text_file.detach().detach()
+
+
 class CsvParser(FileTypeParser):
     _MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE = 1_000_000
 
-    def __init__(self, csv_reader: Optional[_CsvReader] = None):
+    def __init__(self, csv_reader: Optional[_CsvReader] = None, pyarrow_csv_reader: Optional[_PyArrowCsvReader] = None):
         self._csv_reader = csv_reader if csv_reader else _CsvReader()
+        self._pyarrow_csv_reader = pyarrow_csv_reader if pyarrow_csv_reader else _PyArrowCsvReader()
 
     async def infer_schema(
         self,
@@ -159,12 +389,120 @@ class CsvParser(FileTypeParser):
             deduped_property_types = CsvParser._pre_propcess_property_types(property_types)
         else:
             deduped_property_types = {}
+        # Values are only cast for the columns of the schema and the other columns are dropped, so they do not need to be read
+        columns = set(deduped_property_types) if deduped_property_types and not config.schemaless else None
+        if config_format.engine == CsvEngine.PYARROW:
+            yield from self._parse_records_by_batch(config, file, stream_reader, logger, deduped_property_types, columns)
+            return
         cast_fn = CsvParser._get_cast_function(deduped_property_types, config_format, logger, config.schemaless)
-        data_generator = self._csv_reader.read_data(config, file, stream_reader, logger, self.file_read_mode)
+        data_generator = self._csv_reader.read_data(config, file, stream_reader, logger, self.file_read_mode, columns)
         for row in data_generator:
             yield CsvParser._to_nullable(cast_fn(row), deduped_property_types, config_format.null_values, config_format.strings_can_be_null)
         data_generator.close()
 
+    def _parse_records_by_batch(
+        self,
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+        deduped_property_types: Mapping[str, str],
+        columns: Optional[Set[str]],
+    ) -> Iterable[Dict[str, Any]]:
+        """
+        Same as parse_records with the Python engine, but the values are cast and nulled column by column for each batch of rows
+        """
+        config_format = _extract_format(config)
+        cast = bool(deduped_property_types) and not config.schemaless
+        for batch in self._pyarrow_csv_reader.read_batches(config, file, stream_reader, logger, columns):
+            headers = []
+            values_by_column = []
+            warnings_by_row: Dict[int, List[str]] = defaultdict(list)
+            for header, column in zip(batch.schema.names, batch.columns):
+                prop_type = deduped_property_types.get(header)
+                if not cast:
+                    headers.append(header)
+                    values_by_column.append(CsvParser._null_column(column, prop_type, config_format))
+                elif prop_type is not None and prop_type in TYPE_PYTHON_MAPPING:
+                    headers.append(header)
+                    values_by_column.append(CsvParser._cast_column(column, header, prop_type, config_format, warnings_by_row))
+                # Like with _cast_types, the columns without a type are dropped
+            for row_index in sorted(warnings_by_row):
+                logger.warning(f"{FileBasedSourceError.ERROR_CASTING_VALUE.value}: {','.join(warnings_by_row[row_index])}")
+            if not values_by_column:
+                yield from ({} for _ in range(batch.num_rows))
+                continue
+            for row in zip(*values_by_column):
+                yield dict(zip(headers, row))
+
+    @staticmethod
+    def _null_column(column: pa.Array, prop_type: Optional[str], config_format: CsvFormat) -> List[Any]:
+        """
+        Null the string values of a column which are not cast like _to_nullable does for each row
+        """
+        values = _array_to_list(column)
+        if config_format.null_values and (config_format.strings_can_be_null or prop_type != "string"):
+            is_null = pc.is_in(column, value_set=pa.array(list(config_format.null_values), pa.string()))
+            if is_null.true_count:
+                return [None if value_is_null else value for value, value_is_null in zip(values, _array_to_list(is_null))]
+        return values
+
+    @staticmethod
+    def _cast_column(
+        column: pa.Array, header: str, prop_type: str, config_format: CsvFormat, warnings_by_row: Dict[int, List[str]]
+    ) -> List[Any]:
+        """
+        Cast and null the string values of a column like _cast_types and _to_nullable do for each row. Values are cast by pyarrow when it
+        casts them like Python would, and by _cast_value otherwise.
+        """
+        null_values = config_format.null_values
+        if prop_type == "string":
+            return CsvParser._null_column(column, prop_type, config_format)
+
+        cast_values: List[Any] = []
+        is_cast: List[bool] = []
+        vectorized_cast = CsvParser._vectorized_cast(column, prop_type, config_format)
+        if vectorized_cast is not None:
+            cast_column, is_cast_column = vectorized_cast
+            cast_values = _array_to_list(cast_column)
+            if is_cast_column.false_count == 0:
+                return cast_values
+            is_cast = _array_to_list(is_cast_column)
+
+        values = _array_to_list(column)
+        result = []
+        for row_index, value in enumerate(values):
+            if is_cast and is_cast[row_index]:
+                result.append(cast_values[row_index])
+                continue
+            cast_value, value_is_cast = CsvParser._cast_value(value, prop_type, config_format)
+            if not value_is_cast:
+                warnings_by_row[row_index].append(_format_warning(header, value, prop_type))
+            if CsvParser._value_is_none(cast_value, prop_type, null_values, config_format.strings_can_be_null):
+                cast_value = None
+            result.append(cast_value)
+        return result
+
+    @staticmethod
+    def _vectorized_cast(column: pa.Array, prop_type: str, config_format: CsvFormat) -> Optional[Tuple[pa.Array, pa.BooleanArray]]:
+        """
+        :return: the column cast by pyarrow and whether each value was cast, or None if pyarrow cannot cast the values of the column
+        """
+        _, python_type = TYPE_PYTHON_MAPPING[prop_type]
+        if python_type == bool:
+            is_true = pc.is_in(column, value_set=pa.array(list(config_format.true_values), pa.string()))
+            is_false = pc.is_in(column, value_set=pa.array(list(config_format.false_values), pa.string()))
+            return is_true, pc.or_(is_true, is_false)
+        if python_type == int or python_type == float:
+            pattern, arrow_type = (_INTEGER_PATTERN, pa.int64()) if python_type == int else (_NUMBER_PATTERN, pa.float64())
+            is_cast = pc.match_substring_regex(column, pattern)
+            try:
+                return pc.cast(pc.if_else(is_cast, column, "0"), arrow_type), is_cast
+            except pa.ArrowInvalid:
+                # e.g. integers which do not fit in 64 bits
+                return None
+        return None
+
     @property
     def file_read_mode(self) -> FileReadMode:
         return FileReadMode.READ
@@ -240,42 +578,11 @@ class CsvParser(FileTypeParser):
 
         for key, value in row.items():
             prop_type = deduped_property_types.get(key)
-            cast_value: Any = value
 
             if prop_type in TYPE_PYTHON_MAPPING and prop_type is not None:
-                _, python_type = TYPE_PYTHON_MAPPING[prop_type]
-
-                if python_type is None:
-                    if value == "":
-                        cast_value = None
-                    else:
-                        warnings.append(_format_warning(key, value, prop_type))
-
-                elif python_type == bool:
-                    try:
-                        cast_value = _value_to_bool(value, config_format.true_values, config_format.false_values)
-                    except ValueError:
-                        warnings.append(_format_warning(key, value, prop_type))
-
-                elif python_type == dict:
-                    try:
-                        # we don't re-use _value_to_object here because we type the column as object as long as there is only one object
-                        cast_value = json.loads(value)
-                    except json.JSONDecodeError:
-                        warnings.append(_format_warning(key, value, prop_type))
-
-                elif python_type == list:
-                    try:
-                        cast_value = _value_to_list(value)
-                    except (ValueError, json.JSONDecodeError):
-                        warnings.append(_format_warning(key, value, prop_type))
-
-                elif python_type:
-                    try:
-                        cast_value = _value_to_python_type(value, python_type)
-                    except ValueError:
-                        warnings.append(_format_warning(key, value, prop_type))
-
+                cast_value, is_cast = CsvParser._cast_value(value, prop_type, config_format)
+                if not is_cast:
+                    warnings.append(_format_warning(key, value, prop_type))
                 result[key] = cast_value
 
         if warnings:
@@ -284,6 +591,45 @@ class CsvParser(FileTypeParser):
             )
         return result
 
+    @staticmethod
+    def _cast_value(value: str, prop_type: str, config_format: CsvFormat) -> Tuple[Any, bool]:
+        """
+        :return: the value cast to the Python type of `prop_type` and whether it could be cast. Values which cannot be cast are returned as is.
+        """
+        _, python_type = TYPE_PYTHON_MAPPING[prop_type]
+
+        if python_type is None:
+            if value == "":
+                return None, True
+            return value, False
+
+        elif python_type == bool:
+            try:
+                return _value_to_bool(value, config_format.true_values, config_format.false_values), True
+            except ValueError:
+                return value, False
+
+        elif python_type == dict:
+            try:
+                # we don't re-use _value_to_object here because we type the column as object as long as there is only one object
+                return json.loads(value), True
+            except json.JSONDecodeError:
+                return value, False
+
+        elif python_type == list:
+            try:
+                return _value_to_list(value), True
+            except (ValueError, json.JSONDecodeError):
+                return value, False
+
+        elif python_type:
+            try:
+                return _value_to_python_type(value, python_type), True
+            except ValueError:
+                return value, False
+
+        return value, True
+
 
 class _TypeInferrer(ABC):
     @abstractmethod
@@ -398,6 +744,13 @@ def _format_warning(key: str, value: str, expected_type: Optional[Any]) -> str:
     return f"{key}: value={value},expected_type={expected_type}"
 
 
+def _array_to_list(array: pa.Array) -> List[Any]:
+    if array.null_count:
+        return array.to_pylist()  # type: ignore  # to_pylist returns a list
+    # Converting through numpy is an order of magnitude faster than to_pylist and gives the same Python values when there are no nulls
+    return array.to_numpy(zero_copy_only=False).tolist()  # type: ignore  # tolist returns a list
+
+
 def _no_cast(row: Mapping[str, str]) -> Mapping[str, str]:
     return row
 
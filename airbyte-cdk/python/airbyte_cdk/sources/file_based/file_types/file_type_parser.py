@@ -4,9 +4,9 @@
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Iterable, Mapping, Optional
+from typing import Any, Dict, Iterable, Mapping, Optional, Set
 
-from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
+from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig, ValidationPolicy
 from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader, FileReadMode
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.sources.file_based.schema_helpers import SchemaType
@@ -47,6 +47,22 @@ class FileTypeParser(ABC):
         """
         ...
 
+    @staticmethod
+    def get_selected_columns(config: FileBasedStreamConfig, discovered_schema: Optional[Mapping[str, SchemaType]]) -> Optional[Set[str]]:
+        """
+        Return the columns of the schema of the configured catalog, so that parsers only read and emit these columns, or None if all the
+        columns of the files have to be emitted.
+
+        With a validation policy other than emit_record, the columns which are not in the schema make the records fail the validation, so
+        they are still emitted.
+        """
+        if config.schemaless or not discovered_schema or config.validation_policy != ValidationPolicy.emit_record:
+            return None
+        properties = discovered_schema.get("properties")
+        if not isinstance(properties, Mapping):
+            return None
+        return set(properties)
+
     @property
     @abstractmethod
     def file_read_mode(self) -> FileReadMode:
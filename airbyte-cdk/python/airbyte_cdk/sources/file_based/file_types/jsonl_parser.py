@@ -2,10 +2,13 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import itertools
 import json
 import logging
-from typing import Any, Dict, Iterable, Mapping, Optional, Union
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Union
 
+import orjson
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
 from airbyte_cdk.sources.file_based.exceptions import FileBasedSourceError, RecordParseError
 from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader, FileReadMode
@@ -13,11 +16,15 @@ from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeP
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.sources.file_based.schema_helpers import PYTHON_TYPE_MAPPING, SchemaType, merge_schemas
 
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
 
 class JsonlParser(FileTypeParser):
 
     MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE = 1_000_000
-    ENCODING = "utf8"
+    ENCODING = None
+    BLOCK_SIZE = 1024 * 1024
 
     async def infer_schema(
         self,
@@ -48,8 +55,9 @@ class JsonlParser(FileTypeParser):
     ) -> Iterable[Dict[str, Any]]:
         """
         This code supports parsing json objects over multiple lines even though this does not align with the JSONL format. This is for
-        backward compatibility reasons i.e. the previous source-s3 parser did support this. The drawback is:
-        * performance as the way we support json over multiple lines is very brute forced
+        backward compatibility reasons i.e. the previous source-s3 parser did support this. The file is read by blocks and each line is
+        decoded as a record until a line is not valid json. The drawbacks are:
+        * performance as the rest of the file is then decoded as a stream of json documents, which is slower than decoding lines
         * given that we don't have `newlines_in_values` config to scope the possible inputs, we might parse the whole file before knowing if
           the input is improperly formatted or if the json is over multiple lines
 
@@ -71,7 +79,7 @@ class JsonlParser(FileTypeParser):
 
     @property
     def file_read_mode(self) -> FileReadMode:
-        return FileReadMode.READ
+        return FileReadMode.READ_BINARY
 
     def _parse_jsonl_entries(
         self,
@@ -80,44 +88,142 @@ class JsonlParser(FileTypeParser):
         logger: logging.Logger,
         read_limit: bool = False,
     ) -> Iterable[Dict[str, Any]]:
+        max_bytes = self.MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE if read_limit else None
         with stream_reader.open_file(file, self.file_read_mode, self.ENCODING, logger) as fp:
-            read_bytes = 0
-
-            had_json_parsing_error = False
-            has_warned_for_multiline_json_object = False
             yielded_at_least_once = False
-
-            accumulator = None
-            for line in fp:
-                if not accumulator:
-                    accumulator = self._instantiate_accumulator(line)
-                read_bytes += len(line)
-                accumulator += line  # type: ignore [operator]  # In reality, it's either bytes or string and we add the same type
-                try:
-                    record = json.loads(accumulator)
-                    if had_json_parsing_error and not has_warned_for_multiline_json_object:
-                        logger.warning(f"File at {file.uri} is using multiline JSON. Performance could be greatly reduced")
-                        has_warned_for_multiline_json_object = True
-
+            try:
+                for record in self._decode_records(file, fp, logger, max_bytes):
                     yield record
                     yielded_at_least_once = True
-                    accumulator = self._instantiate_accumulator(line)
-                except json.JSONDecodeError:
-                    had_json_parsing_error = True
+            except json.JSONDecodeError:
+                if not yielded_at_least_once:
+                    raise RecordParseError(FileBasedSourceError.ERROR_PARSING_RECORD)
 
-                if read_limit and yielded_at_least_once and read_bytes >= self.MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE:
-                    logger.warning(
-                        f"Exceeded the maximum number of bytes per file for schema inference ({self.MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE}). "
-                        f"Inferring schema from an incomplete set of records."
-                    )
-                    break
+    def _decode_records(self, file: RemoteFile, fp: Any, logger: logging.Logger, max_bytes: Optional[int] = None) -> Iterator[Any]:
+        """
+        Yield the records of the file. Each line is decoded as a record until a line is not valid json, in which case the rest of the file
+        is decoded as a sequence of json documents which can span multiple lines.
+
+        Once at least one record is yielded, the file is not read beyond `max_bytes`.
+        """
+        read_bytes = 0
+        lines = self._read_lines(fp)
+        yielded_at_least_once = False
+        for line in lines:
+            read_bytes += len(line) + 1
+            try:
+                record = _loads(line)
+            except json.JSONDecodeError:
+                if not line.strip():
+                    continue
+                yield from self._decode_multiline_records(
+                    file, itertools.chain([line], lines), read_bytes - len(line) - 1, logger, max_bytes, yielded_at_least_once
+                )
+                return
+            yield record
+            yielded_at_least_once = True
+            if self._read_limit_reached(read_bytes, max_bytes, logger):
+                return
+
+    def _read_lines(self, fp: Any) -> Iterator[Any]:
+        """
+        Read the file by blocks and yield its lines without their line feed
+        """
+        # The beginning of the line continuing in the next blocks, kept as parts so that long lines are not copied for every block
+        pending: List[Any] = []
+        while True:
+            block = fp.read(self.BLOCK_SIZE)
+            if not block:
+                break
+            line_feed = b"\n" if isinstance(block, bytes) else "\n"
+            if line_feed not in block:
+                pending.append(block)
+                continue
+            lines = block.split(line_feed)
+            if pending:
+                lines[0] = block[:0].join(pending + [lines[0]])
+            pending = [lines.pop()]
+            yield from lines
+        last_line = pending[0][:0].join(pending) if pending else None
+        if last_line:
+            yield last_line
 
-            if had_json_parsing_error and not yielded_at_least_once:
-                raise RecordParseError(FileBasedSourceError.ERROR_PARSING_RECORD)
+    @classmethod
+    def _decode_multiline_records(
+        cls,
+        file: RemoteFile,
+        lines: Iterator[Any],
+        read_bytes: int,
+        logger: logging.Logger,
+        max_bytes: Optional[int],
+        yielded_at_least_once: bool,
+    ) -> Iterator[Any]:
+        """
+        Decode the json documents of the lines, which can span multiple lines or share a line
+        """
+        has_warned_for_multiline_json_object = False
+        buffer = ""
+        position = 0
+        exhausted = False
+
+        def read_line() -> bool:
+            nonlocal buffer, position, read_bytes, exhausted
+            line = next(lines, None)
+            if line is None:
+                exhausted = True
+                return False
+            read_bytes += len(line) + 1
+            # Lines are split on line feeds, which cannot be part of a multibyte character
+            buffer = buffer[position:] + (line.decode("utf8") if isinstance(line, bytes) else line) + "\n"
+            position = 0
+            return True
+
+        def can_read_line() -> bool:
+            # An invalid line would otherwise buffer the rest of the file while looking for the end of the document
+            return not yielded_at_least_once or max_bytes is None or read_bytes < max_bytes
+
+        while True:
+            position = _WHITESPACE.match(buffer, position).end()  # type: ignore  # the pattern matches empty strings
+            if position == len(buffer):
+                if not read_line():
+                    return
+                continue
+            try:
+                record, position = _DECODER.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if exhausted:
+                    raise
+                if not can_read_line():
+                    cls._read_limit_reached(read_bytes, max_bytes, logger)
+                    return
+                # The document is incomplete. Grow the buffer by at least what is already buffered so that long documents are not decoded
+                # again for every line
+                unread_size = len(buffer) - position
+                while len(buffer) - position < 2 * unread_size and can_read_line() and read_line():
+                    pass
+                continue
+            if not has_warned_for_multiline_json_object:
+                logger.warning(f"File at {file.uri} is using multiline JSON. Performance could be greatly reduced")
+                has_warned_for_multiline_json_object = True
+            yield record
+            yielded_at_least_once = True
+            if cls._read_limit_reached(read_bytes, max_bytes, logger):
+                return
 
     @staticmethod
-    def _instantiate_accumulator(line: Union[bytes, str]) -> Union[bytes, str]:
-        if isinstance(line, bytes):
-            return bytes("", json.detect_encoding(line))
-        elif isinstance(line, str):
-            return ""
+    def _read_limit_reached(read_bytes: int, max_bytes: Optional[int], logger: logging.Logger) -> bool:
+        if max_bytes is None or read_bytes < max_bytes:
+            return False
+        logger.warning(
+            f"Exceeded the maximum number of bytes per file for schema inference ({max_bytes}). "
+            f"Inferring schema from an incomplete set of records."
+        )
+        return True
+
+
+def _loads(line: Union[bytes, str]) -> Any:
+    try:
+        return orjson.loads(line)
+    except orjson.JSONDecodeError:
+        # orjson does not support everything the json module does, e.g. NaN or integers which do not fit in 64 bits
+        return json.loads(line)
@@ -2,10 +2,9 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-import json
 import logging
 import os
-from typing import Any, Dict, Iterable, List, Mapping, Optional
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Set, Union
 from urllib.parse import unquote
 
 import pyarrow as pa
@@ -14,6 +13,7 @@ from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileB
 from airbyte_cdk.sources.file_based.exceptions import ConfigValidationError, FileBasedSourceError
 from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader, FileReadMode
 from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser
+from airbyte_cdk.sources.file_based.range_reader import ByteRange, RangeReader
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.sources.file_based.schema_helpers import SchemaType
 from pyarrow import Scalar
@@ -22,6 +22,8 @@ from pyarrow import Scalar
 class ParquetParser(FileTypeParser):
 
     ENCODING = None
+    # Fetching the end of the file in one go usually gets the whole footer
+    FOOTER_PREFETCH_SIZE = 64 * 1024
 
     async def infer_schema(
         self,
@@ -35,7 +37,7 @@ class ParquetParser(FileTypeParser):
             raise ValueError(f"Expected ParquetFormat, got {parquet_format}")
 
         with stream_reader.open_file(file, self.file_read_mode, self.ENCODING, logger) as fp:
-            parquet_file = pq.ParquetFile(fp)
+            parquet_file = pq.ParquetFile(self._open_range_reader(fp))
             parquet_schema = parquet_file.schema_arrow
 
         # Inferred non-partition schema
@@ -59,18 +61,60 @@ class ParquetParser(FileTypeParser):
             logger.info(f"Expected ParquetFormat, got {parquet_format}")
             raise ConfigValidationError(FileBasedSourceError.CONFIG_VALIDATION_ERROR)
         with stream_reader.open_file(file, self.file_read_mode, self.ENCODING, logger) as fp:
-            reader = pq.ParquetFile(fp)
+            range_reader = self._open_range_reader(fp)
+            reader = pq.ParquetFile(range_reader)
             partition_columns = {x.split("=")[0]: x.split("=")[1] for x in self._extract_partitions(file.uri)}
+            selected_columns = self._get_selected_columns(config, reader.schema_arrow.names, discovered_schema)
             for row_group in range(reader.num_row_groups):
-                batch = reader.read_row_group(row_group)
-                for row in range(batch.num_rows):
-                    yield {
-                        **{
-                            column: ParquetParser._to_output_value(batch.column(column)[row], parquet_format)
-                            for column in batch.column_names
-                        },
-                        **partition_columns,
-                    }
+                # Fetch the column chunks of the row group at once instead of with a request per column
+                range_reader.prefetch(self._get_column_chunk_ranges(reader.metadata.row_group(row_group), selected_columns))
+                for batch in reader.iter_batches(batch_size=parquet_format.batch_size, row_groups=[row_group], columns=selected_columns):
+                    columns = [ParquetParser._to_output_values(column, parquet_format) for column in batch.columns]
+                    rows = zip(*columns) if columns else ((),) * batch.num_rows
+                    for row in rows:
+                        record = dict(zip(batch.schema.names, row))
+                        record.update(partition_columns)
+                        yield record
+                range_reader.release()
+
+    @classmethod
+    def _open_range_reader(cls, fp: Any) -> RangeReader:
+        range_reader = RangeReader(fp)
+        range_reader.prefetch([(range_reader.size - cls.FOOTER_PREFETCH_SIZE, range_reader.size)])
+        return range_reader
+
+    def _get_selected_columns(
+        self, config: FileBasedStreamConfig, file_columns: List[str], discovered_schema: Optional[Mapping[str, SchemaType]]
+    ) -> Optional[List[str]]:
+        """
+        :return: the columns of the file which are in the schema of the configured catalog, or None if all the columns have to be read.
+        """
+        schema_columns = self.get_selected_columns(config, discovered_schema)
+        if schema_columns is None:
+            return None
+        selected_columns = [column for column in file_columns if column in schema_columns]
+        return selected_columns if len(selected_columns) < len(file_columns) else None
+
+    @staticmethod
+    def _get_column_chunk_ranges(row_group: pq.RowGroupMetaData, selected_columns: Optional[List[str]]) -> List[ByteRange]:
+        selected = set(selected_columns) if selected_columns is not None else None
+        ranges = []
+        for index in range(row_group.num_columns):
+            column_chunk = row_group.column(index)
+            if selected is not None and not ParquetParser._is_leaf_of_selected_column(column_chunk.path_in_schema, selected):
+                continue
+            start = column_chunk.data_page_offset
+            if column_chunk.has_dictionary_page and column_chunk.dictionary_page_offset:
+                start = min(start, column_chunk.dictionary_page_offset)
+            ranges.append((start, start + column_chunk.total_compressed_size))
+        return ranges
+
+    @staticmethod
+    def _is_leaf_of_selected_column(path_in_schema: str, selected_columns: Set[str]) -> bool:
+        # Nested columns are stored as one column chunk per leaf field, e.g. "a.b" for field "b" of column "a". As column names can contain
+        # dots too, every prefix of the path is a candidate column name
+        parts = path_in_schema.split(".")
+        return any(".".join(parts[:length]) in selected_columns for length in range(1, len(parts) + 1))
 
     @staticmethod
     def _extract_partitions(filepath: str) -> List[str]:
@@ -81,27 +125,28 @@ class ParquetParser(FileTypeParser):
         return FileReadMode.READ_BINARY
 
     @staticmethod
-    def _to_output_value(parquet_value: Scalar, parquet_format: ParquetFormat) -> Any:
+    def _to_output_values(parquet_column: pa.Array, parquet_format: ParquetFormat) -> List[Any]:
         """
-        Convert a pyarrow scalar to a value that can be output by the source.
-        """
-        # Convert date and datetime objects to isoformat strings
-        if pa.types.is_time(parquet_value.type) or pa.types.is_timestamp(parquet_value.type) or pa.types.is_date(parquet_value.type):
-            return parquet_value.as_py().isoformat()
-
-        # Convert month_day_nano_interval to array
-        if parquet_value.type == pa.month_day_nano_interval():
-            return json.loads(json.dumps(parquet_value.as_py()))
+        Convert a whole pyarrow column to values that can be output by the source. Null values are output as None.
 
-        # Decode binary strings to utf-8
-        if ParquetParser._is_binary(parquet_value.type):
-            return parquet_value.as_py().decode("utf-8")
-        if pa.types.is_decimal(parquet_value.type):
-            if parquet_format.decimal_as_float:
-                return parquet_value.as_py()
-            else:
-                return str(parquet_value.as_py())
+        Converting the column at once is much faster than converting each pyarrow scalar as only the Python values are created.
+        """
+        if pa.types.is_dictionary(parquet_column.type):
+            dictionary_values = parquet_column.dictionary.to_pylist()
+            return [
+                None if index is None else {"indices": [index], "values": dictionary_values} for index in parquet_column.indices.to_pylist()
+            ]
+        values: List[Any] = parquet_column.to_pylist()
+        converter = ParquetParser._get_value_converter(parquet_column.type, parquet_format)
+        if converter is None:
+            return values
+        return [None if value is None else converter(value) for value in values]
 
+    @staticmethod
+    def _to_output_value(parquet_value: Union[Scalar, pa.DictionaryArray], parquet_format: ParquetFormat) -> Any:
+        """
+        Convert a pyarrow scalar to a value that can be output by the source.
+        """
         # Dictionaries are stored as two columns: indices and values
         # The indices column is an array of integers that maps to the values column
         if pa.types.is_dictionary(parquet_value.type):
@@ -109,28 +154,48 @@ class ParquetParser(FileTypeParser):
                 "indices": parquet_value.indices.tolist(),
                 "values": parquet_value.dictionary.tolist(),
             }
-        if pa.types.is_map(parquet_value.type):
-            return {k: v for k, v in parquet_value.as_py()}
+        value = parquet_value.as_py()
+        converter = ParquetParser._get_value_converter(parquet_value.type, parquet_format)
+        if value is None or converter is None:
+            return value
+        return converter(value)
 
-        if pa.types.is_null(parquet_value.type):
-            return None
+    @staticmethod
+    def _get_value_converter(parquet_type: pa.DataType, parquet_format: ParquetFormat) -> Optional[Callable[[Any], Any]]:
+        """
+        :return: the function converting the Python value of a pyarrow value of this type to a value that can be output by the source, or
+          None if the Python value can be output as is
+        """
+        # Convert date and datetime objects to isoformat strings
+        if pa.types.is_time(parquet_type) or pa.types.is_timestamp(parquet_type) or pa.types.is_date(parquet_type):
+            return lambda value: value.isoformat()
+
+        # Convert month_day_nano_interval to array
+        if parquet_type == pa.month_day_nano_interval():
+            return list
+
+        # Decode binary strings to utf-8
+        if ParquetParser._is_binary(parquet_type):
+            return lambda value: value.decode("utf-8")
+        if pa.types.is_decimal(parquet_type):
+            return None if parquet_format.decimal_as_float else str
+
+        if pa.types.is_map(parquet_type):
+            return dict
 
         # Convert duration to seconds, then convert to the appropriate unit
-        if pa.types.is_duration(parquet_value.type):
-            duration = parquet_value.as_py()
-            duration_seconds = duration.total_seconds()
-            if parquet_value.type.unit == "s":
-                return duration_seconds
-            elif parquet_value.type.unit == "ms":
-                return duration_seconds * 1000
-            elif parquet_value.type.unit == "us":
-                return duration_seconds * 1_000_000
-            elif parquet_value.type.unit == "ns":
-                return duration_seconds * 1_000_000_000 + duration.nanoseconds
+        if pa.types.is_duration(parquet_type):
+            if parquet_type.unit == "s":
+                return lambda duration: duration.total_seconds()
+            elif parquet_type.unit == "ms":
+                return lambda duration: duration.total_seconds() * 1000
+            elif parquet_type.unit == "us":
+                return lambda duration: duration.total_seconds() * 1_000_000
+            elif parquet_type.unit == "ns":
+                return lambda duration: duration.total_seconds() * 1_000_000_000 + duration.nanoseconds
             else:
-                raise ValueError(f"Unknown duration unit: {parquet_value.type.unit}")
-        else:
-            return parquet_value.as_py()
+                raise ValueError(f"Unknown duration unit: {parquet_type.unit}")
+        return None
 
     @staticmethod
     def parquet_type_to_schema_type(parquet_type: pa.DataType, parquet_format: ParquetFormat) -> Mapping[str, str]:
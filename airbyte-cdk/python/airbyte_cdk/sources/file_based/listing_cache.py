@@ -0,0 +1,120 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+
+_MANIFEST_VERSION = 1
+
+
+class ListingCache:
+    """
+    Cache of the files listed by a stream reader, shared by the streams of a source.
+
+    Listings are keyed by the stream reader, its configuration (without the streams) and the globs and prefix of the stream, so streams
+    with the same globs only list the files once. When `directory` is set, listings are also written to a manifest file in that directory so
+    that the next runs of the source (e.g. a read following a discover) reuse them.
+
+    File stores cannot list the files which changed since a given time, so a listing is reused as long as it is not older than `max_age`
+    and the files are listed again afterwards. Changing the configuration, including its start date, changes the key of the listing. Files
+    added after a listing are picked up by the first sync listing the files again: the cursor syncs every file which is not in its history.
+    """
+
+    DEFAULT_MAX_AGE = timedelta(minutes=10)
+
+    def __init__(self, directory: Optional[str] = None, max_age: timedelta = DEFAULT_MAX_AGE):
+        self._directory = directory
+        self._max_age = max_age
+        self._listings: Dict[str, Tuple[datetime, List[RemoteFile]]] = {}
+        self._locks: Dict[str, Lock] = {}
+        self._locks_lock = Lock()
+
+    def get_matching_files(
+        self, stream_reader: AbstractFileBasedStreamReader, globs: List[str], prefix: Optional[str], logger: logging.Logger
+    ) -> List[RemoteFile]:
+        key = self._get_key(stream_reader, globs, prefix)
+        with self._lock_for(key):
+            listing = self._listings.get(key) or self._read_manifest(key, logger)
+            if listing is None or not self._is_fresh(listing[0]):
+                listed_at = datetime.utcnow()
+                files = list(stream_reader.get_matching_files(globs, prefix, logger))
+                listing = (listed_at, files)
+                self._write_manifest(key, listing, logger)
+            else:
+                logger.info(f"Reusing the {len(listing[1])} files listed at {listing[0]} for globs {globs}.")
+            self._listings[key] = listing
+            return list(listing[1])
+
+    def _lock_for(self, key: str) -> Lock:
+        # Streams with different globs list their files concurrently, streams with the same globs wait for the first one
+        with self._locks_lock:
+            return self._locks.setdefault(key, Lock())
+
+    def _is_fresh(self, listed_at: datetime) -> bool:
+        return datetime.utcnow() - listed_at <= self._max_age
+
+    @staticmethod
+    def _get_key(stream_reader: AbstractFileBasedStreamReader, globs: List[str], prefix: Optional[str]) -> str:
+        config = stream_reader.config.dict(exclude={"streams"}) if stream_reader.config else None
+        identity = {
+            "reader": f"{type(stream_reader).__module__}.{type(stream_reader).__qualname__}",
+            "config": config,
+            "globs": sorted(set(globs)),
+            "prefix": prefix,
+        }
+        # The key is hashed so that the secrets of the configuration are not written to disk
+        return hashlib.sha256(json.dumps(identity, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def _manifest_path(self, key: str) -> Optional[str]:
+        return os.path.join(self._directory, f"listing_{key}.json.gz") if self._directory else None
+
+    def _read_manifest(self, key: str, logger: logging.Logger) -> Optional[Tuple[datetime, List[RemoteFile]]]:
+        path = self._manifest_path(key)
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as manifest_file:
+                manifest: Dict[str, Any] = json.load(manifest_file)
+            if manifest.get("version") != _MANIFEST_VERSION:
+                return None
+            files = [RemoteFile(uri=uri, last_modified=datetime.fromisoformat(last_modified)) for uri, last_modified in manifest["files"]]
+            return datetime.fromisoformat(manifest["listed_at"]), files
+        except Exception as exc:
+            logger.warning(f"Ignoring the listing manifest {path} which could not be read: {exc}")
+            return None
+
+    def _write_manifest(self, key: str, listing: Tuple[datetime, List[RemoteFile]], logger: logging.Logger) -> None:
+        path = self._manifest_path(key)
+        if not path:
+            return
+        listed_at, files = listing
+        manifest = {
+            "version": _MANIFEST_VERSION,
+            "listed_at": listed_at.isoformat(),
+            "files": [[file.uri, file.last_modified.isoformat()] for file in files],
+        }
+        try:
+            os.makedirs(self._directory, exist_ok=True)  # type: ignore  # the directory is set if there is a path
+            # Write to a temporary file first so that a concurrent run never reads a partial manifest
+            descriptor, temporary_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+            os.close(descriptor)
+            try:
+                with gzip.open(temporary_path, "wt", encoding="utf-8") as manifest_file:
+                    json.dump(manifest, manifest_file, separators=(",", ":"))
+                os.replace(temporary_path, path)
+            finally:
+                if os.path.exists(temporary_path):
+                    os.remove(temporary_path)
+        except OSError as exc:
+            logger.warning(f"The listing manifest {path} could not be written: {exc}")
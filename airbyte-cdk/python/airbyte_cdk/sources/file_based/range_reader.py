@@ -0,0 +1,159 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import bisect
+import io
+from typing import IO, Iterable, List, Optional, Tuple
+
+ByteRange = Tuple[int, int]
+
+
+class RangeReader(io.RawIOBase):
+    """
+    Read-only file reading a seekable binary file by ranges, for formats like Parquet which read a file out of order.
+
+    Over object storage, every seek of the file handle returned by a stream reader usually becomes a new request. The parsers know ahead of
+    time which ranges of the file they are going to read, e.g. the footer and the column chunks of a row group, so they prefetch them:
+    ranges which are close to each other are merged and fetched with a single seek and read of the wrapped file. Reads outside of the
+    prefetched ranges fetch at least `read_ahead` bytes. Fetched bytes are kept until they are released.
+    """
+
+    DEFAULT_READ_AHEAD = 1024 * 1024
+    # Reading a few unneeded bytes is much cheaper than a new request
+    DEFAULT_MAX_HOLE_SIZE = 1024 * 1024
+
+    def __init__(self, file: IO[bytes], read_ahead: int = DEFAULT_READ_AHEAD, max_hole_size: int = DEFAULT_MAX_HOLE_SIZE):
+        super().__init__()
+        self._file = file
+        self._read_ahead = read_ahead
+        self._max_hole_size = max_hole_size
+        self._position = 0
+        self._size: Optional[int] = None
+        # Sorted and non-overlapping (start, bytes) blocks of the file
+        self._block_starts: List[int] = []
+        self._blocks: List[bytes] = []
+        self.n_fetches = 0
+
+    @property
+    def size(self) -> int:
+        if self._size is None:
+            self._size = self._file.seek(0, io.SEEK_END)
+        return self._size
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence {whence}")
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+        self._position = position
+        return position
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        end = self.size if size is None or size < 0 else min(self.size, self._position + size)
+        if end <= self._position:
+            return b""
+        data = self._read_range(self._position, end)
+        self._position = end
+        return data
+
+    def readall(self) -> bytes:
+        return self.read(-1)
+
+    def readinto(self, buffer: bytearray) -> int:  # type: ignore  # RawIOBase accepts any writable buffer
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def prefetch(self, ranges: Iterable[ByteRange]) -> None:
+        """
+        Fetch the (start, end) ranges of the file which are not fetched yet, merging the ranges separated by less than `max_hole_size` bytes
+        """
+        merged: List[List[int]] = []
+        for start, end in sorted(ranges):
+            start, end = max(0, start), min(self.size, end)
+            if start >= end:
+                continue
+            if merged and start - merged[-1][1] <= self._max_hole_size:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        for start, end in merged:
+            for missing_start, missing_end in self._missing_ranges(start, end):
+                self._fetch(missing_start, missing_end)
+
+    def release(self) -> None:
+        """
+        Drop the fetched bytes, e.g. once a row group has been read
+        """
+        self._block_starts = []
+        self._blocks = []
+
+    def close(self) -> None:
+        self.release()
+        super().close()
+
+    def _read_range(self, start: int, end: int) -> bytes:
+        chunks = []
+        position = start
+        while position < end:
+            index = bisect.bisect_right(self._block_starts, position) - 1
+            if index >= 0 and position < self._block_starts[index] + len(self._blocks[index]):
+                block_start, block = self._block_starts[index], self._blocks[index]
+                chunk_end = min(end, block_start + len(block))
+                chunks.append(block[position - block_start : chunk_end - block_start])
+                position = chunk_end
+                continue
+            # Fetch up to the next fetched block, at least `read_ahead` bytes if the file goes on
+            next_block_start = self._block_starts[index + 1] if index + 1 < len(self._block_starts) else self.size
+            self._fetch(position, min(next_block_start, max(end, position + self._read_ahead), self.size))
+        return b"".join(chunks)
+
+    def _missing_ranges(self, start: int, end: int) -> List[ByteRange]:
+        missing = []
+        position = start
+        index = max(0, bisect.bisect_right(self._block_starts, start) - 1)
+        while position < end and index < len(self._block_starts):
+            block_start, block_end = self._block_starts[index], self._block_starts[index] + len(self._blocks[index])
+            if block_end <= position:
+                index += 1
+                continue
+            if block_start > position:
+                missing.append((position, min(block_start, end)))
+            position = max(position, block_end)
+            index += 1
+        if position < end:
+            missing.append((position, end))
+        return missing
+
+    def _fetch(self, start: int, end: int) -> None:
+        self._file.seek(start)
+        chunks = []
+        n_bytes = 0
+        while n_bytes < end - start:
+            # Like raw files, some file handles return less bytes than requested
+            chunk = self._file.read(end - start - n_bytes)
+            if not chunk:
+                raise IOError(f"Expected {end - start} bytes at offset {start} but read {n_bytes} bytes")
+            chunks.append(chunk)
+            n_bytes += len(chunk)
+        data = chunks[0] if len(chunks) == 1 else b"".join(chunks)
+        self.n_fetches += 1
+        index = bisect.bisect_left(self._block_starts, start)
+        self._block_starts.insert(index, start)
+        self._blocks.insert(index, data)
@@ -0,0 +1,53 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import io
+from typing import IO, Optional
+
+
+class RewindableFile(io.RawIOBase):
+    """
+    Read-only file recording the bytes read from the wrapped file until it is rewound, so that the beginning of a file, e.g. its header, can
+    be read a second time without seeking the wrapped file, which would usually cost another request to the file store.
+    """
+
+    def __init__(self, file: IO[bytes]):
+        super().__init__()
+        self._file = file
+        self._recorded = bytearray()
+        self._recording = True
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def rewind(self) -> None:
+        self._recording = False
+        self._position = 0
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        size = -1 if size is None else size
+        if self._recording:
+            data = self._file.read(size)
+            self._recorded += data
+            return data
+        if not self._recorded:
+            return self._file.read(size)
+        end = len(self._recorded) if size < 0 else min(len(self._recorded), self._position + size)
+        data = bytes(self._recorded[self._position : end])
+        self._position = end
+        if self._position == len(self._recorded):
+            # The recorded bytes were all read again
+            self._recorded = bytearray()
+            self._position = 0
+        if size < 0:
+            data += self._file.read()
+        elif len(data) < size:
+            data += self._file.read(size - len(data))
+        return data
+
+    def readinto(self, buffer: bytearray) -> int:  # type: ignore  # RawIOBase accepts any writable buffer
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
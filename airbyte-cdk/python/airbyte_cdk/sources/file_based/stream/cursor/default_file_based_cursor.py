@@ -2,9 +2,10 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import heapq
 import logging
 from datetime import datetime, timedelta
-from typing import Any, Iterable, MutableMapping, Optional
+from typing import Any, Dict, Iterable, List, MutableMapping, Optional, Tuple
 
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
@@ -16,11 +17,20 @@ class DefaultFileBasedCursor(AbstractFileBasedCursor):
     DEFAULT_DAYS_TO_SYNC_IF_HISTORY_IS_FULL = 3
     DEFAULT_MAX_HISTORY_SIZE = 10_000
     DATE_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+    _DATE_TIME_LENGTH = len("YYYY-MM-DDTHH:MM:SS.ffffffZ")
     CURSOR_FIELD = "_ab_source_file_last_modified"
 
     def __init__(self, stream_config: FileBasedStreamConfig, **_: Any):
         super().__init__(stream_config)
         self._file_to_datetime_history: MutableMapping[str, str] = {}
+        # Index of the history to avoid scanning it whenever a file is added or the cursor is read:
+        # * a heap of the (last modified, uri) entries, to evict the earliest file. Entries of files that were updated or evicted since they
+        #   were pushed are skipped when they reach the top of the heap
+        # * the latest (last modified, uri) entry, which is the cursor
+        # * the parsed last modified datetimes of the files
+        self._history_heap: List[Tuple[str, str]] = []
+        self._latest_file_in_history: Optional[Tuple[str, str]] = None
+        self._history_datetimes: Dict[str, datetime] = {}
         self._time_window_if_history_is_full = timedelta(
             days=stream_config.days_to_sync_if_history_is_full or self.DEFAULT_DAYS_TO_SYNC_IF_HISTORY_IS_FULL
         )
@@ -33,16 +43,26 @@ class DefaultFileBasedCursor(AbstractFileBasedCursor):
 
     def set_initial_state(self, value: StreamState) -> None:
         self._file_to_datetime_history = value.get("history", {})
+        self._build_history_heap()
+        self._latest_file_in_history = None
+        self._history_datetimes = {}
         self._start_time = self._compute_start_time()
         self._initial_earliest_file_in_history = self._compute_earliest_file_in_history()
 
     def add_file(self, file: RemoteFile) -> None:
-        self._file_to_datetime_history[file.uri] = file.last_modified.strftime(self.DATE_TIME_FORMAT)
+        timestamp = file.last_modified.strftime(self.DATE_TIME_FORMAT)
+        self._file_to_datetime_history[file.uri] = timestamp
+        self._history_datetimes.pop(file.uri, None)
+        self._push_to_history_index(file.uri, timestamp)
         if len(self._file_to_datetime_history) > self.DEFAULT_MAX_HISTORY_SIZE:
             # Get the earliest file based on its last modified date and its uri
             oldest_file = self._compute_earliest_file_in_history()
             if oldest_file:
                 del self._file_to_datetime_history[oldest_file.uri]
+                self._history_datetimes.pop(oldest_file.uri, None)
+                heapq.heappop(self._history_heap)
+                if self._latest_file_in_history and self._latest_file_in_history[1] == oldest_file.uri:
+                    self._latest_file_in_history = None
             else:
                 raise Exception(
                     "The history is full but there is no files in the history. This should never happen and might be indicative of a bug in the CDK."
@@ -59,8 +79,11 @@ class DefaultFileBasedCursor(AbstractFileBasedCursor):
         Files are synced in order of last-modified with secondary sort on filename, so the cursor value is
         a string joining the last-modified timestamp of the last synced file and the name of the file.
         """
-        if self._file_to_datetime_history.items():
+        if self._latest_file_in_history is None and self._file_to_datetime_history:
             filename, timestamp = max(self._file_to_datetime_history.items(), key=lambda x: (x[1], x[0]))
+            self._latest_file_in_history = (timestamp, filename)
+        if self._latest_file_in_history:
+            timestamp, filename = self._latest_file_in_history
             return f"{timestamp}_{filename}"
         return None
 
@@ -73,7 +96,7 @@ class DefaultFileBasedCursor(AbstractFileBasedCursor):
     def _should_sync_file(self, file: RemoteFile, logger: logging.Logger) -> bool:
         if file.uri in self._file_to_datetime_history:
             # If the file's uri is in the history, we should sync the file if it has been modified since it was synced
-            updated_at_from_history = datetime.strptime(self._file_to_datetime_history[file.uri], self.DATE_TIME_FORMAT)
+            updated_at_from_history = self._get_datetime_from_history(file.uri)
             if file.last_modified < updated_at_from_history:
                 logger.warning(
                     f"The file {file.uri}'s last modified date is older than the last time it was synced. This is unexpected. Skipping the file."
@@ -114,11 +137,43 @@ class DefaultFileBasedCursor(AbstractFileBasedCursor):
         return self._start_time
 
     def _compute_earliest_file_in_history(self) -> Optional[RemoteFile]:
-        if self._file_to_datetime_history:
-            filename, last_modified = min(self._file_to_datetime_history.items(), key=lambda f: (f[1], f[0]))
-            return RemoteFile(uri=filename, last_modified=datetime.strptime(last_modified, self.DATE_TIME_FORMAT))
+        while self._history_heap:
+            last_modified, filename = self._history_heap[0]
+            if self._file_to_datetime_history.get(filename) == last_modified:
+                return RemoteFile(uri=filename, last_modified=self._get_datetime_from_history(filename))
+            # The file was updated or evicted since this entry was pushed
+            heapq.heappop(self._history_heap)
+        return None
+
+    def _build_history_heap(self) -> None:
+        self._history_heap = [(last_modified, filename) for filename, last_modified in self._file_to_datetime_history.items()]
+        heapq.heapify(self._history_heap)
+
+    def _push_to_history_index(self, filename: str, last_modified: str) -> None:
+        if len(self._history_heap) > 2 * len(self._file_to_datetime_history):
+            # Too many entries of files that were updated are left in the heap
+            self._build_history_heap()
         else:
-            return None
+            heapq.heappush(self._history_heap, (last_modified, filename))
+
+        entry = (last_modified, filename)
+        if self._latest_file_in_history is None:
+            return
+        if self._latest_file_in_history[1] == filename and entry < self._latest_file_in_history:
+            # The latest file moved back in time: the cursor is computed again from the history the next time it is needed
+            self._latest_file_in_history = None
+        elif entry > self._latest_file_in_history:
+            self._latest_file_in_history = entry
+
+    def _get_datetime_from_history(self, filename: str) -> datetime:
+        if filename not in self._history_datetimes:
+            last_modified = self._file_to_datetime_history[filename]
+            if len(last_modified) == self._DATE_TIME_LENGTH and last_modified.endswith("Z"):
+                # Much faster than strptime for the timestamps formatted with DATE_TIME_FORMAT
+                self._history_datetimes[filename] = datetime.fromisoformat(last_modified[:-1])
+            else:
+                self._history_datetimes[filename] = datetime.strptime(last_modified, self.DATE_TIME_FORMAT)
+        return self._history_datetimes[filename]
 
     def _compute_start_time(self) -> datetime:
         if not self._file_to_datetime_history:
@@ -6,7 +6,7 @@ import asyncio
 import itertools
 import traceback
 from functools import cache
-from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Set, Union
+from typing import Any, Generator, Iterable, List, Mapping, MutableMapping, Optional, Set, Tuple, Union
 
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, Level
 from airbyte_cdk.models import Type as MessageType
@@ -19,6 +19,8 @@ from airbyte_cdk.sources.file_based.exceptions import (
     SchemaInferenceError,
     StopSyncPerValidationPolicy,
 )
+from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser, Record
+from airbyte_cdk.sources.file_based.listing_cache import ListingCache
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.sources.file_based.schema_helpers import SchemaType, merge_schemas, schemaless_schema
 from airbyte_cdk.sources.file_based.stream import AbstractFileBasedStream
@@ -26,6 +28,7 @@ from airbyte_cdk.sources.file_based.stream.cursor import AbstractFileBasedCursor
 from airbyte_cdk.sources.file_based.types import StreamSlice
 from airbyte_cdk.sources.streams import IncrementalMixin
 from airbyte_cdk.sources.streams.core import JsonSchema
+from airbyte_cdk.sources.utils.concurrent_slice_reader import ConcurrentSliceReader
 from airbyte_cdk.sources.utils.record_helper import stream_data_to_airbyte_message
 
 
@@ -40,9 +43,10 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
     ab_file_name_col = "_ab_source_file_url"
     airbyte_columns = [ab_last_mod_col, ab_file_name_col]
 
-    def __init__(self, cursor: AbstractFileBasedCursor, **kwargs: Any):
+    def __init__(self, cursor: AbstractFileBasedCursor, listing_cache: Optional[ListingCache] = None, **kwargs: Any):
         super().__init__(**kwargs)
         self._cursor = cursor
+        self._listing_cache = listing_cache
 
     @property
     def state(self) -> MutableMapping[str, Any]:
@@ -78,13 +82,41 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
             raise MissingSchemaError(FileBasedSourceError.MISSING_SCHEMA, stream=self.name)
         # The stream only supports a single file type, so we can use the same parser for all files
         parser = self.get_parser(self.config.file_type)
-        for file in stream_slice["files"]:
+        parsed_files = self._parse_files(parser, stream_slice["files"], schema)
+        try:
+            yield from self._read_parsed_files(parsed_files)
+        finally:
+            # Stops parsing the files ahead if the read is interrupted
+            parsed_files.close()
+
+    def _parse_files(
+        self, parser: FileTypeParser, files: List[RemoteFile], schema: Mapping[str, Any]
+    ) -> Generator[Tuple[RemoteFile, Iterable[Record]], None, None]:
+        """
+        Yield a (file, records) tuple for each file, in order. The records of a file must be consumed before moving on to the next file.
+
+        If the discovery policy allows several concurrent file reads, the next files are opened and parsed in the background while the
+        records of the current file are consumed.
+        """
+
+        def parse_file(file: RemoteFile) -> Iterable[Record]:
+            yield from parser.parse_records(self.config, file, self._stream_reader, self.logger, schema)
+
+        n_concurrent_file_reads = self._discovery_policy.n_concurrent_file_reads
+        if n_concurrent_file_reads > 1 and len(files) > 1:
+            yield from ConcurrentSliceReader(n_concurrent_file_reads).read_ordered(files, parse_file)
+        else:
+            for file in files:
+                yield file, parse_file(file)
+
+    def _read_parsed_files(self, parsed_files: Iterable[Tuple[RemoteFile, Iterable[Record]]]) -> Iterable[AirbyteMessage]:
+        for file, records in parsed_files:
             # only serialize the datetime once
             file_datetime_string = file.last_modified.strftime(self.DATE_TIME_FORMAT)
             n_skipped = line_no = 0
 
             try:
-                for record in parser.parse_records(self.config, file, self._stream_reader, self.logger, schema):
+                for record in records:
                     line_no += 1
                     if self.config.schemaless:
                         record = {"data": record}
@@ -198,7 +230,12 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
         List all files that belong to the stream as defined by the stream's globs.
         The output of this method is cached so we don't need to list the files more than once.
         This means we won't pick up changes to the files during a sync.
+        With a listing cache, the files listed for other streams with the same globs, or by a recent run, are reused.
         """
+        if self._listing_cache:
+            return self._listing_cache.get_matching_files(
+                self._stream_reader, self.config.globs or [], self.config.legacy_prefix, self.logger
+            )
         return list(self._stream_reader.get_matching_files(self.config.globs or [], self.config.legacy_prefix, self.logger))
 
     def infer_schema(self, files: List[RemoteFile]) -> Mapping[str, Any]:
@@ -235,6 +235,27 @@ class Stream(ABC):
         """
         return None
 
+    @property
+    def slice_concurrency_limit(self) -> int:
+        """
+        Maximum number of slices read concurrently. With the default value of 1, slices are read one after the other.
+
+        Slices are read on a pool of threads, so streams overriding this should be I/O bound (e.g: HTTP streams) and their read_records method
+        must be safe to call from several threads at once: it should not mutate the stream's state or any other attribute shared between
+        slices. State is still updated and checkpointed on the main thread.
+        """
+        return 1
+
+    @property
+    def emit_slices_in_order(self) -> bool:
+        """
+        When slices are read concurrently, decides whether records are emitted in the order of the slices or as soon as they are read.
+
+        Incremental reads always emit records in the order of the slices so that state checkpoints only advance past slices that have been
+        fully read. Slice log messages are not emitted when records are not emitted in order since records from different slices interleave.
+        """
+        return True
+
     @deprecated(version="0.1.49", reason="You should use explicit state property instead, see IncrementalMixin docs.")
     def get_updated_state(
         self, current_stream_state: MutableMapping[str, Any], latest_record: Mapping[str, Any]
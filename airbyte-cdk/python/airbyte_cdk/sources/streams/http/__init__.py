@@ -5,5 +5,7 @@
 # Initialize Streams Package
 from .exceptions import UserDefinedBackoffException
 from .http import HttpStream, HttpSubStream
+from .rate_limit_policy import RateLimitPolicy
+from .transport import HttpTransportRegistry
 
-__all__ = ["HttpStream", "HttpSubStream", "UserDefinedBackoffException"]
+__all__ = ["HttpStream", "HttpSubStream", "HttpTransportRegistry", "RateLimitPolicy", "UserDefinedBackoffException"]
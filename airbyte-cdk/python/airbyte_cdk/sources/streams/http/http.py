@@ -22,7 +22,9 @@ from requests.auth import AuthBase
 from ...utils.types import JsonType
 from .auth.core import HttpAuthenticator, NoAuth
 from .exceptions import DefaultBackoffException, RequestBodyException, UserDefinedBackoffException
+from .rate_limit_policy import RateLimitPolicy
 from .rate_limiting import default_backoff_handler, user_defined_backoff_handler
+from .transport import HttpTransportRegistry
 
 # list of all possible HTTP methods which can be used for sending of request bodies
 BODY_REQUEST_METHODS = ("GET", "POST", "PUT", "PATCH")
@@ -42,6 +44,14 @@ class HttpStream(Stream, ABC):
             self._session = self.request_cache()
         else:
             self._session = requests.Session()
+        transport_registry = self.transport_registry
+        if transport_registry is not None:
+            transport_registry.mount(self._session, http2=self.use_http2)
+        elif self.use_http2:
+            # The session owns its HTTP/2 adapter, closed with the session
+            adapter = HttpTransportRegistry().create_adapter(http2=True)
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
 
         self._authenticator: HttpAuthenticator = NoAuth()
         if isinstance(authenticator, AuthBase):
@@ -63,6 +73,29 @@ class HttpStream(Stream, ABC):
         """
         return False
 
+    @property
+    def use_http2(self) -> bool:
+        """
+        Override if needed. If True, requests are sent over HTTP/2 when the server supports it. Requires the `http2` extra of the CDK.
+        """
+        return False
+
+    @property
+    def transport_registry(self) -> Optional[HttpTransportRegistry]:
+        """
+        Override if needed. The registry whose connection pools are shared with the streams returning the same registry, e.g.
+        `HttpTransportRegistry.default()`. By default the session of the stream has its own connection pools.
+        """
+        return None
+
+    @property
+    def rate_limit_policy(self) -> Optional[RateLimitPolicy]:
+        """
+        Override if needed. If set, requests are paced from the rate limit headers of the responses instead of only backing off once the API
+        rejects them. Return the same policy from the streams requesting the same API so that they share its rate limit.
+        """
+        return None
+
     def request_cache(self) -> requests.Session:
         self.clear_cache()
         return requests_cache.CachedSession(self.cache_filename)
@@ -331,7 +364,12 @@ class HttpStream(Stream, ABC):
         self.logger.debug(
             "Making outbound API request", extra={"headers": request.headers, "url": request.url, "request_body": request.body}
         )
+        rate_limit_policy = self.rate_limit_policy
+        if rate_limit_policy:
+            rate_limit_policy.wait_before_sending(request)
         response: requests.Response = self._session.send(request, **request_kwargs)
+        if rate_limit_policy:
+            rate_limit_policy.update(response)
 
         # Evaluation of response.text can be heavy, for example, if streaming a large response
         # Do it only in debug mode
@@ -341,6 +379,8 @@ class HttpStream(Stream, ABC):
             )
         if self.should_retry(response):
             custom_backoff_time = self.backoff_time(response)
+            if custom_backoff_time is None and rate_limit_policy:
+                custom_backoff_time = rate_limit_policy.backoff_time(response)
             error_message = self.error_message(response)
             if custom_backoff_time:
                 raise UserDefinedBackoffException(
@@ -0,0 +1,172 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import io
+from threading import Lock
+from typing import Any, Iterator, List, Mapping, Optional, Tuple, Union
+
+import httpx
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from .transport import keep_alive_socket_options
+
+TimeoutType = Union[None, float, Tuple[Optional[float], Optional[float]]]
+
+
+class _HttpxResponseBody(io.RawIOBase):
+    """
+    File-like view of the body of a streamed httpx response, used as the `raw` of the requests response
+    """
+
+    def __init__(self, response: httpx.Response):
+        super().__init__()
+        self._response = response
+        # httpx decodes the content encoding of the body
+        self._chunks: Iterator[bytes] = response.iter_bytes()
+        self._chunk = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._chunk:
+            try:
+                self._chunk = next(self._chunks)
+            except StopIteration:
+                return 0
+            except httpx.TransportError as exception:
+                raise requests.exceptions.ChunkedEncodingError(exception) from exception
+        size = min(len(buffer), len(self._chunk))
+        buffer[:size] = self._chunk[:size]
+        self._chunk = self._chunk[size:]
+        return size
+
+    def close(self) -> None:
+        self._response.close()
+        super().close()
+
+
+class Http2Adapter(BaseAdapter):
+    """
+    Transport adapter sending the requests of a requests session with httpx, over HTTP/2 for the servers negotiating it and over HTTP/1.1
+    otherwise. The responses are streamed and converted to requests responses so that the streams handle them like any other response.
+
+    The TLS verification, client certificates and proxies of the adapter are the ones of the environment: the per-request `verify`, `cert`
+    and `proxies` arguments are not supported. The cookies set by the responses are not added to the cookies of the session.
+    """
+
+    def __init__(self, max_hosts: int, pool_size: int, tcp_keep_alive: bool, shared: bool = False):
+        super().__init__()
+        self.shared = shared
+        self._max_hosts = max_hosts
+        self._tcp_keep_alive = tcp_keep_alive
+        self._lock = Lock()
+        self._pool_size = pool_size
+        self._client: Optional[httpx.Client] = None
+        self._replaced_clients: List[httpx.Client] = []
+
+    @property
+    def client(self) -> httpx.Client:
+        with self._lock:
+            if self._client is None:
+                max_connections = self._max_hosts * self._pool_size
+                transport = httpx.HTTPTransport(
+                    http2=True,
+                    limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+                    socket_options=keep_alive_socket_options() if self._tcp_keep_alive else None,
+                )
+                self._client = httpx.Client(transport=transport, follow_redirects=False)
+            return self._client
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: TimeoutType = None,
+        verify: Union[bool, str] = True,
+        cert: Any = None,
+        proxies: Optional[Mapping[str, str]] = None,
+    ) -> requests.Response:
+        client = self.client
+        httpx_request = client.build_request(
+            method=request.method or "GET",
+            url=request.url or "",
+            headers=self._to_httpx_headers(request.headers),
+            content=self._to_httpx_content(request.body),
+            timeout=self._to_httpx_timeout(timeout),
+        )
+        try:
+            httpx_response = client.send(httpx_request, stream=True)
+        except httpx.ConnectTimeout as exception:
+            raise requests.exceptions.ConnectTimeout(exception, request=request) from exception
+        except httpx.TimeoutException as exception:
+            raise requests.exceptions.ReadTimeout(exception, request=request) from exception
+        except httpx.TransportError as exception:
+            raise requests.exceptions.ConnectionError(exception, request=request) from exception
+
+        response = self.build_response(request, httpx_response)
+        if not stream:
+            # Like requests, read the body before returning unless the response is streamed
+            response.content
+        return response
+
+    def build_response(self, request: requests.PreparedRequest, httpx_response: httpx.Response) -> requests.Response:
+        response = requests.Response()
+        response.status_code = httpx_response.status_code
+        # The body is decoded by httpx so its encoding headers do not apply anymore
+        response.headers = CaseInsensitiveDict(
+            {name: value for name, value in httpx_response.headers.items() if name.lower() != "content-encoding"}
+        )
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.raw = _HttpxResponseBody(httpx_response)
+        response.reason = httpx_response.reason_phrase
+        response.url = str(request.url)
+        response.request = request
+        response.connection = self  # type: ignore  # used by requests to send the request again, e.g. with digest authentication
+        return response
+
+    def resize(self, pool_size: int) -> None:
+        # HTTP/2 multiplexes the requests to a host over one connection, the pool only matters for HTTP/1.1 servers
+        with self._lock:
+            self._pool_size = pool_size
+            if self._client is not None:
+                # The requests being sent keep using the previous client, which is closed with the adapter
+                self._replaced_clients.append(self._client)
+                self._client = None
+
+    def close(self) -> None:
+        # A shared adapter is closed by its registry, not by the sessions it is mounted on
+        if self.shared:
+            return
+        with self._lock:
+            clients = self._replaced_clients + ([self._client] if self._client else [])
+            self._client = None
+            self._replaced_clients = []
+        for client in clients:
+            client.close()
+
+    @staticmethod
+    def _to_httpx_headers(headers: Mapping[str, Union[str, bytes]]) -> List[Tuple[str, str]]:
+        # Like http.client, header values given as bytes are sent as is
+        return [(name, value.decode("latin-1") if isinstance(value, bytes) else value) for name, value in headers.items()]
+
+    @staticmethod
+    def _to_httpx_content(body: Any) -> Union[None, str, bytes, Iterator[bytes]]:
+        if body is None or isinstance(body, (str, bytes)):
+            return body
+        if hasattr(body, "read"):
+            body = body.read()
+            return body.encode("utf-8") if isinstance(body, str) else body
+        # Chunked body
+        return (chunk.encode("utf-8") if isinstance(chunk, str) else chunk for chunk in body)
+
+    @staticmethod
+    def _to_httpx_timeout(timeout: TimeoutType) -> httpx.Timeout:
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return httpx.Timeout(read, connect=connect)
+        return httpx.Timeout(timeout)
@@ -0,0 +1,223 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import logging
+import re
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from typing import Dict, List, Mapping, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+
+logger = logging.getLogger("airbyte")
+
+# Headers of the de facto standard and of the IETF drafts (draft-ietf-httpapi-ratelimit-headers), most specific first
+REMAINING_HEADERS = ["X-RateLimit-Remaining", "X-Rate-Limit-Remaining", "RateLimit-Remaining"]
+RESET_HEADERS = ["X-RateLimit-Reset-After", "X-RateLimit-Reset", "X-Rate-Limit-Reset", "RateLimit-Reset"]
+# Reset headers holding a number of seconds rather than a timestamp
+RESET_AFTER_HEADERS = {"X-RateLimit-Reset-After", "RateLimit-Reset"}
+
+# Epoch timestamps in seconds are larger than any sensible number of seconds before a reset
+_MIN_TIMESTAMP = 1_000_000_000
+_MIN_TIMESTAMP_MS = 1_000_000_000_000
+_PARAMETER = re.compile(r"(?:^|[;,\s])(remaining|reset|r|t)=\s*(\d+(?:\.\d+)?)")
+
+
+@dataclass
+class RateLimitStatus:
+    """
+    The rate limit of an API as reported by the headers of a response
+    """
+
+    remaining: Optional[int] = None
+    reset_in: Optional[float] = None
+    retry_after: Optional[float] = None
+
+    @property
+    def is_known(self) -> bool:
+        return self.remaining is not None or self.retry_after is not None
+
+
+def parse_rate_limit_headers(headers: Mapping[str, str], now: Optional[float] = None) -> RateLimitStatus:
+    """
+    Read the remaining requests, the seconds before they are reset and the seconds to wait before retrying from the `X-RateLimit-*`,
+    `RateLimit-*`, `RateLimit` and `Retry-After` headers. Resets can be a number of seconds or an epoch timestamp in seconds or
+    milliseconds.
+    """
+    now = time.time() if now is None else now
+    status = RateLimitStatus()
+
+    combined = headers.get("RateLimit")
+    if combined:
+        # `limit=100, remaining=50, reset=5` in the earlier drafts, `"policy";r=50;t=5` in the later ones
+        parameters = {name: float(value) for name, value in _PARAMETER.findall(combined)}
+        remaining = parameters.get("remaining", parameters.get("r"))
+        status.remaining = int(remaining) if remaining is not None else None
+        status.reset_in = parameters.get("reset", parameters.get("t"))
+
+    if status.remaining is None:
+        remaining_header = _first_number(headers, REMAINING_HEADERS)
+        status.remaining = int(remaining_header[1]) if remaining_header else None
+    if status.reset_in is None:
+        reset = _first_number(headers, RESET_HEADERS)
+        if reset:
+            name, value = reset
+            status.reset_in = value if name in RESET_AFTER_HEADERS else _seconds_until(value, now)
+
+    retry_after = headers.get("Retry-After")
+    if retry_after:
+        seconds = _to_float(retry_after)
+        if seconds is None:
+            try:
+                seconds = parsedate_to_datetime(retry_after).timestamp() - now
+            except (TypeError, ValueError):
+                seconds = None
+        status.retry_after = max(0.0, seconds) if seconds is not None else None
+    return status
+
+
+def _first_number(headers: Mapping[str, str], names: List[str]) -> Optional[Tuple[str, float]]:
+    for name in names:
+        value = _to_float(headers.get(name))
+        if value is not None:
+            return name, value
+    return None
+
+
+def _to_float(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return float(value.split(",")[0].strip())
+    except ValueError:
+        return None
+
+
+def _seconds_until(reset: float, now: float) -> float:
+    if reset >= _MIN_TIMESTAMP_MS:
+        return max(0.0, reset / 1000 - now)
+    if reset >= _MIN_TIMESTAMP:
+        return max(0.0, reset - now)
+    return reset
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket pacing the requests sent to an API host.
+
+    The bucket does not limit anything until a response reports the rate limit. The requests remaining before the reset are then spread
+    over the time before the reset, with bursts of up to `burst_ratio` of the remaining requests. When no request remains or the server asks
+    to retry later, every request waits for the reset or the retry time.
+    """
+
+    def __init__(self, burst_ratio: float):
+        self._burst_ratio = burst_ratio
+        self._lock = Lock()
+        self._rate: Optional[float] = None
+        self._capacity = 1.0
+        self._tokens = 1.0
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+
+    def acquire(self) -> float:
+        """
+        Take a token and return the number of seconds to wait before sending the request
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            wait = max(0.0, self._blocked_until - now)
+            if self._rate is not None:
+                # Tokens can be borrowed from the future: the requests waiting for them are served in order
+                self._tokens -= 1
+                if self._tokens < 0:
+                    wait = max(wait, -self._tokens / self._rate)
+            return wait
+
+    def update(self, status: RateLimitStatus) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if status.retry_after is not None:
+                self._blocked_until = max(self._blocked_until, now + status.retry_after)
+            if status.remaining is None:
+                return
+            reset_in = max(status.reset_in or 0.0, 0.001)
+            if status.remaining <= 0:
+                self._blocked_until = max(self._blocked_until, now + reset_in)
+                # The rate of the next window is not known until a response reports it
+                self._rate = None
+                return
+            was_paced = self._rate is not None
+            self._rate = status.remaining / reset_in
+            self._capacity = max(1.0, status.remaining * self._burst_ratio)
+            self._tokens = min(self._tokens if was_paced else self._capacity, self._capacity, float(status.remaining))
+
+    def _refill(self, now: float) -> None:
+        if self._rate is not None:
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+
+
+class RateLimitPolicy:
+    """
+    Proactive rate limiting from the rate limit headers of the responses.
+
+    The policy keeps a token bucket per API host, shared by the threads and the streams using the same policy, so streams reading a host
+    concurrently are paced together. Before a request is sent, the policy waits for a token of the host's bucket. The headers of every
+    response then update the bucket: see `parse_rate_limit_headers` for the supported headers and `TokenBucket` for the pacing. APIs
+    with other headers can override `parse_headers`.
+    """
+
+    DEFAULT_BURST_RATIO = 0.1
+
+    def __init__(self, burst_ratio: float = DEFAULT_BURST_RATIO):
+        self._burst_ratio = burst_ratio
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = Lock()
+
+    def parse_headers(self, response: requests.Response) -> RateLimitStatus:
+        return parse_rate_limit_headers(response.headers)
+
+    def wait_before_sending(self, request: requests.PreparedRequest) -> float:
+        """
+        Wait until the request can be sent and return the number of seconds waited
+        """
+        host = _host(request.url)
+        wait = self._bucket_for(host).acquire()
+        if wait > 0:
+            if wait >= 1:
+                logger.info(f"Waiting {wait:.1f} seconds before sending the next request to {host} to stay under its rate limit.")
+            time.sleep(wait)
+        return wait
+
+    def update(self, response: requests.Response) -> RateLimitStatus:
+        status = self.parse_headers(response)
+        if status.is_known:
+            self._bucket_for(_host(response.request.url if response.request else response.url)).update(status)
+        return status
+
+    def backoff_time(self, response: requests.Response) -> Optional[float]:
+        """
+        The seconds to wait before retrying a rejected request, if the response tells
+        """
+        status = self.parse_headers(response)
+        if status.retry_after is not None:
+            return status.retry_after
+        if status.remaining == 0 and status.reset_in is not None:
+            return status.reset_in
+        return None
+
+    def _bucket_for(self, host: str) -> TokenBucket:
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self._burst_ratio)
+            return self._buckets[host]
+
+
+def _host(url: Optional[str]) -> str:
+    return urlparse(url or "").netloc
@@ -0,0 +1,164 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import socket
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3 import PoolManager
+from urllib3.connection import HTTPConnection
+
+SocketOption = Tuple[int, int, int]
+
+
+def keep_alive_socket_options() -> List[SocketOption]:
+    """
+    Socket options enabling TCP keep-alive probes, so that connections idling in a pool are not silently dropped by NATs and load balancers
+    """
+    options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    # Probe after 60 seconds without traffic instead of the two hours default of most systems, where the options exist
+    for name, value in [("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 15), ("TCP_KEEPCNT", 4)]:
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    return options
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose connection pools can grow while it is used and which can enable TCP keep-alive on its connections.
+
+    A shared adapter is mounted on the sessions of several streams: closing one of the sessions does not close it, its registry does.
+    """
+
+    def __init__(self, max_hosts: int, pool_size: int, tcp_keep_alive: bool, shared: bool = False):
+        self._tcp_keep_alive = tcp_keep_alive
+        self.shared = shared
+        super().__init__(pool_connections=max_hosts, pool_maxsize=pool_size)
+
+    def init_poolmanager(self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any) -> None:
+        if self._tcp_keep_alive:
+            pool_kwargs.setdefault("socket_options", HTTPConnection.default_socket_options + keep_alive_socket_options())
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+
+    def resize(self, pool_size: int) -> None:
+        previous_pool_manager = self.poolmanager
+        self.init_poolmanager(self._pool_connections, pool_size, self._pool_block)
+        # The requests being sent keep their connection, which is closed once released
+        self._close_pools(previous_pool_manager)
+
+    def close(self) -> None:
+        if not self.shared:
+            self._close_pools(self.poolmanager)
+            super().close()
+
+    @staticmethod
+    def _close_pools(pool_manager: PoolManager) -> None:
+        # Recent versions of urllib3 do not close the pools dropped by a pool manager, leaving their idle connections open until collected
+        pools = [pool_manager.pools[key] for key in pool_manager.pools.keys()]
+        pool_manager.clear()
+        for pool in pools:
+            pool.close()
+
+
+class HttpTransportRegistry:
+    """
+    Transports shared by the HTTP streams of a source, for the streams opting in with `HttpStream.transport_registry`.
+
+    Each HttpStream has its own session, holding its authentication, headers and cookies, but the sessions of the streams returning the same
+    registry mount its adapters so that the streams share their connection pools: a request reuses a connection to the same host opened by any stream, instead
+    of each stream and each parent of a sub-stream opening its own TCP and TLS connections. The adapters keep up to `max_hosts` pools, of up
+    to `pool_size` connections each. `ensure_pool_size` grows the pools, e.g. to the number of requests which are sent concurrently.
+
+    Streams using HTTP/2 share an adapter sending requests with httpx, which requires the `http2` extra of the CDK. HTTP/2 multiplexes the
+    concurrent requests to a host over a single connection.
+
+    Closing the session of a stream leaves the shared adapters open for the other streams, `close` closes them.
+    """
+
+    DEFAULT_MAX_HOSTS = 16
+    DEFAULT_POOL_SIZE = 10
+
+    _default: Optional["HttpTransportRegistry"] = None
+    _default_lock = Lock()
+
+    def __init__(self, max_hosts: int = DEFAULT_MAX_HOSTS, pool_size: int = DEFAULT_POOL_SIZE, tcp_keep_alive: bool = True):
+        self._max_hosts = max_hosts
+        self._pool_size = pool_size
+        self._tcp_keep_alive = tcp_keep_alive
+        self._adapters: Dict[bool, BaseAdapter] = {}
+        self._lock = Lock()
+
+    @classmethod
+    def default(cls) -> "HttpTransportRegistry":
+        """
+        The registry of the process, for the streams sharing their pools with the streams of any source running in the process
+        """
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    @classmethod
+    def set_default(cls, registry: "HttpTransportRegistry") -> None:
+        """
+        Replace the registry of the process, e.g. to configure its pools. Only the streams created afterwards use the new registry.
+        """
+        with cls._default_lock:
+            cls._default = registry
+
+    @property
+    def pool_size(self) -> int:
+        return self._pool_size
+
+    def mount(self, session: requests.Session, http2: bool = False) -> None:
+        """
+        Send the HTTP and HTTPS requests of the session with the shared adapters
+        """
+        adapter = self.get_adapter(http2)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+    def get_adapter(self, http2: bool = False) -> BaseAdapter:
+        with self._lock:
+            if http2 not in self._adapters:
+                self._adapters[http2] = self._create_adapter(http2, shared=True)
+            return self._adapters[http2]
+
+    def create_adapter(self, http2: bool = False) -> BaseAdapter:
+        """
+        A new adapter configured like the shared ones but owned by a single session, which closes it
+        """
+        return self._create_adapter(http2, shared=False)
+
+    def close(self) -> None:
+        """
+        Close the connections of the shared adapters. The streams using them open new connections if they send more requests.
+        """
+        with self._lock:
+            adapters = list(self._adapters.values())
+            self._adapters = {}
+        for adapter in adapters:
+            adapter.shared = False  # type: ignore  # both adapters can be shared
+            adapter.close()
+
+    def ensure_pool_size(self, pool_size: int) -> None:
+        """
+        Grow the pools to at least `pool_size` connections per host. Pools never shrink.
+        """
+        with self._lock:
+            if pool_size <= self._pool_size:
+                return
+            self._pool_size = pool_size
+            for adapter in self._adapters.values():
+                adapter.resize(pool_size)  # type: ignore  # both adapters can be resized
+
+    def _create_adapter(self, http2: bool, shared: bool) -> BaseAdapter:
+        if http2:
+            # httpx is an optional dependency, only imported by the sources using HTTP/2
+            from airbyte_cdk.sources.streams.http.http2_adapter import Http2Adapter
+
+            return Http2Adapter(max_hosts=self._max_hosts, pool_size=self._pool_size, tcp_keep_alive=self._tcp_keep_alive, shared=shared)
+        return PooledHTTPAdapter(max_hosts=self._max_hosts, pool_size=self._pool_size, tcp_keep_alive=self._tcp_keep_alive, shared=shared)
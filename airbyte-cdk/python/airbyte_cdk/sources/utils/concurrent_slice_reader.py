@@ -0,0 +1,163 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from queue import Empty, Full, Queue
+from threading import Event
+from typing import Any, Callable, Deque, Generic, Iterable, Iterator, Mapping, Optional, Tuple, TypeVar
+
+StreamSlice = Optional[Mapping[str, Any]]
+S = TypeVar("S")
+T = TypeVar("T")
+
+# How long a blocked worker or consumer waits before checking again whether the read was stopped
+_POLL_INTERVAL_SECONDS = 0.1
+
+
+@dataclass
+class _SliceCompleted:
+    index: int
+
+
+@dataclass
+class _SliceFailed:
+    index: int
+    exception: BaseException
+
+
+@dataclass
+class _SliceBuffer(Generic[T]):
+    index: int
+    stream_slice: Any
+    queue: "Queue[Any]" = field(default_factory=Queue)
+
+
+class ConcurrentSliceReader:
+    """
+    Reads the slices of a stream on a bounded pool of threads while the records are consumed on the calling thread.
+
+    Records are handed from the workers to the consumer through bounded queues so that a slow consumer applies back pressure on the workers
+    instead of having whole slices accumulate in memory. Two merge strategies are available:
+    * read_ordered returns the records slice by slice, in the order of the slices. Slices further down the line are read ahead up to
+      `buffer_size` records. This is what allows the consumer to checkpoint state only once all the slices before it have been fully read.
+    * read_unordered returns the records as soon as they are read, whatever the slice they come from.
+
+    Exceptions raised while reading a slice are re-raised on the consumer thread, when the consumer gets to that slice when the read is ordered
+    or as soon as they happen when it is unordered. Closing the returned iterator stops the workers.
+    """
+
+    DEFAULT_BUFFER_SIZE = 1000
+
+    def __init__(self, max_workers: int, buffer_size: int = DEFAULT_BUFFER_SIZE):
+        if max_workers < 1:
+            raise ValueError(f"The number of concurrent slices must be at least 1. Got {max_workers}")
+        self._max_workers = max_workers
+        self._buffer_size = buffer_size
+
+    def read_ordered(self, slices: Iterable[S], read_slice: Callable[[S], Iterable[T]]) -> Iterator[Tuple[S, Iterator[T]]]:
+        """
+        :return: a (slice, records) tuple for each slice in the order of `slices`. The records of a slice must be consumed before moving on to
+          the next slice
+        """
+        stop = Event()
+        slice_iterator = enumerate(slices)
+        pending: Deque[_SliceBuffer[T]] = deque()
+        with ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="slice_reader") as executor:
+            try:
+                while len(pending) < self._max_workers and self._submit_next(executor, slice_iterator, pending, read_slice, stop):
+                    pass
+                while pending:
+                    buffer = pending.popleft()
+                    self._submit_next(executor, slice_iterator, pending, read_slice, stop)
+                    yield buffer.stream_slice, self._drain(buffer.queue, stop)
+            finally:
+                stop.set()
+
+    def read_unordered(self, slices: Iterable[S], read_slice: Callable[[S], Iterable[T]]) -> Iterator[T]:
+        """
+        :return: the records of all the slices, in the order they are read. As the order of the slices does not matter, slices can be any
+          unit of work producing records, e.g. whole streams
+        """
+        stop = Event()
+        slice_iterator = enumerate(slices)
+        records: "Queue[Any]" = Queue(maxsize=self._buffer_size * self._max_workers)
+        in_progress = 0
+        with ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="slice_reader") as executor:
+            try:
+                for index, stream_slice in slice_iterator:
+                    executor.submit(self._read_slice, _SliceBuffer(index, stream_slice, records), read_slice, stop)
+                    in_progress += 1
+                    if in_progress == self._max_workers:
+                        break
+                while in_progress:
+                    item = self._get(records, stop)
+                    if isinstance(item, _SliceFailed):
+                        raise item.exception
+                    if isinstance(item, _SliceCompleted):
+                        in_progress -= 1
+                        next_slice = next(slice_iterator, None)
+                        if next_slice is not None:
+                            index, stream_slice = next_slice
+                            executor.submit(self._read_slice, _SliceBuffer(index, stream_slice, records), read_slice, stop)
+                            in_progress += 1
+                        continue
+                    yield item
+            finally:
+                stop.set()
+
+    def _submit_next(
+        self,
+        executor: ThreadPoolExecutor,
+        slice_iterator: Iterator[Tuple[int, S]],
+        pending: Deque[_SliceBuffer[T]],
+        read_slice: Callable[[S], Iterable[T]],
+        stop: Event,
+    ) -> bool:
+        next_slice = next(slice_iterator, None)
+        if next_slice is None:
+            return False
+        index, stream_slice = next_slice
+        buffer: _SliceBuffer[T] = _SliceBuffer(index, stream_slice, Queue(maxsize=self._buffer_size))
+        pending.append(buffer)
+        executor.submit(self._read_slice, buffer, read_slice, stop)
+        return True
+
+    def _read_slice(self, buffer: _SliceBuffer[T], read_slice: Callable[[Any], Iterable[T]], stop: Event) -> None:
+        try:
+            for record in read_slice(buffer.stream_slice):
+                if not self._put(buffer.queue, record, stop):
+                    return
+            self._put(buffer.queue, _SliceCompleted(buffer.index), stop)
+        except Exception as exception:
+            self._put(buffer.queue, _SliceFailed(buffer.index, exception), stop)
+
+    def _drain(self, queue: "Queue[Any]", stop: Event) -> Iterator[Any]:
+        while True:
+            item = self._get(queue, stop)
+            if isinstance(item, _SliceCompleted):
+                return
+            if isinstance(item, _SliceFailed):
+                raise item.exception
+            yield item
+
+    @staticmethod
+    def _put(queue: "Queue[Any]", item: Any, stop: Event) -> bool:
+        while not stop.is_set():
+            try:
+                queue.put(item, timeout=_POLL_INTERVAL_SECONDS)
+                return True
+            except Full:
+                continue
+        return False
+
+    @staticmethod
+    def _get(queue: "Queue[Any]", stop: Event) -> Any:
+        while not stop.is_set():
+            try:
+                return queue.get(timeout=_POLL_INTERVAL_SECONDS)
+            except Empty:
+                continue
+        raise RuntimeError("The concurrent slice read was stopped while records were still expected")
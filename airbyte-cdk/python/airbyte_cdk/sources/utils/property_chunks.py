@@ -0,0 +1,89 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Mapping, MutableMapping, Optional, Sequence, Tuple, TypeVar
+
+C = TypeVar("C")
+T = TypeVar("T")
+Record = MutableMapping[str, Any]
+
+
+def fetch_property_chunks(chunks: Sequence[C], fetch_chunk: Callable[[C], T], max_workers: int) -> Iterator[Tuple[C, T]]:
+    """
+    Fetches the chunks of properties of a page of records concurrently, on at most `max_workers` threads, and returns each chunk with its
+    result as soon as it is fetched.
+
+    Objects with more properties than a request can select are read with one request per chunk of properties. Fetching the chunks of a page
+    concurrently costs the latency of the slowest request rather than the sum of the latencies. `fetch_chunk` is called from several threads
+    at once, so it must not mutate state shared between chunks. An exception raised while fetching a chunk is re-raised when its result would
+    have been returned, and the chunks not fetched yet are cancelled.
+    """
+    if max_workers <= 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            yield chunk, fetch_chunk(chunk)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks)), thread_name_prefix="property_chunk") as executor:
+        futures: Dict["Future[T]", C] = {executor.submit(fetch_chunk, chunk): chunk for chunk in chunks}
+        try:
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+class PropertyChunkMerger:
+    """
+    Merges by primary key the parts of the records fetched with different chunks of properties.
+
+    A record is returned by `add` as soon as its parts from all the chunks were added, and is forgotten then: only the records still waiting for
+    the parts of some chunks are held in memory, which is bounded by the records of the pages being fetched as long as the chunks are paginated
+    together. The parts are merged with `merge`, which updates the first part of a record with the next ones and defaults to a shallow update.
+    Records may be missing from some chunks, e.g. when they were created or deleted between the requests: `pop_incomplete` returns them so
+    that the stream can decide whether to emit or to skip them.
+    """
+
+    def __init__(
+        self,
+        chunk_count: int,
+        primary_key: Callable[[Mapping[str, Any]], Hashable],
+        merge: Optional[Callable[[Record, Mapping[str, Any]], None]] = None,
+    ):
+        self._chunk_count = chunk_count
+        self._primary_key = primary_key
+        self._merge = merge or (lambda record, part: record.update(part))
+        # primary key -> (merged parts, number of parts)
+        self._incomplete: Dict[Hashable, Tuple[Record, int]] = {}
+
+    def add(self, part: Record) -> Optional[Record]:
+        """
+        :return: the merged record when `part` is its last part, None otherwise
+        """
+        if self._chunk_count <= 1:
+            return part
+        key = self._primary_key(part)
+        if key not in self._incomplete:
+            self._incomplete[key] = (part, 1)
+            return None
+        record, parts = self._incomplete[key]
+        self._merge(record, part)
+        if parts + 1 == self._chunk_count:
+            del self._incomplete[key]
+            return record
+        self._incomplete[key] = (record, parts + 1)
+        return None
+
+    @property
+    def incomplete_keys(self) -> List[Hashable]:
+        return list(self._incomplete)
+
+    def pop_incomplete(self) -> List[Record]:
+        """
+        :return: the records which miss the parts of some chunks, in the order their first part was added
+        """
+        records = [record for record, _ in self._incomplete.values()]
+        self._incomplete.clear()
+        return records
@@ -2,12 +2,17 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import json
 import logging
+import numbers
+from collections import deque
 from distutils.util import strtobool
 from enum import Flag, auto
-from typing import Any, Callable, Dict, Mapping, Optional
+from threading import Lock
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
-from jsonschema import Draft7Validator, ValidationError, validators
+from cachetools import LRUCache
+from jsonschema import Draft7Validator, RefResolutionError, RefResolver, ValidationError, validators
 
 json_to_python_simple = {"string": str, "number": float, "integer": int, "boolean": bool, "null": type(None)}
 json_to_python = {**json_to_python_simple, **{"object": dict, "array": list}}
@@ -15,6 +20,27 @@ python_to_json = {v: k for k, v in json_to_python.items()}
 
 logger = logging.getLogger("airbyte")
 
+# Path of a value within a record, as a linked list of (parent path, key) tuples so that descending into a field does not copy the path
+_Path = Optional[Tuple[Any, Any]]
+# Compiled step of a transformation plan, normalizing and type checking a value of the record in place
+_Step = Callable[[Any, _Path], None]
+
+# Same type checks as the Draft7Validator's, without going through its type checker
+_JSON_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "array": lambda instance: isinstance(instance, list),
+    "boolean": lambda instance: isinstance(instance, bool),
+    "integer": lambda instance: not isinstance(instance, bool)
+    and (isinstance(instance, int) or (isinstance(instance, float) and instance.is_integer())),
+    "null": lambda instance: instance is None,
+    "number": lambda instance: not isinstance(instance, bool) and isinstance(instance, numbers.Number),
+    "object": lambda instance: isinstance(instance, dict),
+    "string": lambda instance: isinstance(instance, str),
+}
+
+
+class _UnsupportedSchema(Exception):
+    """Raised when a schema can't be compiled into a transformation plan, in which case records are transformed using jsonschema"""
+
 
 class TransformConfig(Flag):
     """
@@ -42,6 +68,9 @@ class TypeTransformer:
 
     _custom_normalizer: Optional[Callable[[Any, Dict[str, Any]], Any]] = None
 
+    # Number of schemas for which a compiled transformation plan is kept
+    MAX_CACHED_PLANS = 64
+
     def __init__(self, config: TransformConfig):
         """
         Initialize TypeTransformer instance.
@@ -57,6 +86,17 @@ class TypeTransformer:
             if key in ["type", "array", "$ref", "properties", "items"]
         }
         self._normalizer = validators.create(meta_schema=Draft7Validator.META_SCHEMA, validators=all_validators)
+        # Schemas are compiled once into a plan of per-field normalizations and type checks. Plans are keyed by the content of the schema, so
+        # that streams building a new schema for every record reuse the same plan. As fingerprinting a schema costs more than looking it up,
+        # the plans are also keyed by schema identity, with the schema kept alongside the plan so that an identifier reused by another
+        # schema is not mistaken for a cached one
+        self._plans: "LRUCache[str, Optional[_Step]]" = LRUCache(maxsize=self.MAX_CACHED_PLANS)
+        self._plans_by_identity: "LRUCache[int, Tuple[Mapping[str, Any], Optional[_Step]]]" = LRUCache(maxsize=self.MAX_CACHED_PLANS)
+        self._plans_lock = Lock()
+
+    @property
+    def config(self) -> TransformConfig:
+        return self._config
 
     def registerCustomTransform(self, normalization_callback: Callable[[Any, Dict[str, Any]], Any]) -> Callable:
         """
@@ -70,6 +110,9 @@ class TypeTransformer:
         if TransformConfig.CustomSchemaNormalization not in self._config:
             raise Exception("Please set TransformConfig.CustomSchemaNormalization config before registering custom normalizer")
         self._custom_normalizer = normalization_callback
+        with self._plans_lock:
+            self._plans.clear()
+            self._plans_by_identity.clear()
         return normalization_callback
 
     def __normalize(self, original_item: Any, subschema: Dict[str, Any]) -> Any:
@@ -180,6 +223,10 @@ class TypeTransformer:
         """
         if TransformConfig.NoTransform in self._config:
             return
+        plan = self._get_plan(schema)
+        if plan is not None:
+            plan(record, None)
+            return
         normalizer = self._normalizer(schema)
         for e in normalizer.iter_errors(record):
             """
@@ -188,9 +235,262 @@ class TypeTransformer:
             """
             logger.warning(self.get_error_message(e))
 
+    def _get_plan(self, schema: Mapping[str, Any]) -> Optional[_Step]:
+        """
+        Returns the transformation plan compiled from the schema, or None if the schema can't be compiled and the record must be transformed
+        by traversing it with jsonschema.
+        """
+        with self._plans_lock:
+            cached = self._plans_by_identity.get(id(schema))
+        if cached is not None and cached[0] is schema:
+            return cached[1]
+        fingerprint = self._fingerprint(schema)
+        with self._plans_lock:
+            compiled = fingerprint is not None and fingerprint in self._plans
+            plan = self._plans[fingerprint] if fingerprint is not None and compiled else None
+        if not compiled:
+            try:
+                plan = _PlanCompiler(self, schema).compile()
+            except Exception:
+                plan = None
+        with self._plans_lock:
+            if fingerprint is not None:
+                self._plans[fingerprint] = plan
+            self._plans_by_identity[id(schema)] = (schema, plan)
+        return plan
+
+    @staticmethod
+    def _fingerprint(schema: Mapping[str, Any]) -> Optional[str]:
+        try:
+            return json.dumps(schema, sort_keys=True)
+        except (TypeError, ValueError):
+            return None
+
     def get_error_message(self, e: ValidationError) -> str:
         instance_json_type = python_to_json[type(e.instance)]
         key_path = "." + ".".join(map(str, e.path))
         return (
             f"Failed to transform value {repr(e.instance)} of type '{instance_json_type}' to '{e.validator_value}', key path: '{key_path}'"
         )
+
+
+def _noop(instance: Any, path: _Path) -> None:
+    pass
+
+
+def _flatten_path(path: _Path) -> List[Any]:
+    keys: List[Any] = []
+    while path is not None:
+        path, key = path
+        keys.append(key)
+    keys.reverse()
+    return keys
+
+
+class _PlanCompiler:
+    """
+    Compiles a json schema into a transformation plan equivalent to traversing records with the TypeTransformer's jsonschema normalizer:
+    * the "properties" and "items" keywords normalize the values of the object or array, then descend into each of them
+    * the "type" keyword logs a warning if the value does not match the type
+    * a "$ref" replaces the schema it is in by the schema it references
+    * every other keyword is ignored
+    Schemas relying on jsonschema features that are not reproduced here (remote or recursive references, boolean schemas, etc.) raise an
+    _UnsupportedSchema exception.
+    """
+
+    def __init__(self, transformer: TypeTransformer, schema: Mapping[str, Any]):
+        self._transformer = transformer
+        self._root_schema = schema
+        self._resolver = RefResolver.from_schema(schema)
+
+    def compile(self) -> _Step:
+        return self._compile_schema(self._root_schema, ()) or _noop
+
+    def _resolve(self, ref: Any) -> Any:
+        if not isinstance(ref, str) or not ref.startswith("#"):
+            raise _UnsupportedSchema(f"Reference {ref} is not local")
+        _, resolved = self._resolver.resolve(ref)
+        return resolved
+
+    def _compile_schema(self, schema: Any, resolving: Tuple[str, ...]) -> Optional[_Step]:
+        if schema is True:
+            return None
+        if not isinstance(schema, dict):
+            raise _UnsupportedSchema(f"Schema {schema} is not an object")
+        if schema is not self._root_schema and "$id" in schema:
+            raise _UnsupportedSchema("Nested schemas with an $id change the resolution scope")
+
+        ref = schema.get("$ref")
+        if ref is not None:
+            if ref in resolving:
+                raise _UnsupportedSchema(f"Reference {ref} is recursive")
+            return self._compile_schema(self._resolve(ref), resolving + (ref,))
+
+        compiled_steps: List[Optional[_Step]] = []
+        for keyword, value in schema.items():
+            if keyword == "type":
+                compiled_steps.append(self._compile_type(value))
+            elif keyword == "properties":
+                compiled_steps.append(self._compile_properties(value, resolving))
+            elif keyword == "items":
+                compiled_steps.append(self._compile_items(value, resolving))
+        steps = [step for step in compiled_steps if step is not None]
+        if not steps:
+            return None
+        if len(steps) == 1:
+            return steps[0]
+
+        def apply_steps(instance: Any, path: _Path) -> None:
+            for step in steps:
+                step(instance, path)
+
+        return apply_steps
+
+    def _compile_type(self, types: Any) -> _Step:
+        type_list = [types] if isinstance(types, str) else types
+        if not isinstance(type_list, list) or any(t not in _JSON_TYPE_CHECKS for t in type_list):
+            raise _UnsupportedSchema(f"Unknown type {types}")
+        checks = [_JSON_TYPE_CHECKS[t] for t in type_list]
+        transformer = self._transformer
+
+        def check_type(instance: Any, path: _Path) -> None:
+            for check in checks:
+                if check(instance):
+                    return
+            error = ValidationError(
+                f"{instance!r} is not of type {types!r}",
+                validator="type",
+                validator_value=types,
+                instance=instance,
+                path=deque(_flatten_path(path)),
+            )
+            logger.warning(transformer.get_error_message(error))
+
+        return check_type
+
+    def _compile_properties(self, properties: Any, resolving: Tuple[str, ...]) -> Optional[_Step]:
+        if not isinstance(properties, dict):
+            raise _UnsupportedSchema("Properties is not an object")
+        normalizers = []
+        validators = []
+        for key, subschema in properties.items():
+            try:
+                normalizer = self._compile_normalizer(self._resolve(subschema["$ref"]) if "$ref" in subschema else subschema)
+                validator = self._compile_schema(subschema, resolving)
+            except RefResolutionError as error:
+                # jsonschema only resolves references for the fields present in the record so this only fails if the field is present
+                normalizer = self._raise(error)
+                validator = None
+            if normalizer is not None:
+                normalizers.append((key, normalizer))
+            if validator is not None:
+                validators.append((key, validator))
+        if not normalizers and not validators:
+            return None
+
+        def transform_properties(instance: Any, path: _Path) -> None:
+            if not isinstance(instance, dict):
+                return
+            for key, normalizer in normalizers:
+                if key in instance:
+                    instance[key] = normalizer(instance[key])
+            for key, validator in validators:
+                if key in instance:
+                    validator(instance[key], (path, key))
+
+        return transform_properties
+
+    def _compile_items(self, items: Any, resolving: Tuple[str, ...]) -> Optional[_Step]:
+        if not isinstance(items, dict):
+            raise _UnsupportedSchema("Items is not an object")
+        normalizer = self._compile_normalizer(self._resolve(items["$ref"]) if "$ref" in items else items)
+        validator = self._compile_schema(items, resolving)
+        if normalizer is None and validator is None:
+            return None
+
+        def transform_items(instance: Any, path: _Path) -> None:
+            if not isinstance(instance, list):
+                return
+            if normalizer is not None:
+                for index, item in enumerate(instance):
+                    instance[index] = normalizer(item)
+            if validator is not None:
+                for index, item in enumerate(instance):
+                    validator(item, (path, index))
+
+        return transform_items
+
+    @staticmethod
+    def _raise(error: Exception) -> Callable[[Any], Any]:
+        def raise_error(value: Any) -> Any:
+            raise error
+
+        return raise_error
+
+    def _compile_normalizer(self, subschema: Any) -> Optional[Callable[[Any], Any]]:
+        """
+        Returns a function applying the same transformations as TypeTransformer.__normalize for the given subschema, or None if values are
+        left untouched.
+        """
+        if not isinstance(subschema, dict):
+            raise _UnsupportedSchema(f"Schema {subschema} is not an object")
+        transformer = self._transformer
+        normalizers: List[Callable[[Any], Any]] = []
+        if TransformConfig.DefaultSchemaNormalization in transformer._config:
+            if type(transformer).default_convert is TypeTransformer.default_convert:
+                default_normalizer = self._compile_default_convert(subschema)
+                if default_normalizer is not None:
+                    normalizers.append(default_normalizer)
+            else:
+                normalizers.append(lambda value: transformer.default_convert(value, subschema))
+        custom_normalizer = transformer._custom_normalizer
+        if custom_normalizer:
+            normalizers.append(lambda value: custom_normalizer(value, subschema))
+
+        if not normalizers:
+            return None
+        if len(normalizers) == 1:
+            return normalizers[0]
+        first, second = normalizers
+        return lambda value: second(first(value))
+
+    @staticmethod
+    def _compile_default_convert(subschema: Dict[str, Any]) -> Optional[Callable[[Any], Any]]:
+        """
+        Specializes TypeTransformer.default_convert for the given subschema. Returns None if values are always returned as is.
+        """
+        target_type = subschema.get("type", [])
+        nullable = "null" in target_type
+        if isinstance(target_type, list):
+            target_type = [t for t in target_type if t != "null"]
+            if len(target_type) != 1:
+                return None
+            target_type = target_type[0]
+
+        convert: Callable[[Any], Any]
+        if target_type == "string":
+            convert = lambda value: value if type(value) is str else str(value)  # noqa: E731
+        elif target_type == "number":
+            convert = lambda value: value if type(value) is float else float(value)  # noqa: E731
+        elif target_type == "integer":
+            convert = lambda value: value if type(value) is int else int(value)  # noqa: E731
+        elif target_type == "boolean":
+            convert = lambda value: strtobool(value) == 1 if isinstance(value, str) else bool(value)  # noqa: E731
+        elif target_type == "array":
+            item_types = set(subschema.get("items", {}).get("type", set()))
+            if not item_types.issubset(json_to_python_simple):
+                return None
+            simple_python_types = tuple(json_to_python_simple.values())
+            convert = lambda value: [value] if type(value) in simple_python_types else value  # noqa: E731
+        else:
+            return None
+
+        def default_convert(value: Any) -> Any:
+            if value is None and nullable:
+                return None
+            try:
+                return convert(value)
+            except (ValueError, TypeError):
+                return value
+
+        return default_convert
@@ -2,7 +2,8 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from typing import Any, List, Mapping
+import re
+from typing import Any, List, Mapping, Optional, Pattern, Tuple
 
 import dpath.util
 
@@ -54,19 +55,33 @@ def get_secrets(connection_specification: Mapping[str, Any], config: Mapping[str
 
 
 __SECRETS_FROM_CONFIG: List[str] = []
+# The secrets to mask as non-empty strings, and a pattern matching any of them. Alternatives are ordered longest first so that the longest
+# secret starting at a given position is masked, e.g. "xk" rather than "x" if both are secrets
+__SECRETS_TO_MASK: Tuple[str, ...] = ()
+__SECRETS_PATTERN: Optional[Pattern[str]] = None
 
 
 def update_secrets(secrets: List[str]):
     """Update the list of secrets to be replaced"""
-    global __SECRETS_FROM_CONFIG
+    global __SECRETS_FROM_CONFIG, __SECRETS_TO_MASK, __SECRETS_PATTERN
     __SECRETS_FROM_CONFIG = secrets
+    __SECRETS_TO_MASK = tuple(sorted({str(secret) for secret in secrets if secret}, key=len, reverse=True))
+    __SECRETS_PATTERN = re.compile("|".join(map(re.escape, __SECRETS_TO_MASK))) if __SECRETS_TO_MASK else None
 
 
 def filter_secrets(string: str) -> str:
     """Filter secrets from a string by replacing them with ****"""
-    # TODO this should perform a maximal match for each secret. if "x" and "xk" are both secret values, and this method is called twice on
-    #  the input "xk", then depending on call order it might only obfuscate "*k". This is a bug.
-    for secret in __SECRETS_FROM_CONFIG:
-        if secret:
-            string = string.replace(str(secret), "****")
+    # Looking for each secret with the `in` operator is much faster than searching the string with the pattern, and most strings do not
+    # contain any secret
+    for secret in __SECRETS_TO_MASK:
+        if secret in string:
+            return _mask_secrets(string)
     return string
+
+
+def _mask_secrets(string: str) -> str:
+    secrets_in_string = [secret for secret in __SECRETS_TO_MASK if secret in string]
+    if len(secrets_in_string) == 1:
+        # No other secret can overlap with it
+        return string.replace(secrets_in_string[0], "****")
+    return __SECRETS_PATTERN.sub("****", string)  # type: ignore  # the pattern is set whenever there are secrets to mask
@@ -4,10 +4,11 @@
 
 import datetime
 import logging
+import threading
 import time
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import List, Optional
 
 logger = logging.getLogger("airbyte")
 
@@ -15,7 +16,8 @@ logger = logging.getLogger("airbyte")
 class EventTimer:
     """Simple nanosecond resolution event timer for debugging, initially intended to be used to record streams execution
     time for a source.
-       Event nesting follows a LIFO pattern, so finish will apply to the last started event.
+       Event nesting follows a LIFO pattern, so finish will apply to the last started event unless the event to finish is named.
+       Events running at the same time, e.g. streams read concurrently, must be finished by name.
     """
 
     def __init__(self, name):
@@ -23,27 +25,55 @@ class EventTimer:
         self.events = {}
         self.count = 0
         self.stack = []
+        self._lock = threading.Lock()
 
-    def start_event(self, name):
+    def start_event(self, name: str) -> None:
         """
         Start a new event and push it to the stack.
         """
-        self.events[name] = Event(name=name)
-        self.count += 1
-        self.stack.insert(0, self.events[name])
+        with self._lock:
+            self.events[name] = Event(name=name)
+            self.count += 1
+            self.stack.insert(0, self.events[name])
 
-    def finish_event(self):
+    def finish_event(self, name: Optional[str] = None):
         """
-        Finish the current event and pop it from the stack.
+        Finish the event with the given name, or the current event if no name is given, and pop it from the stack.
         """
+        with self._lock:
+            event = self.events.get(name) if name else (self.stack[0] if self.stack else None)
+            if event is not None and event in self.stack:
+                self.stack.remove(event)
+                event.finish()
+            else:
+                logger.warning(f"{self.name} finish_event called without start_event")
 
-        if self.stack:
-            event = self.stack.pop(0)
-            event.finish()
-        else:
-            logger.warning(f"{self.name} finish_event called without start_event")
+    @property
+    def wall_time(self) -> float:
+        """Returns the time in seconds during which at least one finished event was running. Overlapping events are only counted once"""
+        intervals = sorted((event.start, event.end) for event in self._finished_events() if event.end is not None)
+        if not intervals:
+            return 0.0
+        wall_time: float = 0.0
+        current_start, current_end = intervals[0]
+        for start, end in intervals[1:]:
+            if start > current_end:
+                wall_time += current_end - current_start
+                current_start, current_end = start, end
+            else:
+                current_end = max(current_end, end)
+        wall_time += current_end - current_start
+        return wall_time / 1e9
+
+    @property
+    def total_time(self) -> float:
+        """Returns the sum of the durations of the finished events in seconds"""
+        return sum(event.duration for event in self._finished_events())
+
+    def _finished_events(self) -> List["Event"]:
+        return [event for event in list(self.events.values()) if event.end]
 
-    def report(self, order_by="name"):
+    def report(self, order_by: str = "name") -> str:
         """
         :param order_by: 'name' or 'duration'
         """
@@ -51,7 +81,10 @@ class EventTimer:
             events = sorted(self.events.values(), key=lambda event: event.name)
         elif order_by == "duration":
             events = sorted(self.events.values(), key=lambda event: event.duration)
-        text = f"{self.name} runtimes:\n"
+        text = (
+            f"{self.name} runtimes (wall time {datetime.timedelta(seconds=self.wall_time)},"
+            f" total event time {datetime.timedelta(seconds=self.total_time)}):\n"
+        )
         text += "\n".join(str(event) for event in events)
         return text
 
@@ -70,6 +103,9 @@ class Event:
         return float("+inf")
 
     def __str__(self):
+        if not self.end:
+            # Events can still be running when reporting, e.g. other streams being read concurrently
+            return f"{self.name} in progress"
         return f"{self.name} {datetime.timedelta(seconds=self.duration)}"
 
     def finish(self):
@@ -15,8 +15,11 @@ README = (HERE / "README.md").read_text()
 
 avro_dependency = "avro~=1.11.2"
 fastavro_dependency = "fastavro~=1.8.0"
+orjson_dependency = "orjson~=3.9"
 pyarrow_dependency = "pyarrow==12.0.1"
 
+httpx_dependency = "httpx[http2]>=0.25,<1"
+
 langchain_dependency = "langchain==0.0.271"
 openai_dependency = "openai[embeddings]==0.27.9"
 cohere_dependency = "cohere==4.21"
@@ -26,7 +29,7 @@ setup(
     name="airbyte-cdk",
     # The version of the airbyte-cdk package is used at runtime to validate manifests. That validation must be
     # updated if our semver format changes such as using release candidate versions.
-    version="0.51.8",
+    version="0.52.0",
     description="A framework for writing Airbyte Connectors.",
     long_description=README,
     long_description_content_type="text/markdown",
@@ -78,6 +81,8 @@ setup(
         "dev": [
             avro_dependency,
             fastavro_dependency,
+            orjson_dependency,
+            httpx_dependency,
             "freezegun",
             "mypy",
             "pytest",
@@ -99,8 +104,10 @@ setup(
         "file-based": [
             avro_dependency,
             fastavro_dependency,
+            orjson_dependency,
             pyarrow_dependency,
         ],
+        "http2": [httpx_dependency],
         "vector-db-based": [langchain_dependency, openai_dependency, cohere_dependency, tiktoken_dependency],
     },
 )
@@ -0,0 +1,143 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import io
+import json
+
+import dpath.util
+import pytest
+import requests
+from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders.streaming_json_decoder import StreamingJsonDecoder
+
+
+def create_response(content: bytes, encoding: str = "utf-8") -> requests.Response:
+    response = requests.Response()
+    response.raw = io.BytesIO(content)
+    response.encoding = encoding
+    return response
+
+
+def expected_items(body, field_path):
+    extracted = dpath.util.get(body, field_path, default=[]) if field_path else body
+    if isinstance(extracted, list):
+        return extracted
+    return [extracted] if extracted else []
+
+
+BODIES = [
+    pytest.param({"data": [{"id": 1}, {"id": 2}]}, ["data"], id="test_array"),
+    pytest.param({"data": {"id": 1}}, ["data"], id="test_single_record"),
+    pytest.param({"id": 1, "name": "a"}, [], id="test_root_object"),
+    pytest.param([{"id": 1}, {"id": 2}], [], id="test_root_array"),
+    pytest.param([], [], id="test_empty_root_array"),
+    pytest.param({"data": []}, ["data"], id="test_empty_array"),
+    pytest.param({"data": {}}, ["data"], id="test_empty_object"),
+    pytest.param({"id": 1}, ["data"], id="test_missing_field"),
+    pytest.param({"data": None}, ["data"], id="test_null_field"),
+    pytest.param({"data": 1}, ["data", "records"], id="test_path_through_scalar"),
+    pytest.param({"data": [{"records": [1]}]}, ["data", "0", "records"], id="test_path_through_array"),
+    pytest.param(
+        {"before": {"records": [0]}, "data": {"meta": "x", "records": [{"id": 1}, {"id": 2}], "next": 2}, "after": [1, 2]},
+        ["data", "records"],
+        id="test_nested_array_between_other_fields",
+    ),
+    pytest.param(
+        {"data": [{"amount": -12.5e-3, "count": 123456789, "flag": True, "none": None, "text": 'é " \\ ☃ ,]}'}]},
+        ["data"],
+        id="test_all_json_types",
+    ),
+    pytest.param({"data": [1, 22, 333.25, -4e10]}, ["data"], id="test_numbers"),
+]
+
+
+@pytest.mark.parametrize("body, field_path", BODIES)
+@pytest.mark.parametrize("chunk_size", [1, 3, 64 * 1024])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_iterate_items(body, field_path, chunk_size, indent):
+    decoder = StreamingJsonDecoder(parameters={})
+    decoder.CHUNK_SIZE = chunk_size
+    response = create_response(json.dumps(body, indent=indent, ensure_ascii=False).encode("utf-8"))
+
+    assert list(decoder.iterate_items(response, field_path)) == expected_items(body, field_path)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 64 * 1024])
+def test_response_content_is_replaced_by_the_document_without_the_records(chunk_size):
+    body = {"data": {"records": [{"id": 1}, {"id": 2}], "next_page": "token"}, "has_more": True}
+    decoder = StreamingJsonDecoder(parameters={})
+    decoder.CHUNK_SIZE = chunk_size
+    response = create_response(json.dumps(body).encode("utf-8"))
+
+    assert list(decoder.iterate_items(response, ["data", "records"])) == [{"id": 1}, {"id": 2}]
+    expected_document = {"data": {"records": [], "next_page": "token"}, "has_more": True}
+    assert response.json() == expected_document
+    assert JsonDecoder(parameters={}).decode(response) == expected_document
+
+
+def test_multibyte_characters_split_across_chunks():
+    body = {"data": [{"name": "日本語"}, {"name": "☃"}]}
+    decoder = StreamingJsonDecoder(parameters={})
+    decoder.CHUNK_SIZE = 1
+
+    assert list(decoder.iterate_items(create_response(json.dumps(body, ensure_ascii=False).encode("utf-8")), ["data"])) == body["data"]
+
+
+@pytest.mark.parametrize("content", [pytest.param(b"", id="test_empty_body"), pytest.param(b"   \n", id="test_whitespace_body")])
+def test_empty_body_has_no_records(content):
+    decoder = StreamingJsonDecoder(parameters={})
+    response = create_response(content)
+
+    assert list(decoder.iterate_items(response, ["data"])) == []
+    assert decoder.decode(response) == {}
+
+
+@pytest.mark.parametrize(
+    "content, expected_records",
+    [
+        pytest.param(b"<html>error</html>", [], id="test_not_json"),
+        pytest.param(b'{"data": [{"id": 1}, {"id": 2}', [{"id": 1}, {"id": 2}], id="test_truncated"),
+        pytest.param(b'{"data": [{"id": 1}, {"id": 2}, {"id": 3', [{"id": 1}, {"id": 2}], id="test_truncated_record"),
+        pytest.param(b'{"data": [{"id": 1}]} {"data": []}', [{"id": 1}], id="test_extra_data"),
+    ],
+)
+def test_invalid_body_raises_after_the_records_before_the_error(content, expected_records):
+    decoder = StreamingJsonDecoder(parameters={})
+    records = []
+
+    with pytest.raises(json.JSONDecodeError):
+        for record in decoder.iterate_items(create_response(content), ["data"]):
+            records.append(record)
+    assert records == expected_records
+
+
+def test_decode():
+    decoder = StreamingJsonDecoder(parameters={})
+
+    assert decoder.decode(create_response(b'{"data": [1]}')) == {"data": [1]}
+    assert decoder.decode(create_response(b"")) == {}
+
+
+def test_records_are_yielded_before_the_response_is_fully_read():
+    content = json.dumps({"data": [{"id": i} for i in range(100)], "next": "token"}).encode("utf-8")
+    chunk_size = 10
+    chunks_read = []
+
+    def iter_content(chunk_size):
+        for start in range(0, len(content), chunk_size):
+            chunks_read.append(start)
+            yield content[start : start + chunk_size]
+
+    response = create_response(content)
+    response.iter_content = iter_content
+    decoder = StreamingJsonDecoder(parameters={})
+    decoder.CHUNK_SIZE = chunk_size
+    records = decoder.iterate_items(response, ["data"])
+
+    assert next(records) == {"id": 0}
+    assert len(chunks_read) <= 2
+    assert next(records) == {"id": 1}
+    assert len(chunks_read) <= 3
+    assert len(list(records)) == 98
+    assert len(chunks_read) == -(-len(content) // chunk_size)
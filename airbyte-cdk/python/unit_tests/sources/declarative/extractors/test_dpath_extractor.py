@@ -2,19 +2,23 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import io
 import json
 
 import pytest
 import requests
 from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders.streaming_json_decoder import StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.extractors.dpath_extractor import DpathExtractor
 
 config = {"field": "record_array"}
 parameters = {"parameters_field": "record_array"}
 
 decoder = JsonDecoder(parameters={})
+streaming_decoder = StreamingJsonDecoder(parameters={})
 
 
+@pytest.mark.parametrize("decoder", [decoder, streaming_decoder], ids=["json_decoder", "streaming_json_decoder"])
 @pytest.mark.parametrize(
     "test_name, field_path, body, expected_records",
     [
@@ -35,7 +39,7 @@ decoder = JsonDecoder(parameters={})
         ("test_complex_nested_list", ['data', '*', 'list', 'data2', '*'], {"data": [{"list": {"data2": [{"id": 1}, {"id": 2}]}},{"list": {"data2": [{"id": 3}, {"id": 4}]}}]}, [{"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}])
     ],
 )
-def test_dpath_extractor(test_name, field_path, body, expected_records):
+def test_dpath_extractor(test_name, field_path, body, expected_records, decoder):
     extractor = DpathExtractor(field_path=field_path, config=config, decoder=decoder, parameters=parameters)
 
     response = create_response(body)
@@ -46,5 +50,5 @@ def test_dpath_extractor(test_name, field_path, body, expected_records):
 
 def create_response(body):
     response = requests.Response()
-    response._content = json.dumps(body).encode("utf-8")
+    response.raw = io.BytesIO(json.dumps(body).encode("utf-8"))
     return response
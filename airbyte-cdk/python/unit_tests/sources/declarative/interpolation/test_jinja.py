@@ -217,3 +217,60 @@ def test_macros_examples(template_string, expected_value):
     # If you change the expected output, you must also change the expected output in declarative_component_schema.yaml
     now_utc = interpolation.eval(template_string, {})
     assert now_utc == expected_value
+
+
+@pytest.mark.parametrize(
+    "input_string, expected_value, expected_is_compiled",
+    [
+        pytest.param("hello world", "hello world", False, id="test_static_string"),
+        pytest.param("5", 5, False, id="test_static_literal"),
+        pytest.param("{ \"key\": \"value\" }", {"key": "value"}, False, id="test_single_brace_is_not_a_template"),
+        pytest.param("hello world\n", "hello world", True, id="test_trailing_newline_is_stripped_like_jinja"),
+        pytest.param("hello {# comment #}world", "hello world", True, id="test_comment_is_rendered"),
+    ],
+)
+def test_static_strings_are_not_compiled(input_string, expected_value, expected_is_compiled):
+    jinja_interpolation = JinjaInterpolation()
+    assert jinja_interpolation.eval(input_string, {}) == expected_value
+    assert (input_string in jinja_interpolation._compiled_templates) == expected_is_compiled
+
+
+def test_compiled_template_is_reused():
+    jinja_interpolation = JinjaInterpolation()
+    s = "{{ config['date'] }}"
+    assert jinja_interpolation.eval(s, {"date": "2022-01-01"}) == "2022-01-01"
+    template, _ = jinja_interpolation._compiled_templates[s]
+
+    assert jinja_interpolation.eval(s, {"date": "2023-01-01"}) == "2023-01-01"
+    assert jinja_interpolation._compiled_templates[s][0] is template
+
+
+def test_undeclared_variables_are_checked_on_cached_templates():
+    jinja_interpolation = JinjaInterpolation()
+    s = "{{ stream_slice['date'] }}"
+    assert jinja_interpolation.eval(s, {}, stream_slice={"date": "2022-01-01"}) == "2022-01-01"
+    with pytest.raises(ValueError):
+        jinja_interpolation.eval(s, {})
+
+
+def test_compiled_template_cache_is_bounded():
+    jinja_interpolation = JinjaInterpolation()
+    for i in range(JinjaInterpolation.MAX_CACHED_TEMPLATES + 10):
+        assert jinja_interpolation.eval(f"{{{{ {i} }}}}", {}) == i
+    assert len(jinja_interpolation._compiled_templates) == JinjaInterpolation.MAX_CACHED_TEMPLATES
+
+
+def test_templates_are_compiled_once(mocker):
+    templates = [
+        "{{ config['api_key'] }}",
+        "{{ stream_slice['start_time'] }}",
+        "{{ record['updated_at'] >= stream_slice['start_time'] }}",
+    ]
+    context = {"stream_slice": {"start_time": "2022-01-01"}, "record": {"updated_at": "2022-01-02"}}
+    jinja_interpolation = JinjaInterpolation()
+    from_string = mocker.spy(jinja_interpolation._environment, "from_string")
+
+    for _ in range(3):
+        assert [jinja_interpolation.eval(template, {"api_key": "secret"}, **context) for template in templates] == ["secret", "2022-01-01", True]
+
+    assert from_string.call_count == len(templates)
@@ -19,7 +19,7 @@ from airbyte_cdk.sources.declarative.auth.token_provider import SessionTokenProv
 from airbyte_cdk.sources.declarative.checks import CheckStream
 from airbyte_cdk.sources.declarative.datetime import MinMaxDatetime
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
-from airbyte_cdk.sources.declarative.decoders import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders import JsonDecoder, StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.extractors import DpathExtractor, RecordFilter, RecordSelector
 from airbyte_cdk.sources.declarative.incremental import DatetimeBasedCursor, PerPartitionCursor
 from airbyte_cdk.sources.declarative.interpolation import InterpolatedString
@@ -1554,3 +1554,35 @@ def test_ignore_retry():
     )
 
     assert requester.max_retries == 0
+
+
+@pytest.mark.parametrize(
+    "decoder, expected_decoder_type, expected_stream_response",
+    [
+        pytest.param(None, JsonDecoder, False, id="test_default_decoder"),
+        pytest.param({"type": "JsonDecoder"}, JsonDecoder, False, id="test_json_decoder"),
+        pytest.param({"type": "StreamingJsonDecoder"}, StreamingJsonDecoder, True, id="test_streaming_json_decoder"),
+    ],
+)
+def test_simple_retriever_streams_response_with_streaming_json_decoder(decoder, expected_decoder_type, expected_stream_response):
+    extractor = {"type": "DpathExtractor", "field_path": ["data"]}
+    if decoder:
+        extractor["decoder"] = decoder
+    simple_retriever_model = {
+        "type": "SimpleRetriever",
+        "record_selector": {"type": "RecordSelector", "extractor": extractor},
+        "requester": {"type": "HttpRequester", "name": "list", "url_base": "orange.com", "path": "/v1/api"},
+    }
+
+    retriever = factory.create_component(
+        model_type=SimpleRetrieverModel,
+        component_definition=simple_retriever_model,
+        config={},
+        name="Test",
+        primary_key="id",
+        stream_slicer=None,
+        transformations=[],
+    )
+
+    assert isinstance(retriever.record_selector.extractor.decoder, expected_decoder_type)
+    assert retriever.requester.stream_response == expected_stream_response
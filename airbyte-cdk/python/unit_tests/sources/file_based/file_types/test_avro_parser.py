@@ -3,11 +3,17 @@
 #
 
 import datetime
+import io
+import logging
 import uuid
+from unittest.mock import Mock
 
+import fastavro
 import pytest
 from airbyte_cdk.sources.file_based.config.avro_format import AvroFormat
+from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig, ValidationPolicy
 from airbyte_cdk.sources.file_based.file_types import AvroParser
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 
 _default_avro_format = AvroFormat()
 _double_as_string_avro_format = AvroFormat(double_as_string=True)
@@ -207,3 +213,68 @@ def test_convert_primitive_avro_type_to_json(avro_format, avro_type, expected_js
 def test_to_output_value(avro_format, record_type, record_value, expected_value):
     parser = AvroParser()
     assert parser._to_output_value(avro_format, record_type, record_value) == expected_value
+
+
+_WIDE_AVRO_SCHEMA = {
+    "type": "record",
+    "name": "Wide",
+    "fields": [{"name": f"col_{i}", "type": ["null", "string"]} for i in range(5)]
+    + [
+        {"name": "day", "type": {"type": "int", "logicalType": "date"}},
+        {"name": "status", "type": {"type": "enum", "name": "Status", "symbols": ["ACTIVE", "INACTIVE"]}},
+        {"name": "previous_status", "type": "Status"},
+    ],
+}
+_WIDE_AVRO_RECORD = {
+    **{f"col_{i}": f"value_{i}" for i in range(5)},
+    "day": datetime.date(2023, 8, 7),
+    "status": "ACTIVE",
+    "previous_status": "INACTIVE",
+}
+_WIDE_AVRO_OUTPUT = {**_WIDE_AVRO_RECORD, "day": "2023-08-07"}
+
+
+class _RecordingFile(io.BytesIO):
+    def __init__(self, content: bytes):
+        super().__init__(content)
+        self.seeks = 0
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self.seeks += 1
+        return super().seek(offset, whence)
+
+
+@pytest.mark.parametrize(
+    "validation_policy, schema_columns, expected_columns",
+    [
+        pytest.param(ValidationPolicy.emit_record, ["col_1", "day"], ["col_1", "day"], id="test_selected_columns"),
+        pytest.param(ValidationPolicy.emit_record, ["col_1", "status"], ["col_1", "status"], id="test_selected_named_type"),
+        pytest.param(
+            ValidationPolicy.emit_record,
+            ["col_1", "previous_status"],
+            ["col_1", "previous_status"],
+            id="test_named_type_defined_by_other_field",
+        ),
+        pytest.param(ValidationPolicy.emit_record, list(_WIDE_AVRO_RECORD), list(_WIDE_AVRO_RECORD), id="test_all_columns"),
+        pytest.param(ValidationPolicy.skip_record, ["col_1", "day"], list(_WIDE_AVRO_RECORD), id="test_skip_record_reads_all_columns"),
+    ],
+)
+def test_parse_records_only_reads_the_columns_of_the_catalog(validation_policy, schema_columns, expected_columns):
+    avro_file = io.BytesIO()
+    fastavro.writer(avro_file, _WIDE_AVRO_SCHEMA, [_WIDE_AVRO_RECORD] * 3)
+    file = _RecordingFile(avro_file.getvalue())
+    stream_reader = Mock()
+    stream_reader.open_file.return_value.__enter__ = Mock(return_value=file)
+    stream_reader.open_file.return_value.__exit__ = Mock(return_value=None)
+    config = FileBasedStreamConfig(name="test", file_type="avro", validation_policy=validation_policy)
+    schema = {"type": "object", "properties": {column: {"type": ["null", "string"]} for column in schema_columns}}
+
+    records = list(
+        AvroParser().parse_records(
+            config, RemoteFile(uri="file.avro", last_modified=datetime.datetime.now()), stream_reader, logging.getLogger(), schema
+        )
+    )
+
+    assert records == [{column: _WIDE_AVRO_OUTPUT[column] for column in expected_columns}] * 3
+    assert file.seeks == 0
+
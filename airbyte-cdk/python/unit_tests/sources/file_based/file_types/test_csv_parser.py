@@ -8,7 +8,7 @@ import io
 import logging
 import unittest
 from datetime import datetime
-from typing import Any, Dict, Generator, List, Set
+from typing import Any, Dict, Generator, List, Optional, Set
 from unittest import TestCase, mock
 from unittest.mock import Mock
 
@@ -16,6 +16,7 @@ import pytest
 from airbyte_cdk.sources.file_based.config.csv_format import (
     DEFAULT_FALSE_VALUES,
     DEFAULT_TRUE_VALUES,
+    CsvEngine,
     CsvFormat,
     CsvHeaderAutogenerated,
     CsvHeaderUserProvided,
@@ -24,7 +25,7 @@ from airbyte_cdk.sources.file_based.config.csv_format import (
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
 from airbyte_cdk.sources.file_based.exceptions import RecordParseError
 from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader, FileReadMode
-from airbyte_cdk.sources.file_based.file_types.csv_parser import CsvParser, _CsvReader
+from airbyte_cdk.sources.file_based.file_types.csv_parser import CsvParser, _CsvReader, _PyArrowCsvReader
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 
 PROPERTY_TYPES = {
@@ -307,6 +308,23 @@ class CsvReaderTest(unittest.TestCase):
         with pytest.raises(RecordParseError):
             list(self._read_data())
 
+    def test_given_columns_when_read_data_then_only_return_these_columns(self) -> None:
+        self._stream_reader.open_file.return_value = CsvFileBuilder().with_data(["first,second,third", "0,1,2", "", "3,4,5"]).build()
+
+        data_generator = self._read_data(columns={"first", "third", "not in file"})
+
+        assert list(data_generator) == [{"first": "0", "third": "2"}, {"first": "3", "third": "5"}]
+
+    def test_given_columns_and_len_mismatch_when_read_data_then_raise_error(self) -> None:
+        self._stream_reader.open_file.return_value = CsvFileBuilder().with_data(["first,second", "0,1", "0,1,2"]).build()
+
+        data_generator = self._read_data(columns={"first"})
+
+        assert next(data_generator) == {"first": "0"}
+        with pytest.raises(RecordParseError):
+            next(data_generator)
+        assert f"{self._CONFIG_NAME}_config_dialect" not in csv.list_dialects()
+
     def test_given_skip_rows_after_header_when_read_data_then_do_not_parse_skipped_rows(self) -> None:
         self._config_format.skip_rows_after_header = 1
         self._stream_reader.open_file.return_value = (
@@ -475,13 +493,14 @@ class CsvReaderTest(unittest.TestCase):
             next(data_generator)
         assert f"{self._CONFIG_NAME}_config_dialect" not in csv.list_dialects()
 
-    def _read_data(self) -> Generator[Dict[str, str], None, None]:
+    def _read_data(self, columns: Optional[Set[str]] = None) -> Generator[Dict[str, str], None, None]:
         data_generator = self._csv_reader.read_data(
             self._config,
             self._file,
             self._stream_reader,
             self._logger,
             FileReadMode.READ,
+            columns,
         )
         return data_generator
 
@@ -518,3 +537,117 @@ def test_encoding_is_passed_to_stream_reader() -> None:
             mock.call().__exit__(None, None, None),
         ]
     )
+
+
+def test_parse_records_only_reads_the_columns_of_the_schema() -> None:
+    csv_reader = Mock(spec=_CsvReader)
+    csv_reader.read_data.return_value = (row for row in [{"c1": "1"}])
+    parser = CsvParser(csv_reader)
+    file = RemoteFile(uri="s3://bucket/key.csv", last_modified=datetime.now())
+    config = FileBasedStreamConfig(name="test", validation_policy="Emit Record", file_type="csv", format=CsvFormat())
+
+    records = list(parser.parse_records(config, file, Mock(), logger, {"properties": {"c1": {"type": "integer"}, "c2": {"type": "string"}}}))
+
+    assert records == [{"c1": 1}]
+    assert csv_reader.read_data.call_args.args[-1] == {"c1", "c2"}
+
+
+class _InMemoryStreamReader:
+    def __init__(self, content: str, encoding: str = "utf8") -> None:
+        self._content = content.encode(encoding)
+        self.open_files: List[io.IOBase] = []
+
+    def open_file(self, file: RemoteFile, mode: FileReadMode, encoding: Optional[str], logger: logging.Logger) -> io.IOBase:
+        opened_file: io.IOBase = io.BytesIO(self._content)
+        if mode == FileReadMode.READ:
+            opened_file = io.TextIOWrapper(opened_file, encoding=encoding, newline="")
+        self.open_files.append(opened_file)
+        return opened_file
+
+
+def _parse_with_engine(engine: CsvEngine, content: str, csv_format: CsvFormat, schema: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    config = FileBasedStreamConfig(
+        name="test", validation_policy="Emit Record", file_type="csv", format=csv_format.copy(update={"engine": engine})
+    )
+    file = RemoteFile(uri="s3://bucket/key.csv", last_modified=datetime.now())
+    logger = Mock(spec=logging.Logger)
+    records = []
+    error = None
+    try:
+        for record in CsvParser().parse_records(
+            config, file, _InMemoryStreamReader(content, csv_format.encoding), logger, schema  # type: ignore
+        ):
+            records.append(record)
+    except RecordParseError as exc:
+        error = exc.__class__
+    return {"records": records, "error": error, "warnings": logger.warning.call_args_list}
+
+
+_TYPED_SCHEMA = {
+    "properties": {
+        "id": {"type": "integer"},
+        "amount": {"type": "number"},
+        "active": {"type": "boolean"},
+        "name": {"type": "string"},
+        "nullable_name": {"type": ["null", "string"]},
+        "tags": {"type": "array"},
+    }
+}
+_TYPED_CSV = "\n".join(
+    [
+        "id,amount,active,name,nullable_name,tags,ignored",
+        "1,12.5,true,a name,NA,not a list,x",
+        "-20,1e3,0,NA,another name,NA,x",
+        '+3,.5,yes,"multi\nline",,"a,b",x',
+        "1_000,NA,maybe,,NA,,x",
+        "NA,-0.25,f, spaces ,x,not a list,x",
+        "99999999999999999999,inf,off,a,b,NA,x",
+    ]
+)
+
+
+@pytest.mark.parametrize(
+    "content, csv_format, schema",
+    [
+        pytest.param(_TYPED_CSV, CsvFormat(null_values={"NA"}), _TYPED_SCHEMA, id="test_typed_columns"),
+        pytest.param(_TYPED_CSV, CsvFormat(null_values={"NA"}, strings_can_be_null=False), _TYPED_SCHEMA, id="test_strings_are_not_null"),
+        pytest.param(_TYPED_CSV, CsvFormat(null_values={"NA"}), None, id="test_no_schema"),
+        pytest.param(
+            "header_a,header_b\n1,2\n3,4,5\n6,7", CsvFormat(), {"properties": {"header_a": {"type": "integer"}}}, id="test_invalid_row"
+        ),
+        pytest.param("header_a,header_b\n", CsvFormat(), None, id="test_header_only"),
+        pytest.param(
+            "first line\nsecond line\nh,h,other\n1,2,3\n4,5,6\n",
+            CsvFormat(skip_rows_before_header=2, skip_rows_after_header=1),
+            {"properties": {"h": {"type": "integer"}}},
+            id="test_skipped_rows_and_repeated_headers",
+        ),
+        pytest.param(
+            "1;é\n2;à\n",
+            CsvFormat(delimiter=";", encoding="latin-1", header_definition=CsvHeaderAutogenerated()),
+            {"properties": {"f0": {"type": "integer"}, "f1": {"type": "string"}}},
+            id="test_autogenerated_headers_and_encoding",
+        ),
+    ],
+)
+def test_pyarrow_engine_reads_the_same_records_as_the_python_engine(content, csv_format, schema) -> None:
+    python_output = _parse_with_engine(CsvEngine.PYTHON, content, csv_format, schema)
+    pyarrow_output = _parse_with_engine(CsvEngine.PYARROW, content, csv_format, schema)
+
+    assert pyarrow_output == python_output
+
+
+@mock.patch.object(_PyArrowCsvReader, "BLOCK_SIZE", 64)
+def test_pyarrow_engine_stops_reading_when_records_are_not_all_read() -> None:
+    content = "\n".join(["id,name"] + [f'{index},"name\n{index}"' for index in range(1_000)])
+    config = FileBasedStreamConfig(
+        name="test", validation_policy="Emit Record", file_type="csv", format=CsvFormat(engine=CsvEngine.PYARROW)
+    )
+    file = RemoteFile(uri="s3://bucket/key.csv", last_modified=datetime.now())
+    for _ in range(100):
+        stream_reader = _InMemoryStreamReader(content)
+        records = CsvParser().parse_records(config, file, stream_reader, logger, {"properties": {"id": {"type": "integer"}}})  # type: ignore
+
+        assert next(records) == {"id": 0}
+        records.close()  # type: ignore
+        assert stream_reader.open_files[0].closed
@@ -108,11 +108,24 @@ def test_given_multiline_json_objects_and_read_limit_hit_when_infer_then_return_
 
 
 def test_given_multiline_json_objects_and_hits_read_limit_when_infer_then_return_proper_types(stream_reader: MagicMock) -> None:
-    stream_reader.open_file.return_value.__enter__.return_value = JSONL_CONTENT_WITH_MULTILINE_JSON_OBJECTS
+    stream_reader.open_file.return_value.__enter__.return_value = io.BytesIO(b"\n".join(JSONL_CONTENT_WITH_MULTILINE_JSON_OBJECTS))
     schema = _infer_schema(stream_reader)
     assert schema == {"a": {"type": "integer"}, "b": {"type": "string"}}
 
 
+def test_given_invalid_line_and_read_limit_hit_when_infer_then_stop_reading(stream_reader: MagicMock) -> None:
+    record = b'{"key": "' + b"a" * 1000 + b'"}'
+    file = io.BytesIO(
+        b"\n".join([record, b'{"key": "not closed'] + [record] * (10 * JsonlParser.MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE // len(record)))
+    )
+    stream_reader.open_file.return_value.__enter__.return_value = file
+
+    schema = _infer_schema(stream_reader)
+
+    assert schema == {"key": {"type": "string"}}
+    assert file.tell() < 2 * JsonlParser.MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE + JsonlParser.BLOCK_SIZE
+
+
 def test_given_multiple_records_then_merge_types(stream_reader: MagicMock) -> None:
     stream_reader.open_file.return_value.__enter__.return_value = io.BytesIO('{"col1": 1}\n{"col1": 2.3}'.encode("utf-8"))
     schema = _infer_schema(stream_reader)
@@ -120,13 +133,13 @@ def test_given_multiple_records_then_merge_types(stream_reader: MagicMock) -> No
 
 
 def test_given_one_json_per_line_when_parse_records_then_return_records(stream_reader: MagicMock) -> None:
-    stream_reader.open_file.return_value.__enter__.return_value = JSONL_CONTENT_WITHOUT_MULTILINE_JSON_OBJECTS
+    stream_reader.open_file.return_value.__enter__.return_value = io.BytesIO(b"\n".join(JSONL_CONTENT_WITHOUT_MULTILINE_JSON_OBJECTS))
     records = list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, Mock(), None))
     assert records == [{"a": 1, "b": "1"}, {"a": 2, "b": "2"}]
 
 
 def test_given_one_json_per_line_when_parse_records_then_do_not_send_warning(stream_reader: MagicMock) -> None:
-    stream_reader.open_file.return_value.__enter__.return_value = JSONL_CONTENT_WITHOUT_MULTILINE_JSON_OBJECTS
+    stream_reader.open_file.return_value.__enter__.return_value = io.BytesIO(b"\n".join(JSONL_CONTENT_WITHOUT_MULTILINE_JSON_OBJECTS))
     logger = Mock()
 
     list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, logger, None))
@@ -135,13 +148,13 @@ def test_given_one_json_per_line_when_parse_records_then_do_not_send_warning(str
 
 
 def test_given_multiline_json_object_when_parse_records_then_return_records(stream_reader: MagicMock) -> None:
-    stream_reader.open_file.return_value.__enter__.return_value = JSONL_CONTENT_WITH_MULTILINE_JSON_OBJECTS
+    stream_reader.open_file.return_value.__enter__.return_value = io.BytesIO(b"\n".join(JSONL_CONTENT_WITH_MULTILINE_JSON_OBJECTS))
     records = list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, Mock(), None))
     assert records == [{"a": 1, "b": "1"}, {"a": 2, "b": "2"}]
 
 
 def test_given_multiline_json_object_when_parse_records_then_log_once_one_record_yielded(stream_reader: MagicMock) -> None:
-    stream_reader.open_file.return_value.__enter__.return_value = JSONL_CONTENT_WITH_MULTILINE_JSON_OBJECTS
+    stream_reader.open_file.return_value.__enter__.return_value = io.BytesIO(b"\n".join(JSONL_CONTENT_WITH_MULTILINE_JSON_OBJECTS))
     logger = Mock()
 
     next(iter(JsonlParser().parse_records(Mock(), Mock(), stream_reader, logger, None)))
@@ -150,9 +163,57 @@ def test_given_multiline_json_object_when_parse_records_then_log_once_one_record
 
 
 def test_given_unparsable_json_when_parse_records_then_raise_error(stream_reader: MagicMock) -> None:
-    stream_reader.open_file.return_value.__enter__.return_value = INVALID_JSON_CONTENT
+    stream_reader.open_file.return_value.__enter__.return_value = io.BytesIO(b"\n".join(INVALID_JSON_CONTENT))
     logger = Mock()
 
     with pytest.raises(RecordParseError):
         list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, logger, None))
     assert logger.warning.call_count == 0
+
+
+@pytest.mark.parametrize("block_size", [1, 7, 64 * 1024])
+@pytest.mark.parametrize(
+    "content, expected_records",
+    [
+        pytest.param(b'{"a": 1}\n{"a": 2}\n', [{"a": 1}, {"a": 2}], id="test_one_json_per_line"),
+        pytest.param(b'{"a": 1}\r\n\n  \n{"a": 2}', [{"a": 1}, {"a": 2}], id="test_crlf_blank_lines_and_no_trailing_line_feed"),
+        pytest.param('{"a": "é☃"}\n'.encode("utf-8"), [{"a": "é☃"}], id="test_multibyte_characters"),
+        pytest.param(
+            b'{"a": NaN, "b": 123456789012345678901234567890}',
+            [{"a": float("nan"), "b": 123456789012345678901234567890}],
+            id="test_values_only_supported_by_json",
+        ),
+        pytest.param(
+            b'{"a": 1}\n{\n  "a": 2\n}\n{"a": 3} {"a": 4}\n{"a":\n5}', [{"a": i} for i in range(1, 6)], id="test_multiline_after_lines"
+        ),
+    ],
+)
+def test_given_blocks_when_parse_records_then_return_records(
+    stream_reader: MagicMock, block_size: int, content: bytes, expected_records
+) -> None:
+    stream_reader.open_file.return_value.__enter__.return_value = io.BytesIO(content)
+    parser = JsonlParser()
+    parser.BLOCK_SIZE = block_size
+
+    records = list(parser.parse_records(Mock(), Mock(), stream_reader, Mock(), None))
+
+    # NaN is not equal to itself
+    assert json.dumps(records) == json.dumps(expected_records)
+
+
+def test_given_multiline_json_objects_after_lines_when_parse_records_then_log_once(stream_reader: MagicMock) -> None:
+    stream_reader.open_file.return_value.__enter__.return_value = io.BytesIO(b'{"a": 1}\n{\n"a": 2\n}\n{\n"a": 3\n}')
+    logger = Mock()
+
+    records = list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, logger, None))
+
+    assert records == [{"a": 1}, {"a": 2}, {"a": 3}]
+    assert logger.warning.call_count == 1
+
+
+def test_given_invalid_json_after_records_when_parse_records_then_return_records_before(stream_reader: MagicMock) -> None:
+    stream_reader.open_file.return_value.__enter__.return_value = io.BytesIO(b'{"a": 1}\n{"a": 2}\nnot json\n{"a": 3}')
+
+    records = list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, Mock(), None))
+
+    assert records == [{"a": 1}, {"a": 2}]
@@ -4,11 +4,14 @@
 
 import asyncio
 import datetime
+import decimal
+import io
 import math
 from typing import Any, Mapping, Union
 from unittest.mock import Mock
 
 import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 from airbyte_cdk.sources.file_based.config.csv_format import CsvFormat
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig, ValidationPolicy
@@ -17,6 +20,7 @@ from airbyte_cdk.sources.file_based.config.parquet_format import ParquetFormat
 from airbyte_cdk.sources.file_based.file_types import ParquetParser
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from pyarrow import Scalar
+from unit_tests.sources.file_based.test_range_reader import RequestCountingFile
 
 _default_parquet_format = ParquetFormat()
 _decimal_as_float_parquet_format = ParquetFormat(decimal_as_float=True)
@@ -82,9 +86,7 @@ def test_type_mapping(parquet_type: pa.DataType, expected_type: Mapping[str, str
         assert ParquetParser.parquet_type_to_schema_type(parquet_type, parquet_format) == expected_type
 
 
-@pytest.mark.parametrize(
-    "pyarrow_type, parquet_format, parquet_object, expected_value",
-    [
+_VALUE_TRANSFORMATION_PARAMS = [
         pytest.param(pa.bool_(), _default_parquet_format, True, True, id="test_bool"),
         pytest.param(pa.int8(), _default_parquet_format, -1, -1, id="test_int8"),
         pytest.param(pa.int16(), _default_parquet_format, 2, 2, id="test_int16"),
@@ -134,8 +136,10 @@ def test_type_mapping(parquet_type: pa.DataType, expected_type: Mapping[str, str
         pytest.param(pa.map_(pa.string(), pa.int32()), _default_parquet_format, {"hello": 1, "world": 2}, {"hello": 1, "world": 2},
                      id="test_map"),
         pytest.param(pa.null(), _default_parquet_format, None, None, id="test_null"),
-    ]
-)
+]
+
+
+@pytest.mark.parametrize("pyarrow_type, parquet_format, parquet_object, expected_value", _VALUE_TRANSFORMATION_PARAMS)
 def test_value_transformation(pyarrow_type: pa.DataType, parquet_format: ParquetFormat, parquet_object: Scalar,
                               expected_value: Any) -> None:
     pyarrow_value = pa.array([parquet_object], type=pyarrow_type)[0]
@@ -156,6 +160,138 @@ def test_value_dictionary() -> None:
     assert py_value == {"indices": [0, 1, 2, 0, 1], "values": ["apple", "banana", "cherry"]}
 
 
+@pytest.mark.parametrize("pyarrow_type, parquet_format, parquet_object, expected_value", _VALUE_TRANSFORMATION_PARAMS)
+def test_column_transformation(pyarrow_type: pa.DataType, parquet_format: ParquetFormat, parquet_object: Scalar,
+                               expected_value: Any) -> None:
+    pyarrow_column = pa.array([parquet_object, None, parquet_object], type=pyarrow_type)
+    py_values = ParquetParser._to_output_values(pyarrow_column, parquet_format)
+    assert py_values == [ParquetParser._to_output_value(pyarrow_column[0], parquet_format), None, py_values[0]]
+
+
+def test_column_dictionary() -> None:
+    dictionary = pa.DictionaryArray.from_arrays(pa.array([0, None, 1], type=pa.int8()), ["apple", "banana"])
+    py_values = ParquetParser._to_output_values(dictionary, _default_parquet_format)
+    assert py_values == [{"indices": [0], "values": ["apple", "banana"]}, None, {"indices": [1], "values": ["apple", "banana"]}]
+
+
+def _parquet_file(table: pa.Table, row_group_size: int) -> io.BytesIO:
+    fp = io.BytesIO()
+    pq.write_table(table, fp, row_group_size=row_group_size)
+    fp.seek(0)
+    return fp
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 3, 100])
+def test_parse_records_in_batches(batch_size: int) -> None:
+    table = pa.table(
+        {
+            "id": pa.array([1, 2, 3, 4, 5], type=pa.int64()),
+            "created_at": pa.array([datetime.datetime(2023, 1, i) for i in range(1, 5)] + [None], type=pa.timestamp("s")),
+            "amount": pa.array([decimal.Decimal("1.50"), None, decimal.Decimal("3.00"), decimal.Decimal("4.25"), decimal.Decimal("5.00")],
+                               type=pa.decimal128(5, 2)),
+        }
+    )
+    parquet_format = ParquetFormat(batch_size=batch_size)
+    config = FileBasedStreamConfig(name="test", file_type="parquet", format=parquet_format,
+                                   validation_policy=ValidationPolicy.emit_record)
+    file = RemoteFile(uri="s3://mybucket/year=2023/test.parquet", last_modified=datetime.datetime.now())
+    stream_reader = Mock()
+    stream_reader.open_file.return_value.__enter__ = Mock(return_value=_parquet_file(table, row_group_size=3))
+    stream_reader.open_file.return_value.__exit__ = Mock(return_value=None)
+
+    records = list(ParquetParser().parse_records(config, file, stream_reader, Mock(), None))
+
+    assert records == [
+        {"id": 1, "created_at": "2023-01-01T00:00:00", "amount": "1.50", "year": "2023"},
+        {"id": 2, "created_at": "2023-01-02T00:00:00", "amount": None, "year": "2023"},
+        {"id": 3, "created_at": "2023-01-03T00:00:00", "amount": "3.00", "year": "2023"},
+        {"id": 4, "created_at": "2023-01-04T00:00:00", "amount": "4.25", "year": "2023"},
+        {"id": 5, "created_at": None, "amount": "5.00", "year": "2023"},
+    ]
+
+
+def _wide_table(n_columns: int, n_rows: int) -> pa.Table:
+    return pa.table({f"column_{index}": pa.array([f"value {row} {index}" for row in range(n_rows)]) for index in range(n_columns)})
+
+
+def _counting_stream_reader(content: bytes) -> Mock:
+    file = RequestCountingFile(content)
+    stream_reader = Mock()
+    stream_reader.open_file.return_value.__enter__ = Mock(return_value=file)
+    stream_reader.open_file.return_value.__exit__ = Mock(return_value=None)
+    stream_reader.file = file
+    return stream_reader
+
+
+def test_parse_records_fetches_each_row_group_with_one_request() -> None:
+    table = _wide_table(n_columns=50, n_rows=300)
+    content = _parquet_file(table, row_group_size=100).getvalue()
+    config = FileBasedStreamConfig(name="test", file_type="parquet", validation_policy=ValidationPolicy.emit_record)
+    file = RemoteFile(uri="s3://mybucket/test.parquet", last_modified=datetime.datetime.now())
+
+    direct_stream_reader = _counting_stream_reader(content)
+    direct_records = [dict(zip(table.column_names, row)) for row in zip(*table.to_pydict().values())]
+    with direct_stream_reader.open_file() as fp:
+        assert pq.ParquetFile(fp).read().to_pylist() == direct_records
+    stream_reader = _counting_stream_reader(content)
+    records = list(ParquetParser().parse_records(config, file, stream_reader, Mock(), None))
+
+    assert records == direct_records
+    # One request for the footer and one per row group
+    assert len(stream_reader.file.requests) == 1 + 3
+    assert len(direct_stream_reader.file.requests) > 50
+
+
+@pytest.mark.parametrize(
+    "validation_policy, schemaless, expected_columns",
+    [
+        pytest.param(ValidationPolicy.emit_record, False, ["column_1", "column_3"], id="selected-columns"),
+        pytest.param(ValidationPolicy.skip_record, False, ["column_0", "column_1", "column_2", "column_3"], id="skip-record-reads-all"),
+        pytest.param(ValidationPolicy.emit_record, True, ["column_0", "column_1", "column_2", "column_3"], id="schemaless-reads-all"),
+    ],
+)
+def test_parse_records_only_reads_the_columns_of_the_catalog(validation_policy, schemaless, expected_columns) -> None:
+    table = _wide_table(n_columns=4, n_rows=3)
+    content = _parquet_file(table, row_group_size=10).getvalue()
+    config = FileBasedStreamConfig(name="test", file_type="parquet", validation_policy=validation_policy, schemaless=schemaless)
+    file = RemoteFile(uri="s3://mybucket/test.parquet", last_modified=datetime.datetime.now())
+    catalog_schema = {"type": "object", "properties": {"column_1": {"type": "string"}, "column_3": {"type": "string"}, "other": {}}}
+
+    records = list(ParquetParser().parse_records(config, file, _counting_stream_reader(content), Mock(), catalog_schema))
+
+    assert records == [{column: table.column(column)[row].as_py() for column in expected_columns} for row in range(3)]
+
+
+def test_column_chunk_ranges_of_nested_columns() -> None:
+    table = pa.table({"a": pa.array([{"b": 1, "c": "x"}]), "a.d": pa.array([1]), "e": pa.array([1])})
+    row_group = pq.ParquetFile(_parquet_file(table, row_group_size=10)).metadata.row_group(0)
+
+    assert len(ParquetParser._get_column_chunk_ranges(row_group, None)) == 4
+    # The column chunk of column "a.d" has the same path as a field "d" of column "a" would have, so it is fetched too
+    assert len(ParquetParser._get_column_chunk_ranges(row_group, ["a"])) == 3
+    assert len(ParquetParser._get_column_chunk_ranges(row_group, ["e"])) == 1
+    assert len(ParquetParser._get_column_chunk_ranges(row_group, ["a.d", "e"])) == 2
+
+
+def test_column_transformation_is_the_same_as_scalar_transformation() -> None:
+    table = pa.table(
+        {
+            "id": pa.array(range(2000), type=pa.int64()),
+            "created_at": pa.array([datetime.datetime(2023, 1, 1)] * 2000, type=pa.timestamp("s")),
+            "name": pa.array(["name"] * 2000, type=pa.string()),
+        }
+    )
+
+    scalar_rows = [
+        {column: ParquetParser._to_output_value(table.column(column)[row], _default_parquet_format) for column in table.column_names}
+        for row in range(table.num_rows)
+    ]
+    columns = [ParquetParser._to_output_values(column, _default_parquet_format) for column in table.to_batches()[0].columns]
+    column_rows = [dict(zip(table.column_names, row)) for row in zip(*columns)]
+
+    assert column_rows == scalar_rows
+
+
 @pytest.mark.parametrize(
     "file_format", [
         pytest.param(CsvFormat(
@@ -234,6 +234,12 @@ single_csv_scenario = (
                                                     "items": {"type": "string"},
                                                     "uniqueItems": True,
                                                 },
+                                                "engine": {
+                                                    "title": "Parsing Engine",
+                                                    "description": "The engine parsing the CSV data. `PyArrow` parses the files by blocks of rows and casts the values column by column, which is faster for large files. Both engines read the same records, but `PyArrow` does not support rows larger than 1 MB.",
+                                                    "default": "Python",
+                                                    "enum": ["Python", "PyArrow"],
+                                                },
                                                 "inference_type": {
                                                     "title": "Inference Type",
                                                     "description": "How to infer the types of the columns. If none, inference default to strings.",
@@ -266,6 +272,13 @@ single_csv_scenario = (
                                                     "default": False,
                                                     "type": "boolean",
                                                 },
+                                                "batch_size": {
+                                                    "title": "Record Batch Size",
+                                                    "description": "The maximum number of rows read from the file at once. Smaller batches use less memory when rows are wide or row groups are large.",
+                                                    "default": 10000,
+                                                    "exclusiveMinimum": 0,
+                                                    "type": "integer",
+                                                },
                                             },
                                         },
                                     ],
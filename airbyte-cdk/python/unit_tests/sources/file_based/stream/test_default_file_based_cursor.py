@@ -3,6 +3,7 @@
 #
 
 from datetime import datetime, timedelta
+from random import Random
 from typing import Any, List, Mapping
 from unittest.mock import MagicMock
 
@@ -266,3 +267,56 @@ def get_cursor(max_history_size: int, days_to_sync_if_history_is_full: int) -> D
     config = FileBasedStreamConfig(
         file_type="csv", name="test", validation_policy=ValidationPolicy.emit_record, days_to_sync_if_history_is_full=days_to_sync_if_history_is_full)
     return cursor_cls(config)
+
+
+def test_history_index_matches_history() -> None:
+    random = Random(0)
+    cursor = get_cursor(50, 3)
+    start = datetime(2023, 1, 1)
+    cursor.set_initial_state(
+        {"history": {f"initial_{i}.csv": (start + timedelta(minutes=i)).strftime(DefaultFileBasedCursor.DATE_TIME_FORMAT) for i in range(50)}}
+    )
+
+    for _ in range(2_000):
+        # Files are added in any order and files already in the history can move forward or back in time
+        uri = f"{random.randrange(200)}.csv"
+        cursor.add_file(RemoteFile(uri=uri, last_modified=start + timedelta(minutes=random.randrange(500)), file_type="csv"))
+
+        history = cursor.get_state()["history"]
+        assert len(history) == 50
+        latest_file, latest_timestamp = max(history.items(), key=lambda x: (x[1], x[0]))
+        assert cursor.get_state()[DefaultFileBasedCursor.CURSOR_FIELD] == f"{latest_timestamp}_{latest_file}"
+        earliest_file, earliest_timestamp = min(history.items(), key=lambda x: (x[1], x[0]))
+        assert cursor._compute_earliest_file_in_history() == RemoteFile(
+            uri=earliest_file, last_modified=datetime.strptime(earliest_timestamp, DefaultFileBasedCursor.DATE_TIME_FORMAT)
+        )
+
+
+def test_updated_file_is_synced_after_its_history_entry_is_parsed() -> None:
+    cursor = get_cursor(10, 3)
+    cursor.set_initial_state({"history": {"a.csv": "2023-01-01T00:00:00.000000Z", "b.csv": "2023-01-01T00:00:00.000Z"}})
+    logger = MagicMock()
+    files = [
+        RemoteFile(uri="a.csv", last_modified=datetime(2023, 1, 1), file_type="csv"),
+        RemoteFile(uri="b.csv", last_modified=datetime(2023, 1, 1), file_type="csv"),
+    ]
+    assert list(cursor.get_files_to_sync(files, logger)) == []
+
+    cursor.add_file(RemoteFile(uri="a.csv", last_modified=datetime(2023, 1, 2), file_type="csv"))
+    updated_files = [RemoteFile(uri="a.csv", last_modified=datetime(2023, 1, 3), file_type="csv")]
+    assert list(cursor.get_files_to_sync(updated_files, logger)) == updated_files
+
+
+def test_add_files_when_history_is_full() -> None:
+    cursor = get_cursor(10, 3)
+    start = datetime(2023, 1, 1)
+    files = [RemoteFile(uri=f"{i}.csv", last_modified=start + timedelta(seconds=i), file_type="csv") for i in range(100)]
+
+    for i, file in enumerate(cursor.get_files_to_sync(files, MagicMock())):
+        cursor.add_file(file)
+        history = cursor.get_state()["history"]
+        assert sorted(history, key=lambda uri: int(uri.split(".")[0])) == [f"{j}.csv" for j in range(max(0, i - 9), i + 1)]
+        assert cursor._compute_earliest_file_in_history() == files[max(0, i - 9)]
+
+    state = cursor.get_state()
+    assert state[DefaultFileBasedCursor.CURSOR_FIELD] == f"{files[-1].last_modified.strftime(DefaultFileBasedCursor.DATE_TIME_FORMAT)}_99.csv"
@@ -2,6 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import time
 import unittest
 from datetime import datetime, timezone
 from typing import Any, Iterable, Iterator, Mapping
@@ -11,8 +12,10 @@ import pytest
 from airbyte_cdk.models import Level
 from airbyte_cdk.sources.file_based.availability_strategy import AbstractFileBasedAvailabilityStrategy
 from airbyte_cdk.sources.file_based.discovery_policy import AbstractDiscoveryPolicy
+from airbyte_cdk.sources.file_based.exceptions import FileBasedSourceError, StopSyncPerValidationPolicy
 from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader
 from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser
+from airbyte_cdk.sources.file_based.listing_cache import ListingCache
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.sources.file_based.schema_validation_policies import AbstractSchemaValidationPolicy
 from airbyte_cdk.sources.file_based.stream.cursor import AbstractFileBasedCursor
@@ -72,6 +75,7 @@ class DefaultFileBasedStreamTest(unittest.TestCase):
         self._stream_reader = Mock(spec=AbstractFileBasedStreamReader)
         self._availability_strategy = Mock(spec=AbstractFileBasedAvailabilityStrategy)
         self._discovery_policy = Mock(spec=AbstractDiscoveryPolicy)
+        self._discovery_policy.n_concurrent_file_reads = 1
         self._parser = Mock(spec=FileTypeParser)
         self._validation_policy = Mock(spec=AbstractSchemaValidationPolicy)
         self._validation_policy.name = "validation policy name"
@@ -88,6 +92,30 @@ class DefaultFileBasedStreamTest(unittest.TestCase):
             cursor=self._cursor,
         )
 
+    def test_given_listing_cache_when_list_files_then_streams_with_the_same_globs_share_the_listing(self) -> None:
+        self._stream_config.globs = ["*.csv"]
+        self._stream_config.legacy_prefix = None
+        self._stream_reader.config = None
+        self._stream_reader.get_matching_files.return_value = [RemoteFile(uri="a.csv", last_modified=self._NOW)]
+        listing_cache = ListingCache()
+        streams = [
+            DefaultFileBasedStream(
+                config=self._stream_config,
+                catalog_schema=self._catalog_schema,
+                stream_reader=self._stream_reader,
+                availability_strategy=self._availability_strategy,
+                discovery_policy=self._discovery_policy,
+                parsers={self._FILE_TYPE: self._parser},
+                validation_policy=self._validation_policy,
+                cursor=self._cursor,
+                listing_cache=listing_cache,
+            )
+            for _ in range(2)
+        ]
+
+        assert [stream.list_files() for stream in streams] == [[RemoteFile(uri="a.csv", last_modified=self._NOW)]] * 2
+        self._stream_reader.get_matching_files.assert_called_once_with(["*.csv"], None, streams[0].logger)
+
     def test_when_read_records_from_slice_then_return_records(self) -> None:
         self._parser.parse_records.return_value = [self._A_RECORD]
         messages = list(self._stream.read_records_from_slice({"files": [RemoteFile(uri="uri", last_modified=self._NOW)]}))
@@ -123,6 +151,61 @@ class DefaultFileBasedStreamTest(unittest.TestCase):
         assert messages[0].log.level == Level.ERROR
         assert messages[1].log.level == Level.WARN
 
+    def test_given_concurrent_file_reads_when_read_records_from_slice_then_emit_files_in_order(self) -> None:
+        self._discovery_policy.n_concurrent_file_reads = 3
+        self._stream_config.schemaless = False
+        self._validation_policy.record_passes_validation_policy.return_value = True
+        files = [RemoteFile(uri=f"file_{i}", last_modified=self._NOW) for i in range(10)]
+        events = []
+
+        def parse_records(config: Any, file: RemoteFile, *args: Any) -> Iterable[Mapping[str, Any]]:
+            # Files further in the slice are faster to read to make sure the order does not depend on how long files take to read
+            time.sleep(0.001 * (10 - int(file.uri.split("_")[1])))
+            for i in range(3):
+                yield {"file": file.uri, "record": i}
+
+        self._parser.parse_records.side_effect = parse_records
+        self._cursor.add_file.side_effect = lambda file: events.append(("add_file", file.uri))
+
+        for message in self._stream.read_records_from_slice({"files": files}):
+            events.append(("record", message.record.data["file"]))
+
+        assert events == [event for file in files for event in [("record", file.uri)] * 3 + [("add_file", file.uri)]]
+
+    def test_given_concurrent_file_reads_and_exception_when_read_records_from_slice_then_do_process_other_files(self) -> None:
+        self._discovery_policy.n_concurrent_file_reads = 2
+        self._stream_config.schemaless = True
+        self._parser.parse_records.side_effect = [
+            self._iter([self._A_RECORD, ValueError("An error")]),
+            [self._A_RECORD],
+            [self._A_RECORD],
+        ]
+
+        messages = list(self._stream.read_records_from_slice({"files": [
+            RemoteFile(uri="invalid_file", last_modified=self._NOW),
+            RemoteFile(uri="valid_file", last_modified=self._NOW),
+            RemoteFile(uri="another_valid_file", last_modified=self._NOW),
+        ]}))
+
+        assert messages[0].record.data["data"] == self._A_RECORD
+        assert messages[1].log.level == Level.ERROR
+        assert "file=invalid_file line_no=1" in messages[1].log.message
+        assert [message.record.data["data"] for message in messages[2:]] == [self._A_RECORD, self._A_RECORD]
+        assert [call.args[0].uri for call in self._cursor.add_file.call_args_list] == ["valid_file", "another_valid_file"]
+
+    def test_given_concurrent_file_reads_and_validation_policy_stops_sync_when_read_records_from_slice_then_stop_reading(self) -> None:
+        self._discovery_policy.n_concurrent_file_reads = 2
+        self._stream_config.schemaless = False
+        self._validation_policy.record_passes_validation_policy.side_effect = StopSyncPerValidationPolicy(FileBasedSourceError.STOP_SYNC_PER_SCHEMA_VALIDATION_POLICY)
+        self._parser.parse_records.side_effect = lambda *args: iter([self._A_RECORD] * 10_000)
+
+        messages = list(self._stream.read_records_from_slice({"files": [RemoteFile(uri=f"file_{i}", last_modified=self._NOW) for i in range(5)]}))
+
+        assert len(messages) == 1
+        assert messages[0].log.level == Level.WARN
+        assert "file=file_0" in messages[0].log.message
+        self._cursor.add_file.assert_not_called()
+
     def _iter(self, x: Iterable[Any]) -> Iterator[Any]:
         for item in x:
             if isinstance(item, Exception):
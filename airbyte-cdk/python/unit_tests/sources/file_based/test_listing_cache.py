@@ -0,0 +1,163 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import gzip
+import logging
+import os
+import threading
+from datetime import datetime, timedelta
+from io import IOBase
+from typing import Any, Iterable, List, Mapping, Optional
+from unittest.mock import patch
+
+import pytest
+from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader, FileReadMode
+from airbyte_cdk.sources.file_based.listing_cache import ListingCache
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+
+logger = logging.getLogger("test")
+
+FILES = [
+    RemoteFile(uri="a.csv", last_modified=datetime(2023, 6, 5, 3, 54, 7)),
+    RemoteFile(uri="b.csv", last_modified=datetime(2023, 6, 6, 3, 54, 7, 123456)),
+    RemoteFile(uri="c.jsonl", last_modified=datetime(2023, 6, 7, 3, 54, 7)),
+]
+
+
+class _Config:
+    def __init__(self, secret: str):
+        self.secret = secret
+
+    def dict(self, exclude: Any = None) -> Mapping[str, Any]:
+        return {"secret": self.secret, "start_date": None}
+
+
+class CountingStreamReader(AbstractFileBasedStreamReader):
+    def __init__(self, secret: str = "a secret"):
+        super().__init__()
+        self._config = _Config(secret)
+        self.listings = 0
+        self._listings_lock = threading.Lock()
+
+    @property
+    def config(self) -> Any:
+        return self._config
+
+    @config.setter
+    def config(self, value: Any) -> None:
+        self._config = value
+
+    def get_matching_files(self, globs: List[str], prefix: Optional[str], logger: logging.Logger) -> Iterable[RemoteFile]:
+        with self._listings_lock:
+            self.listings += 1
+        return [file for file in FILES if self.file_matches_globs(file, globs)]
+
+    def open_file(self, file: RemoteFile, mode: FileReadMode, encoding: Optional[str], logger: logging.Logger) -> IOBase:
+        raise NotImplementedError()
+
+
+class OtherCountingStreamReader(CountingStreamReader):
+    pass
+
+
+def test_listing_is_shared_by_streams_with_the_same_globs():
+    reader = CountingStreamReader()
+    cache = ListingCache()
+
+    first = cache.get_matching_files(reader, ["*.csv"], None, logger)
+    second = cache.get_matching_files(reader, ["*.csv"], None, logger)
+    other_globs = cache.get_matching_files(reader, ["*.jsonl"], None, logger)
+
+    assert [f.uri for f in first] == [f.uri for f in second] == ["a.csv", "b.csv"]
+    assert [f.uri for f in other_globs] == ["c.jsonl"]
+    assert reader.listings == 2
+
+
+def test_listing_is_shared_by_concurrent_streams():
+    reader = CountingStreamReader()
+    cache = ListingCache()
+    threads = [threading.Thread(target=cache.get_matching_files, args=(reader, ["*.csv"], None, logger)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert reader.listings == 1
+
+
+@pytest.mark.parametrize(
+    "first_call, second_call",
+    [
+        pytest.param((["*.csv"], None, "a secret"), (["*.csv"], "prefix", "a secret"), id="different-prefix"),
+        pytest.param((["*.csv"], None, "a secret"), (["*.csv"], None, "another secret"), id="different-config"),
+    ],
+)
+def test_listing_is_keyed_by_config_and_prefix(first_call, second_call):
+    cache = ListingCache()
+    readers = []
+    for globs, prefix, secret in [first_call, second_call]:
+        reader = CountingStreamReader(secret=secret)
+        cache.get_matching_files(reader, globs, prefix, logger)
+        readers.append(reader)
+
+    assert [reader.listings for reader in readers] == [1, 1]
+
+
+def test_listing_is_keyed_by_stream_reader_type():
+    cache = ListingCache()
+    reader = CountingStreamReader()
+    cache.get_matching_files(reader, ["*.csv"], None, logger)
+    other_reader = OtherCountingStreamReader()
+    cache.get_matching_files(other_reader, ["*.csv"], None, logger)
+
+    assert other_reader.listings == 1
+
+
+def test_listing_is_persisted_across_runs(tmp_path):
+    reader = CountingStreamReader()
+    first_run = ListingCache(directory=str(tmp_path)).get_matching_files(reader, ["*.csv"], None, logger)
+    second_run = ListingCache(directory=str(tmp_path)).get_matching_files(reader, ["*.csv"], None, logger)
+
+    assert reader.listings == 1
+    assert second_run == first_run
+    assert [f.last_modified for f in second_run] == [FILES[0].last_modified, FILES[1].last_modified]
+    manifests = os.listdir(tmp_path)
+    assert len(manifests) == 1
+    with gzip.open(tmp_path / manifests[0], "rt") as manifest:
+        assert "a secret" not in manifest.read()
+
+
+def test_stale_listing_is_listed_again(tmp_path):
+    reader = CountingStreamReader()
+    cache = ListingCache(directory=str(tmp_path), max_age=timedelta(minutes=5))
+    cache.get_matching_files(reader, ["*.csv"], None, logger)
+
+    in_ten_minutes = datetime.utcnow() + timedelta(minutes=10)
+    with patch("airbyte_cdk.sources.file_based.listing_cache.datetime") as datetime_mock:
+        datetime_mock.utcnow.return_value = in_ten_minutes
+        datetime_mock.fromisoformat = datetime.fromisoformat
+        cache.get_matching_files(reader, ["*.csv"], None, logger)
+        ListingCache(directory=str(tmp_path), max_age=timedelta(minutes=5)).get_matching_files(reader, ["*.csv"], None, logger)
+
+    assert reader.listings == 2
+
+
+@pytest.mark.parametrize(
+    "manifest_content",
+    [
+        pytest.param(b"not gzipped", id="not-gzipped"),
+        pytest.param(gzip.compress(b"{not json"), id="not-json"),
+        pytest.param(gzip.compress(b'{"version": 0, "listed_at": "2023-06-05T03:54:07", "files": []}'), id="other-version"),
+    ],
+)
+def test_unreadable_manifest_is_listed_again(tmp_path, manifest_content):
+    reader = CountingStreamReader()
+    ListingCache(directory=str(tmp_path)).get_matching_files(reader, ["*.csv"], None, logger)
+    (manifest,) = os.listdir(tmp_path)
+    (tmp_path / manifest).write_bytes(manifest_content)
+
+    files = ListingCache(directory=str(tmp_path)).get_matching_files(reader, ["*.csv"], None, logger)
+
+    assert [f.uri for f in files] == ["a.csv", "b.csv"]
+    assert reader.listings == 2
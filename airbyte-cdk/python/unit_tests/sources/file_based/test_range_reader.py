@@ -0,0 +1,126 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import io
+from typing import List, Tuple
+
+import pytest
+from airbyte_cdk.sources.file_based.range_reader import RangeReader
+
+CONTENT = bytes(range(256)) * 40
+
+
+class RequestCountingFile(io.BytesIO):
+    """
+    Records a request for every read following a seek, like object storage file handles do
+    """
+
+    def __init__(self, content: bytes, max_read_size: int = -1):
+        super().__init__(content)
+        self.requests: List[Tuple[int, int]] = []
+        self._max_read_size = max_read_size
+        self._seeked = True
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self._seeked = True
+        return super().seek(offset, whence)
+
+    def read(self, size: int = -1) -> bytes:
+        if self._seeked:
+            self.requests.append((self.tell(), size))
+            self._seeked = False
+        if self._max_read_size > 0:
+            size = min(size, self._max_read_size)
+        return super().read(size)
+
+
+@pytest.mark.parametrize("read_ahead", [1, 100, 100_000])
+@pytest.mark.parametrize(
+    "reads",
+    [
+        pytest.param([(0, 10), (5, 20), (100, 1), (9000, 2000)], id="overlapping-and-past-the-end"),
+        pytest.param([(10_000, 240), (0, 10_240)], id="whole-file-after-its-end"),
+        pytest.param([(50, 0), (10_240, 10)], id="empty-reads"),
+    ],
+)
+def test_read_returns_the_bytes_of_the_file(read_ahead, reads):
+    reader = RangeReader(RequestCountingFile(CONTENT), read_ahead=read_ahead)
+    for offset, size in reads:
+        reader.seek(offset)
+        assert reader.read(size) == CONTENT[offset : offset + size]
+        assert reader.tell() == (min(len(CONTENT), offset + size) if size else offset)
+
+
+def test_read_whole_file_and_readinto():
+    reader = RangeReader(RequestCountingFile(CONTENT))
+    buffer = bytearray(10)
+    assert reader.readinto(buffer) == 10
+    assert bytes(buffer) == CONTENT[:10]
+    assert reader.read() == CONTENT[10:]
+
+
+def test_seek_from_current_position_and_end():
+    reader = RangeReader(RequestCountingFile(CONTENT))
+    assert reader.seek(-8, io.SEEK_END) == len(CONTENT) - 8
+    assert reader.seek(-2, io.SEEK_CUR) == len(CONTENT) - 10
+    assert reader.read(4) == CONTENT[-10:-6]
+    with pytest.raises(ValueError):
+        reader.seek(-1)
+
+
+def test_read_ahead_serves_the_next_reads_without_requests():
+    file = RequestCountingFile(CONTENT)
+    reader = RangeReader(file, read_ahead=1000)
+    for offset in range(0, 1000, 10):
+        reader.seek(offset)
+        assert reader.read(10) == CONTENT[offset : offset + 10]
+    assert file.requests == [(0, 1000)]
+
+
+def test_prefetch_merges_close_ranges_into_one_request():
+    file = RequestCountingFile(CONTENT)
+    reader = RangeReader(file, max_hole_size=100)
+    reader.prefetch([(1000, 1100), (0, 50), (1150, 1200), (120, 200), (5000, 6000)])
+
+    assert file.requests == [(0, 200), (1000, 200), (5000, 1000)]
+    for start, end in [(0, 50), (120, 200), (1000, 1100), (1150, 1200), (5000, 6000)]:
+        reader.seek(start)
+        assert reader.read(end - start) == CONTENT[start:end]
+    assert len(file.requests) == 3
+
+
+def test_prefetch_only_fetches_the_missing_ranges():
+    file = RequestCountingFile(CONTENT)
+    reader = RangeReader(file, max_hole_size=0)
+    reader.prefetch([(100, 200), (300, 400)])
+    reader.prefetch([(50, 450), (10_000, 20_000)])
+
+    assert file.requests == [(100, 100), (300, 100), (50, 50), (200, 100), (400, 50), (10_000, 240)]
+    reader.seek(0)
+    assert reader.read(500) == CONTENT[:500]
+
+
+def test_release_drops_the_fetched_bytes():
+    file = RequestCountingFile(CONTENT)
+    reader = RangeReader(file)
+    reader.prefetch([(0, 100)])
+    reader.release()
+    reader.read(10)
+
+    assert len(file.requests) == 2
+
+
+def test_short_reads_of_the_wrapped_file_are_completed():
+    reader = RangeReader(RequestCountingFile(CONTENT, max_read_size=7))
+    reader.prefetch([(0, 1000)])
+    assert reader.read(1000) == CONTENT[:1000]
+
+
+def test_reading_past_the_end_of_a_truncated_file_raises():
+    file = RequestCountingFile(CONTENT)
+    reader = RangeReader(file)
+    assert reader.size == len(CONTENT)
+    file.truncate(100)
+    with pytest.raises(IOError):
+        reader.read(200)
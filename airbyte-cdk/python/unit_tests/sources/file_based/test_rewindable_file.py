@@ -0,0 +1,37 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import io
+
+from airbyte_cdk.sources.file_based.rewindable_file import RewindableFile
+
+
+def test_recorded_bytes_are_read_again_after_rewind():
+    rewindable_file = RewindableFile(io.BytesIO(b"0123456789"))
+    assert rewindable_file.read(4) == b"0123"
+    rewindable_file.rewind()
+
+    assert rewindable_file.read(2) == b"01"
+    assert rewindable_file.read(4) == b"2345"
+    assert rewindable_file.read(2) == b"67"
+    assert rewindable_file.read() == b"89"
+    assert rewindable_file.read(2) == b""
+
+
+def test_rewind_before_reading_everything_recorded():
+    rewindable_file = RewindableFile(io.BytesIO(b"0123456789"))
+    assert rewindable_file.read(6) == b"012345"
+    rewindable_file.rewind()
+
+    assert rewindable_file.read() == b"0123456789"
+
+
+def test_can_be_buffered_and_decoded():
+    rewindable_file = RewindableFile(io.BytesIO("h1,h2\né,1\n".encode("utf-8")))
+    text_file = io.TextIOWrapper(io.BufferedReader(rewindable_file), encoding="utf-8", newline="")
+    assert text_file.readline() == "h1,h2\n"
+    text_file.detach().detach()
+    rewindable_file.rewind()
+
+    assert rewindable_file.read() == "h1,h2\né,1\n".encode("utf-8")
@@ -0,0 +1,173 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+from typing import Any, Iterable, Mapping, Optional
+from unittest.mock import patch
+
+import pytest
+import requests
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams.http import HttpStream
+from airbyte_cdk.sources.streams.http.rate_limit_policy import RateLimitPolicy, RateLimitStatus, TokenBucket, parse_rate_limit_headers
+
+NOW = 1_700_000_000.0
+
+
+class FakeClock:
+    """Replaces the time module of the policy, sleeps are recorded without waiting"""
+
+    def __init__(self):
+        self.now = NOW
+        self.sleeps = []
+        self._lock = threading.Lock()
+
+    def time(self) -> float:
+        return self.now
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        with self._lock:
+            self.sleeps.append(seconds)
+
+
+@pytest.fixture
+def clock():
+    fake_clock = FakeClock()
+    with patch("airbyte_cdk.sources.streams.http.rate_limit_policy.time", fake_clock):
+        yield fake_clock
+
+
+@pytest.mark.parametrize(
+    "headers, expected_status",
+    [
+        pytest.param({}, RateLimitStatus(), id="no_headers"),
+        pytest.param({"X-RateLimit-Remaining": "42", "X-RateLimit-Reset": str(int(NOW) + 30)}, RateLimitStatus(42, 30.0), id="epoch_reset"),
+        pytest.param({"X-RateLimit-Remaining": "42", "X-RateLimit-Reset": str(int(NOW + 30) * 1000)}, RateLimitStatus(42, 30.0), id="epoch_ms_reset"),
+        pytest.param({"X-RateLimit-Remaining": "42", "X-RateLimit-Reset": "30"}, RateLimitStatus(42, 30.0), id="seconds_reset"),
+        pytest.param({"x-rate-limit-remaining": "0", "X-RateLimit-Reset-After": "1.5"}, RateLimitStatus(0, 1.5), id="reset_after"),
+        pytest.param({"RateLimit-Limit": "100", "RateLimit-Remaining": "50", "RateLimit-Reset": "60"}, RateLimitStatus(50, 60.0), id="draft_fields"),
+        pytest.param({"RateLimit": "limit=100, remaining=50, reset=60"}, RateLimitStatus(50, 60.0), id="draft_combined"),
+        pytest.param({"RateLimit": '"default";r=50;t=60', "RateLimit-Policy": '"default";q=100;w=60'}, RateLimitStatus(50, 60.0), id="draft_structured"),
+        pytest.param({"Retry-After": "120"}, RateLimitStatus(retry_after=120.0), id="retry_after_seconds"),
+        pytest.param({"Retry-After": "Tue, 14 Nov 2023 22:15:20 GMT"}, RateLimitStatus(retry_after=120.0), id="retry_after_date"),
+        pytest.param({"X-RateLimit-Remaining": "unlimited", "Retry-After": "soon"}, RateLimitStatus(), id="invalid_values"),
+    ],
+)
+def test_parse_rate_limit_headers(headers, expected_status):
+    assert parse_rate_limit_headers(requests.structures.CaseInsensitiveDict(headers), now=NOW) == expected_status
+
+
+def test_bucket_does_not_wait_until_the_rate_limit_is_known(clock):
+    bucket = TokenBucket(burst_ratio=0.1)
+
+    assert [bucket.acquire() for _ in range(100)] == [0] * 100
+
+
+def test_bucket_spreads_the_remaining_requests_until_the_reset(clock):
+    bucket = TokenBucket(burst_ratio=0.1)
+    bucket.update(RateLimitStatus(remaining=100, reset_in=50))
+
+    # 10 requests can be sent at once, then one every half second
+    waits = [bucket.acquire() for _ in range(12)]
+    assert waits[:10] == [0] * 10
+    assert waits[10:] == pytest.approx([0.5, 1.0])
+
+    clock.now += 10
+    assert bucket.acquire() == 0
+
+
+def test_bucket_waits_for_the_reset_when_no_request_remains(clock):
+    bucket = TokenBucket(burst_ratio=0.1)
+    bucket.update(RateLimitStatus(remaining=0, reset_in=30))
+
+    assert bucket.acquire() == pytest.approx(30)
+    clock.now += 30
+    assert bucket.acquire() == 0
+
+
+def test_bucket_waits_for_retry_after(clock):
+    bucket = TokenBucket(burst_ratio=0.1)
+    bucket.update(RateLimitStatus(retry_after=12))
+
+    assert bucket.acquire() == pytest.approx(12)
+    assert bucket.acquire() == pytest.approx(12)
+
+
+def test_policy_shares_a_bucket_per_host_across_threads(clock):
+    policy = RateLimitPolicy(burst_ratio=0.01)
+    response = requests.Response()
+    response.headers = requests.structures.CaseInsensitiveDict({"X-RateLimit-Remaining": "100", "X-RateLimit-Reset": "100"})
+    response.request = requests.Request("GET", "https://api.test.com/first").prepare()
+    policy.update(response)
+
+    def send_requests():
+        for _ in range(25):
+            policy.wait_before_sending(requests.Request("GET", "https://api.test.com/other").prepare())
+
+    threads = [threading.Thread(target=send_requests) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    policy.wait_before_sending(requests.Request("GET", "https://other-api.test.com").prepare())
+
+    # One request per second: the waits of the 100 requests are 1 to 99 seconds whichever thread sends them
+    assert sorted(clock.sleeps) == pytest.approx(list(range(1, 100)))
+
+
+class RateLimitedStream(HttpStream):
+    url_base = "https://api.test.com/"
+    primary_key = "id"
+
+    def __init__(self, policy: RateLimitPolicy, **kwargs):
+        super().__init__(**kwargs)
+        self._policy = policy
+
+    @property
+    def rate_limit_policy(self) -> Optional[RateLimitPolicy]:
+        return self._policy
+
+    def path(self, **kwargs) -> str:
+        return "records"
+
+    def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        return response.json().get("next")
+
+    def request_params(self, next_page_token: Optional[Mapping[str, Any]] = None, **kwargs) -> Mapping[str, Any]:
+        return {"page": next_page_token} if next_page_token else {}
+
+    def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
+        yield from response.json()["data"]
+
+
+def test_stream_paces_its_requests(clock, requests_mock):
+    requests_mock.get(
+        "https://api.test.com/records",
+        [
+            {"json": {"data": [{"id": 1}], "next": 2}, "headers": {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "20"}},
+            {"json": {"data": [{"id": 2}]}, "headers": {"X-RateLimit-Remaining": "9", "X-RateLimit-Reset": "60"}},
+        ],
+    )
+
+    records = list(RateLimitedStream(RateLimitPolicy()).read_records(sync_mode=SyncMode.full_refresh))
+
+    assert records == [{"id": 1}, {"id": 2}]
+    assert clock.sleeps == [pytest.approx(20)]
+
+
+def test_stream_retries_after_the_time_given_by_the_rate_limit_headers(clock, requests_mock):
+    requests_mock.get(
+        "https://api.test.com/records",
+        [{"status_code": 429, "headers": {"Retry-After": "7"}}, {"json": {"data": [{"id": 1}]}}],
+    )
+
+    with patch("airbyte_cdk.sources.streams.http.rate_limiting.time.sleep") as backoff_sleep:
+        records = list(RateLimitedStream(RateLimitPolicy()).read_records(sync_mode=SyncMode.full_refresh))
+
+    assert records == [{"id": 1}]
+    # The retry waits the Retry-After seconds rather than the default exponential backoff
+    assert [sleep_call.args[0] for sleep_call in backoff_sleep.call_args_list if sleep_call.args[0]] == [7 + 1]
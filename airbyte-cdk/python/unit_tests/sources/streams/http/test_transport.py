@@ -0,0 +1,231 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import gzip
+import io
+import json
+import socket
+from typing import Any, Iterable, Mapping, Optional
+
+import pytest
+import requests
+from airbyte_cdk.sources.streams.http import HttpStream, HttpSubStream
+from airbyte_cdk.sources.streams.http.http2_adapter import Http2Adapter
+from airbyte_cdk.sources.streams.http.requests_native_auth import TokenAuthenticator
+from airbyte_cdk.sources.streams.http.transport import HttpTransportRegistry, PooledHTTPAdapter
+from werkzeug import Response
+
+
+class StubHttpStream(HttpStream):
+    primary_key = "id"
+
+    def __init__(
+        self, url_base: str = "https://test_base_url.com", http2: bool = False, registry: Optional[HttpTransportRegistry] = None, **kwargs
+    ):
+        self._url_base = url_base
+        self._http2 = http2
+        self._registry = registry or HttpTransportRegistry()
+        super().__init__(**kwargs)
+
+    @property
+    def url_base(self) -> str:
+        return self._url_base
+
+    @property
+    def use_http2(self) -> bool:
+        return self._http2
+
+    @property
+    def transport_registry(self) -> Optional[HttpTransportRegistry]:
+        return self._registry
+
+    def path(self, **kwargs) -> str:
+        return "records"
+
+    def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        return None
+
+    def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
+        yield from response.json()
+
+
+class StubHttpSubStream(HttpSubStream, StubHttpStream):
+    pass
+
+
+def test_streams_share_the_adapters_of_their_registry():
+    registry = HttpTransportRegistry()
+    parent = StubHttpStream(registry=registry)
+    child = StubHttpSubStream(parent=parent, registry=registry)
+    other_registry_stream = StubHttpStream()
+
+    adapter = parent._session.get_adapter("https://test_base_url.com/records")
+    assert isinstance(adapter, PooledHTTPAdapter)
+    assert child._session.get_adapter("https://test_base_url.com/records") is adapter
+    assert child._session.get_adapter("http://test_base_url.com/records") is adapter
+    assert other_registry_stream._session.get_adapter("https://test_base_url.com/records") is not adapter
+
+
+def test_streams_do_not_share_their_connections_by_default():
+    class DefaultRegistryStream(StubHttpStream):
+        @property
+        def transport_registry(self) -> Optional[HttpTransportRegistry]:
+            return HttpStream.transport_registry.fget(self)
+
+    stream, other_stream = DefaultRegistryStream(), DefaultRegistryStream()
+
+    assert stream.transport_registry is None
+    adapter = stream._session.get_adapter("https://test_base_url.com")
+    assert not isinstance(adapter, PooledHTTPAdapter)
+    assert adapter is not other_stream._session.get_adapter("https://test_base_url.com")
+    assert adapter is not HttpTransportRegistry.default().get_adapter()
+
+
+def test_streams_use_their_own_http2_adapter_by_default():
+    class DefaultRegistryStream(StubHttpStream):
+        @property
+        def transport_registry(self) -> Optional[HttpTransportRegistry]:
+            return None
+
+    stream = DefaultRegistryStream(http2=True)
+    adapter = stream._session.get_adapter("https://test_base_url.com")
+    client = adapter.client
+
+    stream._session.close()
+
+    assert isinstance(adapter, Http2Adapter)
+    assert client.is_closed
+
+
+def test_closing_a_session_does_not_close_the_shared_adapter(httpserver):
+    httpserver.expect_request("/records").respond_with_json([{"id": 1}])
+    registry = HttpTransportRegistry()
+    stream, other_stream = [StubHttpStream(url_base=httpserver.url_for("/"), registry=registry) for _ in range(2)]
+    list(stream.read_records(sync_mode="full_refresh"))
+
+    adapter = registry.get_adapter()
+
+    stream._session.close()
+
+    assert len(adapter.poolmanager.pools) == 1
+    assert list(other_stream.read_records(sync_mode="full_refresh")) == [{"id": 1}]
+
+    registry.close()
+
+    assert len(adapter.poolmanager.pools) == 0
+    assert registry.get_adapter() is not adapter
+
+
+def test_cached_session_uses_the_shared_adapter(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    class CachedStream(StubHttpStream):
+        use_cache = True
+
+    registry = HttpTransportRegistry()
+    stream = CachedStream(registry=registry)
+
+    assert stream._session.get_adapter("https://test_base_url.com") is registry.get_adapter()
+
+
+def test_pool_only_grows():
+    registry = HttpTransportRegistry(pool_size=4)
+    adapter = registry.get_adapter()
+
+    registry.ensure_pool_size(2)
+    assert registry.pool_size == 4
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 4
+
+    registry.ensure_pool_size(12)
+    assert registry.pool_size == 12
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 12
+    assert registry.get_adapter(http2=True)._pool_size == 12
+
+
+def test_resize_closes_the_previous_pools(httpserver):
+    httpserver.expect_request("/records").respond_with_json([])
+    registry = HttpTransportRegistry(pool_size=2)
+    list(StubHttpStream(url_base=httpserver.url_for("/"), registry=registry).read_records(sync_mode="full_refresh"))
+    previous_pool_manager = registry.get_adapter().poolmanager
+    (pool_key,) = previous_pool_manager.pools.keys()
+    previous_pool = previous_pool_manager.pools[pool_key]
+
+    registry.ensure_pool_size(8)
+
+    assert len(previous_pool_manager.pools) == 0
+    assert previous_pool.pool is None
+
+
+@pytest.mark.parametrize("tcp_keep_alive", [True, False])
+def test_tcp_keep_alive(tcp_keep_alive):
+    adapter = HttpTransportRegistry(tcp_keep_alive=tcp_keep_alive).get_adapter()
+
+    socket_options = adapter.poolmanager.connection_pool_kw.get("socket_options") or []
+    assert ((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in socket_options) == tcp_keep_alive
+
+
+def test_requests_reuse_the_connections_of_other_streams(httpserver):
+    httpserver.expect_request("/records").respond_with_json([{"id": 1}])
+    registry = HttpTransportRegistry()
+    streams = [StubHttpStream(url_base=httpserver.url_for("/"), registry=registry) for _ in range(3)]
+
+    for stream in streams:
+        assert list(stream.read_records(sync_mode="full_refresh")) == [{"id": 1}]
+
+    pools = registry.get_adapter().poolmanager.pools
+    (pool_key,) = pools.keys()
+    assert pools[pool_key].num_requests == 3
+    assert pools[pool_key].num_connections == 1
+
+
+def test_http2_adapter_sends_the_requests_of_the_stream(httpserver):
+    httpserver.expect_request("/records", method="GET", headers={"Authorization": "Bearer token"}).respond_with_json([{"id": 1}, {"id": 2}])
+    stream = StubHttpStream(url_base=httpserver.url_for("/"), http2=True, authenticator=TokenAuthenticator("token"))
+
+    assert isinstance(stream._session.get_adapter(httpserver.url_for("/")), Http2Adapter)
+    assert list(stream.read_records(sync_mode="full_refresh")) == [{"id": 1}, {"id": 2}]
+
+
+def test_http2_adapter_decodes_and_streams_the_body(httpserver):
+    body = json.dumps([{"id": i} for i in range(1000)]).encode()
+    httpserver.expect_request("/records").respond_with_response(
+        Response(gzip.compress(body), headers={"Content-Encoding": "gzip", "Content-Type": "application/json"})
+    )
+    session = requests.Session()
+    HttpTransportRegistry().mount(session, http2=True)
+
+    response = session.get(httpserver.url_for("/records"), stream=True)
+
+    assert "Content-Encoding" not in response.headers
+    assert b"".join(response.iter_content(chunk_size=100)) == body
+
+
+def test_http2_adapter_raises_requests_exceptions():
+    session = requests.Session()
+    HttpTransportRegistry().mount(session, http2=True)
+    with socket.socket() as unused_socket:
+        unused_socket.bind(("127.0.0.1", 0))
+        port = unused_socket.getsockname()[1]
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        session.get(f"http://127.0.0.1:{port}/records")
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        pytest.param(b"id=1", id="test_bytes_body"),
+        pytest.param("id=1", id="test_str_body"),
+        pytest.param(io.BytesIO(b"id=1"), id="test_file_body"),
+        pytest.param(iter([b"id=", "1"]), id="test_chunked_body"),
+    ],
+)
+def test_http2_adapter_sends_the_body_and_headers_of_the_request(httpserver, data):
+    httpserver.expect_request("/records", method="POST", data=b"id=1", headers={"X-Bytes-Header": "value"}).respond_with_json([])
+    session = requests.Session()
+    HttpTransportRegistry().mount(session, http2=True)
+
+    response = session.post(httpserver.url_for("/records"), data=data, headers={"X-Bytes-Header": b"value"})
+
+    assert response.status_code == 200
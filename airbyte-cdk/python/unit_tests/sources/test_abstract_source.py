@@ -5,11 +5,14 @@
 import copy
 import datetime
 import logging
+import threading
+import time
 from collections import defaultdict
 from typing import Any, Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
 from unittest.mock import Mock, call
 
 import pytest
+import requests
 from airbyte_cdk.models import (
     AirbyteCatalog,
     AirbyteConnectionStatus,
@@ -39,6 +42,8 @@ from airbyte_cdk.sources import AbstractSource
 from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
 from airbyte_cdk.sources.message import MessageRepository
 from airbyte_cdk.sources.streams import IncrementalMixin, Stream
+from airbyte_cdk.sources.streams.http import HttpStream
+from airbyte_cdk.sources.streams.http.transport import HttpTransportRegistry
 from airbyte_cdk.sources.utils.record_helper import stream_data_to_airbyte_message
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 from pytest import fixture
@@ -1120,3 +1125,223 @@ def test_checkpoint_state_from_stream_instance():
     assert actual_message == _as_state(
         {"teams": {"updated_at": "2022-09-11"}, "managers": {"updated": "expected_here"}}, "managers", {"updated": "expected_here"}
     )
+
+
+class MockConcurrentSlicesStream(Stream):
+    """Emits each slice's records, the first slices being the slowest to read so that concurrent reads complete out of order"""
+
+    primary_key = None
+    cursor_field = "cursor"
+
+    def __init__(
+        self,
+        name: str,
+        slices: List[Mapping[str, Any]],
+        slice_concurrency_limit: int,
+        emit_slices_in_order: bool = True,
+        barrier: Optional[threading.Barrier] = None,
+    ):
+        self._name = name
+        self._slices = slices
+        self._slice_concurrency_limit = slice_concurrency_limit
+        self._emit_slices_in_order = emit_slices_in_order
+        # Only lets the slices through once `barrier.parties` of them are read at the same time
+        self._barrier = barrier
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def slice_concurrency_limit(self) -> int:
+        return self._slice_concurrency_limit
+
+    @property
+    def emit_slices_in_order(self) -> bool:
+        return self._emit_slices_in_order
+
+    def stream_slices(self, **kwargs) -> Iterable[Optional[Mapping[str, Any]]]:
+        return self._slices
+
+    def read_records(self, stream_slice: Optional[Mapping[str, Any]] = None, **kwargs) -> Iterable[Mapping[str, Any]]:
+        if self._barrier:
+            self._barrier.wait(timeout=5)
+        time.sleep(0.05 * (len(self._slices) - self._slices.index(stream_slice)))
+        if stream_slice.get("fail"):
+            raise ValueError("failed to read slice")
+        yield {"cursor": stream_slice["cursor"], "index": 1}
+        yield {"cursor": stream_slice["cursor"], "index": 2}
+
+    def get_updated_state(self, current_stream_state: MutableMapping[str, Any], latest_record: Mapping[str, Any]) -> MutableMapping[str, Any]:
+        return {"cursor": max(current_stream_state.get("cursor", ""), latest_record["cursor"])}
+
+    def get_json_schema(self) -> Mapping[str, Any]:
+        return {}
+
+
+def test_concurrent_incremental_read_emits_records_and_state_in_slice_order():
+    slices = [{"cursor": "2023-01-01"}, {"cursor": "2023-01-02"}, {"cursor": "2023-01-03"}]
+    # The slices can only be read if they are all read at the same time
+    stream = MockConcurrentSlicesStream("s1", slices, slice_concurrency_limit=3, barrier=threading.Barrier(3))
+    src = MockSource(streams=[stream])
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.incremental)])
+
+    expected = _fix_emitted_at(
+        [
+            _as_stream_status("s1", AirbyteStreamStatus.STARTED),
+            _as_stream_status("s1", AirbyteStreamStatus.RUNNING),
+            *_as_records("s1", [{"cursor": "2023-01-01", "index": 1}, {"cursor": "2023-01-01", "index": 2}]),
+            _as_state({"s1": {"cursor": "2023-01-01"}}, "s1", {"cursor": "2023-01-01"}),
+            *_as_records("s1", [{"cursor": "2023-01-02", "index": 1}, {"cursor": "2023-01-02", "index": 2}]),
+            _as_state({"s1": {"cursor": "2023-01-02"}}, "s1", {"cursor": "2023-01-02"}),
+            *_as_records("s1", [{"cursor": "2023-01-03", "index": 1}, {"cursor": "2023-01-03", "index": 2}]),
+            _as_state({"s1": {"cursor": "2023-01-03"}}, "s1", {"cursor": "2023-01-03"}),
+            _as_stream_status("s1", AirbyteStreamStatus.COMPLETE),
+        ]
+    )
+
+    messages = _fix_emitted_at(list(src.read(logger, {}, catalog)))
+
+    assert messages == expected
+
+
+def test_concurrent_unordered_full_refresh_read_emits_all_records():
+    slices = [{"cursor": "2023-01-01"}, {"cursor": "2023-01-02"}, {"cursor": "2023-01-03"}]
+    stream = MockConcurrentSlicesStream("s1", slices, slice_concurrency_limit=2, emit_slices_in_order=False)
+    src = MockSource(streams=[stream])
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.full_refresh)])
+
+    messages = list(src.read(logger, {}, catalog))
+
+    records = [(message.record.data["cursor"], message.record.data["index"]) for message in messages if message.type == Type.RECORD]
+    assert sorted(records) == [(_slice["cursor"], index) for _slice in slices for index in (1, 2)]
+    # The slowest slice is the first one, so records are not emitted in slice order
+    assert records[0][0] != slices[0]["cursor"]
+
+
+def test_concurrent_read_with_failing_slice_marks_stream_incomplete():
+    slices = [{"cursor": "2023-01-01"}, {"cursor": "2023-01-02", "fail": True}, {"cursor": "2023-01-03"}]
+    stream = MockConcurrentSlicesStream("s1", slices, slice_concurrency_limit=3)
+    src = MockSource(streams=[stream])
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.incremental)])
+
+    messages = []
+    with pytest.raises(ValueError):
+        for message in src.read(logger, {}, catalog):
+            messages.append(message)
+
+    assert _fix_emitted_at(messages)[-1] == _fix_emitted_at([_as_stream_status("s1", AirbyteStreamStatus.INCOMPLETE)])[0]
+    # The state of the first slice is checkpointed since it was fully read before the failing slice
+    assert [message.state.stream.stream_state.dict() for message in messages if message.type == Type.STATE] == [{"cursor": "2023-01-01"}]
+
+
+class MockConcurrentStreamsSource(MockSource):
+    stream_concurrency_limit = 3
+
+
+def _messages_of_stream(messages: List[AirbyteMessage], stream_name: str) -> List[AirbyteMessage]:
+    for message in messages:
+        if message.type == Type.STATE:
+            # The legacy state depends on how far the other streams have been read
+            message.state.data = {}
+    return [
+        message
+        for message in messages
+        if (message.type == Type.RECORD and message.record.stream == stream_name)
+        or (message.type == Type.STATE and message.state.stream.stream_descriptor.name == stream_name)
+        or (message.type == Type.TRACE and message.trace.stream_status.stream_descriptor.name == stream_name)
+    ]
+
+
+def test_concurrent_streams_read_interleaves_streams_and_keeps_each_stream_in_order():
+    slices = [{"cursor": "2023-01-01"}, {"cursor": "2023-01-02"}]
+    # The slices of the streams can only be read if the three streams are read at the same time
+    barrier = threading.Barrier(3)
+    streams = [MockConcurrentSlicesStream(f"s{i}", slices, slice_concurrency_limit=1, barrier=barrier) for i in range(3)]
+    src = MockConcurrentStreamsSource(streams=streams)
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.incremental) for stream in streams])
+
+    messages = _fix_emitted_at(list(src.read(logger, {}, catalog)))
+
+    for stream in streams:
+        assert _messages_of_stream(messages, stream.name) == _fix_emitted_at(
+            [
+                _as_stream_status(stream.name, AirbyteStreamStatus.STARTED),
+                _as_stream_status(stream.name, AirbyteStreamStatus.RUNNING),
+                *_as_records(stream.name, [{"cursor": "2023-01-01", "index": 1}, {"cursor": "2023-01-01", "index": 2}]),
+                _as_state({}, stream.name, {"cursor": "2023-01-01"}),
+                *_as_records(stream.name, [{"cursor": "2023-01-02", "index": 1}, {"cursor": "2023-01-02", "index": 2}]),
+                _as_state({}, stream.name, {"cursor": "2023-01-02"}),
+                _as_stream_status(stream.name, AirbyteStreamStatus.COMPLETE),
+            ]
+        )
+    # The streams were read concurrently so the first stream does not complete before the other streams start
+    statuses = [(message.trace.stream_status.stream_descriptor.name, message.trace.stream_status.status) for message in messages if message.type == Type.TRACE]
+    assert statuses.index(("s0", AirbyteStreamStatus.COMPLETE)) > statuses.index(("s2", AirbyteStreamStatus.STARTED))
+
+
+def test_concurrent_streams_read_marks_streams_in_progress_incomplete_on_failure():
+    failing_stream = MockConcurrentSlicesStream("failing", [{"cursor": "2023-01-01", "fail": True}], slice_concurrency_limit=1)
+    slow_stream = MockConcurrentSlicesStream("slow", [{"cursor": f"2023-01-{day:02d}"} for day in range(1, 20)], slice_concurrency_limit=1)
+    src = MockConcurrentStreamsSource(streams=[failing_stream, slow_stream])
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[_configured_stream(failing_stream, SyncMode.full_refresh), _configured_stream(slow_stream, SyncMode.full_refresh)]
+    )
+
+    messages = []
+    with pytest.raises(ValueError):
+        for message in src.read(logger, {}, catalog):
+            messages.append(message)
+
+    statuses = [(message.trace.stream_status.stream_descriptor.name, message.trace.stream_status.status) for message in messages if message.type == Type.TRACE]
+    assert ("failing", AirbyteStreamStatus.INCOMPLETE) in statuses
+    assert statuses[-1] == ("slow", AirbyteStreamStatus.INCOMPLETE)
+
+
+class MockHttpStream(HttpStream):
+    url_base = "https://test_base_url.com"
+    primary_key = "id"
+
+    def __init__(self, name: str, slice_concurrency_limit: int, transport_registry: HttpTransportRegistry):
+        self._name = name
+        self._slice_concurrency_limit = slice_concurrency_limit
+        self._transport_registry = transport_registry
+        super().__init__()
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def slice_concurrency_limit(self) -> int:
+        return self._slice_concurrency_limit
+
+    @property
+    def transport_registry(self) -> HttpTransportRegistry:
+        return self._transport_registry
+
+    def path(self, **kwargs) -> str:
+        return ""
+
+    def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        return None
+
+    def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
+        return []
+
+    def read_records(self, *args, **kwargs) -> Iterable[Mapping[str, Any]]:
+        yield from []
+
+    def get_json_schema(self) -> Mapping[str, Any]:
+        return {}
+
+
+def test_concurrent_read_grows_the_http_connection_pools_to_the_number_of_concurrent_requests():
+    registry = HttpTransportRegistry(pool_size=2)
+    streams = [MockHttpStream("s1", 4, registry), MockHttpStream("s2", 1, registry), MockHttpStream("not_configured", 10, registry)]
+    src = MockConcurrentStreamsSource(streams=streams)
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.full_refresh) for stream in streams[:2]])
+
+    list(src.read(logger, {}, catalog))
+
+    assert registry.pool_size == 3 * 4
@@ -0,0 +1,87 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+import time
+
+import pytest
+from airbyte_cdk.sources.utils.concurrent_slice_reader import ConcurrentSliceReader
+
+
+class SliceReader:
+    def __init__(self, records_per_slice: int = 3, failing_slice: int = None):
+        self._records_per_slice = records_per_slice
+        self._failing_slice = failing_slice
+        self._lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.records_read = 0
+
+    def __call__(self, stream_slice):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            # The first slices are the slowest to read
+            time.sleep(0.01 * (10 - stream_slice["id"]))
+            if stream_slice["id"] == self._failing_slice:
+                raise ValueError(f"failed to read slice {stream_slice['id']}")
+            for index in range(self._records_per_slice):
+                with self._lock:
+                    self.records_read += 1
+                yield stream_slice["id"], index
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def _slices(count):
+    return [{"id": i} for i in range(count)]
+
+
+def test_read_ordered_returns_records_in_slice_order():
+    read_slice = SliceReader()
+
+    result = [(stream_slice, list(records)) for stream_slice, records in ConcurrentSliceReader(4).read_ordered(_slices(10), read_slice)]
+
+    assert result == [({"id": i}, [(i, 0), (i, 1), (i, 2)]) for i in range(10)]
+    assert 1 < read_slice.max_active <= 4
+
+
+def test_read_unordered_returns_all_records():
+    read_slice = SliceReader()
+
+    records = list(ConcurrentSliceReader(4).read_unordered(_slices(10), read_slice))
+
+    assert sorted(records) == [(i, index) for i in range(10) for index in range(3)]
+    assert 1 < read_slice.max_active <= 4
+
+
+@pytest.mark.parametrize("ordered", [pytest.param(True, id="test_ordered"), pytest.param(False, id="test_unordered")])
+def test_exception_raised_while_reading_a_slice_is_reraised(ordered):
+    reader = ConcurrentSliceReader(2)
+    with pytest.raises(ValueError, match="failed to read slice 3"):
+        if ordered:
+            for _, records in reader.read_ordered(_slices(5), SliceReader(failing_slice=3)):
+                list(records)
+        else:
+            list(reader.read_unordered(_slices(5), SliceReader(failing_slice=3)))
+
+
+def test_read_ordered_stops_workers_when_closed():
+    read_slice = SliceReader(records_per_slice=10_000)
+    reader = ConcurrentSliceReader(2, buffer_size=10)
+
+    slices_and_records = reader.read_ordered(_slices(5), read_slice)
+    _, records = next(slices_and_records)
+    next(records)
+    slices_and_records.close()
+
+    assert read_slice.active == 0
+    assert read_slice.records_read < 100
+
+
+def test_max_workers_must_be_positive():
+    with pytest.raises(ValueError):
+        ConcurrentSliceReader(0)
@@ -0,0 +1,102 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+import time
+
+import pytest
+from airbyte_cdk.sources.utils.property_chunks import PropertyChunkMerger, fetch_property_chunks
+
+
+class ChunkFetcher:
+    def __init__(self, failing_chunk: str = None):
+        self._failing_chunk = failing_chunk
+        self._lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.fetched = []
+
+    def __call__(self, chunk):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            # The first chunks are the slowest to fetch
+            time.sleep(0.02 * (5 - int(chunk[-1])))
+            if chunk == self._failing_chunk:
+                raise ValueError(f"failed to fetch {chunk}")
+            with self._lock:
+                self.fetched.append(chunk)
+            return chunk.upper()
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def test_fetch_property_chunks_concurrently():
+    fetcher = ChunkFetcher()
+
+    results = list(fetch_property_chunks(["chunk1", "chunk2", "chunk3", "chunk4"], fetcher, max_workers=2))
+
+    assert sorted(results) == [("chunk1", "CHUNK1"), ("chunk2", "CHUNK2"), ("chunk3", "CHUNK3"), ("chunk4", "CHUNK4")]
+    assert fetcher.max_active == 2
+
+
+def test_fetch_property_chunks_returns_the_chunks_as_soon_as_they_are_fetched():
+    results = list(fetch_property_chunks(["chunk1", "chunk2", "chunk3"], ChunkFetcher(), max_workers=3))
+
+    assert [chunk for chunk, _ in results] == ["chunk3", "chunk2", "chunk1"]
+
+
+def test_fetch_property_chunks_sequentially():
+    fetcher = ChunkFetcher()
+
+    results = list(fetch_property_chunks(["chunk1", "chunk2", "chunk3"], fetcher, max_workers=1))
+
+    assert results == [("chunk1", "CHUNK1"), ("chunk2", "CHUNK2"), ("chunk3", "CHUNK3")]
+    assert fetcher.max_active == 1
+
+
+def test_fetch_property_chunks_raises_the_errors_of_the_chunks():
+    fetcher = ChunkFetcher(failing_chunk="chunk4")
+
+    with pytest.raises(ValueError, match="failed to fetch chunk4"):
+        list(fetch_property_chunks(["chunk4", "chunk1", "chunk2", "chunk3"], fetcher, max_workers=2))
+    # The chunks which were not started when the error was raised are cancelled
+    assert "chunk3" not in fetcher.fetched
+
+
+def test_merger_returns_the_records_once_all_their_parts_are_added():
+    merger = PropertyChunkMerger(chunk_count=3, primary_key=lambda record: record["id"])
+
+    assert merger.add({"id": 1, "a": 1}) is None
+    assert merger.add({"id": 2, "a": 2}) is None
+    assert merger.add({"id": 1, "b": 1}) is None
+    assert merger.add({"id": 1, "c": 1}) == {"id": 1, "a": 1, "b": 1, "c": 1}
+    assert merger.incomplete_keys == [2]
+
+    assert merger.add({"id": 2, "b": 2}) is None
+    assert merger.pop_incomplete() == [{"id": 2, "a": 2, "b": 2}]
+    assert merger.incomplete_keys == []
+
+
+def test_merger_with_a_single_chunk_returns_the_records_as_they_are():
+    merger = PropertyChunkMerger(chunk_count=1, primary_key=lambda record: record["id"])
+
+    assert merger.add({"id": 1, "a": 1}) == {"id": 1, "a": 1}
+    assert merger.incomplete_keys == []
+
+
+def test_merger_with_a_custom_merge():
+    def merge_properties(record, part):
+        record["properties"].update(part["properties"])
+
+    merger = PropertyChunkMerger(chunk_count=2, primary_key=lambda record: record["id"], merge=merge_properties)
+
+    assert merger.add({"id": 1, "updatedAt": "2023", "properties": {"a": 1}}) is None
+    assert merger.add({"id": 1, "updatedAt": "2024", "properties": {"b": 1}}) == {
+        "id": 1,
+        "updatedAt": "2023",
+        "properties": {"a": 1, "b": 1},
+    }
@@ -5,7 +5,9 @@
 import json
 
 import pytest
+from airbyte_cdk.sources.utils import transform
 from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
+from jsonschema import RefResolutionError
 
 SIMPLE_SCHEMA = {"type": "object", "properties": {"value": {"type": "string"}}}
 COMPLEX_SCHEMA = {
@@ -264,3 +266,87 @@ def test_custom_transform_with_default_normalization():
     obj = {"value": 12}
     s.transformer.transform(obj, SIMPLE_SCHEMA)
     assert obj == {"value": "transformed"}
+
+
+@pytest.mark.parametrize(
+    "schema, actual, expected",
+    [
+        pytest.param(COMPLEX_SCHEMA, {"value": 1, "array": ["111", 111]}, {"value": True, "array": ["111", "111"]}, id="test_local_refs"),
+        pytest.param(
+            VERY_NESTED_SCHEMA,
+            {"very_nested_value": {"very_nested_value": "2"}},
+            {"very_nested_value": {"very_nested_value": "2"}},
+            id="test_nested_objects",
+        ),
+    ],
+)
+def test_transform_plan_is_compiled_once_per_schema(schema, actual, expected):
+    t = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+    t.transform(actual, schema)
+    assert actual == expected
+
+    plan = t._get_plan(schema)
+    assert plan is not None
+    assert t._get_plan(schema) is plan
+    assert t._get_plan(json.loads(json.dumps(schema))) is plan
+
+
+def test_transform_plan_is_reused_for_equal_schemas(mocker):
+    t = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+    compile_plan = mocker.spy(transform._PlanCompiler, "compile")
+    for _ in range(3):
+        obj = {"value": 1, "array": ["111", 111]}
+        t.transform(obj, json.loads(json.dumps(COMPLEX_SCHEMA)))
+        assert obj == {"value": True, "array": ["111", "111"]}
+    assert compile_plan.call_count == 1
+
+
+def test_transform_plan_raises_on_unresolvable_reference_only_if_field_is_present():
+    t = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+    schema = COMPLEX_SCHEMA["properties"]["def"]
+    t.transform({"other": 1}, schema)
+    with pytest.raises(RefResolutionError):
+        t.transform({"dd": 1}, schema)
+
+
+@pytest.mark.parametrize(
+    "schema, actual, expected",
+    [
+        pytest.param(
+            {"type": "object", "properties": {"value": {"type": "string"}, "child": {"$ref": "#"}}},
+            {"value": 1, "child": {"value": 2, "child": {"value": 3}}},
+            {"value": "1", "child": {"value": "2", "child": {"value": "3"}}},
+            id="test_recursive_ref",
+        ),
+        pytest.param(
+            {"type": "object", "properties": {"child": {"$id": "http://schema.com/child", "properties": {"value": {"type": "string"}}}}},
+            {"child": {"value": 1}},
+            {"child": {"value": "1"}},
+            id="test_nested_schema_id",
+        ),
+    ],
+)
+def test_transform_falls_back_to_jsonschema_for_unsupported_schemas(schema, actual, expected):
+    t = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+    t.transform(actual, schema)
+    assert t._get_plan(schema) is None
+    assert actual == expected
+
+
+def test_custom_transform_registered_after_transforming_is_applied():
+    transformer = TypeTransformer(TransformConfig.CustomSchemaNormalization)
+    obj = {"value": 12}
+    transformer.transform(obj, SIMPLE_SCHEMA)
+    assert obj == {"value": 12}
+
+    transformer.registerCustomTransform(lambda instance, schema: "transformed")
+    transformer.transform(obj, SIMPLE_SCHEMA)
+    assert obj == {"value": "transformed"}
+
+
+def test_no_transform_does_not_modify_record():
+    transformer = TypeTransformer(TransformConfig.NoTransform)
+    obj = {"value": 12}
+    transformer.transform(obj, SIMPLE_SCHEMA)
+    assert obj == {"value": 12}
+    assert len(transformer._plans) == 0
@@ -5,6 +5,7 @@
 
 from unittest import mock
 
+import pytest
 from airbyte_cdk.utils.event_timing import create_timer
 
 
@@ -53,3 +54,37 @@ def test_double_finish_is_safely_ignored():
         timer.finish_event()
         timer.finish_event()
         assert timer.count == 1
+
+
+def test_overlapping_events_are_finished_by_name():
+    with create_timer("Source Counter") as timer:
+        timer.start_event("first")
+        timer.start_event("second")
+        timer.finish_event("first")
+        assert timer.events["first"].end is not None
+        assert timer.events["second"].end is None
+        timer.finish_event("second")
+        assert timer.events["second"].end is not None
+        assert timer.stack == []
+
+
+def test_report_accounts_for_overlapping_events():
+    with create_timer("Source Counter") as timer:
+        for name in ["first", "second", "third"]:
+            timer.start_event(name)
+            timer.finish_event(name)
+        # Events are timed in nanoseconds, "first" and "second" overlap
+        for name, start, end in [("first", 0, 100_000_000), ("second", 50_000_000, 150_000_000), ("third", 200_000_000, 300_000_000)]:
+            timer.events[name].start, timer.events[name].end = start, end
+
+        assert timer.wall_time == 0.25
+        assert timer.total_time == pytest.approx(0.3)
+        assert timer.report().startswith("Source Counter runtimes (wall time 0:00:00.250000, total event time 0:00:00.300000)")
+
+
+def test_report_with_event_in_progress():
+    with create_timer("Source Counter") as timer:
+        timer.start_event("first")
+        timer.start_event("second")
+        timer.finish_event("first")
+        assert timer.report().split("\n")[1:] == [str(timer.events["first"]), "second in progress"]
@@ -2,7 +2,11 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import datetime
+import decimal
+import logging
 import os
+import uuid
 from argparse import Namespace
 from copy import deepcopy
 from typing import Any, List, Mapping, MutableMapping, Union
@@ -296,3 +300,110 @@ def test_filter_internal_requests(deployment_mode, url, expected_error):
         else:
             actual_response = session.send(request=prepared_request)
             assert isinstance(actual_response, requests.Response)
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        pytest.param(
+            AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="stream", data={"data": "stuff"}, emitted_at=1)),
+            id="test_record",
+        ),
+        pytest.param(
+            AirbyteMessage(
+                type=Type.RECORD,
+                record=AirbyteRecordMessage(
+                    namespace="public",
+                    stream='stream "quoted"',
+                    data={"date": datetime.datetime(2023, 1, 1), "decimal": decimal.Decimal("1.5"), 1: None, "nested": {"é": [1, 2]}},
+                    emitted_at=1,
+                ),
+            ),
+            id="test_record_with_namespace_and_non_json_types",
+        ),
+        pytest.param(
+            AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="stream", data={}, emitted_at=1, namespace=None)),
+            id="test_record_with_explicit_none",
+        ),
+        pytest.param(
+            AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="stream", data={}, emitted_at=1), log=None),
+            id="test_message_with_other_fields_set",
+        ),
+        pytest.param(MESSAGE_FROM_REPOSITORY, id="test_not_a_record"),
+    ],
+)
+def test_airbyte_message_to_string_is_the_same_as_pydantic(message):
+    assert AirbyteEntrypoint.airbyte_message_to_string(message) == message.json(exclude_unset=True)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        pytest.param({"float": 1.0, "exponent": 1e-20, "big_int": 2**70, "negative": -0.5}, id="test_numbers"),
+        pytest.param(
+            {"true": True, "false": False, "null": None, "empty_string": "", "empty_list": [], "empty_object": {}}, id="test_constants"
+        ),
+        pytest.param({"unicode": "\u00e9\u4e2d\U0001f600", "escapes": '"\\\n\t\x00', "html": "<a href='x'>&</a>"}, id="test_strings"),
+        pytest.param(
+            {"list": [1, "two", [3.0, {"four": None}]], "tuple": (1, 2), "nested": {"a": {"b": {"c": [{"d": 1}]}}}}, id="test_containers"
+        ),
+        pytest.param(
+            {
+                "date": datetime.date(2023, 1, 1),
+                "time": datetime.time(1, 2, 3),
+                "uuid": uuid.UUID(int=1),
+                "decimal": decimal.Decimal("1e3"),
+            },
+            id="test_encoded_types",
+        ),
+        pytest.param({True: 1, 2: 2, 3.5: 3}, id="test_non_string_keys"),
+    ],
+)
+@pytest.mark.parametrize("emitted_at", [1, 1.5, 1696502400000])
+def test_record_serialization_is_the_same_as_pydantic(data, emitted_at):
+    message = AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="stream", data=data, emitted_at=emitted_at))
+    assert AirbyteEntrypoint.airbyte_message_to_string(message) == message.json(exclude_unset=True)
+
+
+def test_launch_writes_records_in_batches_and_flushes_on_other_messages(mocker):
+    record = AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="stream", data={"data": "stuff"}, emitted_at=1)).json(
+        exclude_unset=True
+    )
+    state = '{"type": "STATE", "state": {"data": {}}}'
+    messages = [record] * 3 + [state] + [record] * 2
+    mocker.patch.object(entrypoint_module, "RECORD_BATCH_SIZE", 2)
+    mocker.patch.object(AirbyteEntrypoint, "run", return_value=iter(messages))
+    stdout = mocker.patch.object(entrypoint_module.sys, "stdout")
+
+    entrypoint_module.launch(MockSource(), ["spec"])
+
+    assert "".join(c.args[0] for c in stdout.write.call_args_list) == "\n".join(messages) + "\n"
+    assert [c.args[0].count("\n") for c in stdout.write.call_args_list] == [2, 2, 2]
+    assert stdout.flush.call_count == 2
+
+
+def test_launch_writes_pending_records_before_log_messages(mocker):
+    record = AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="stream", data={"data": "stuff"}, emitted_at=1)).json(
+        exclude_unset=True
+    )
+    output = []
+    handler = logging.Handler()
+    handler.emit = lambda log_record: output.append(log_record.getMessage())
+    logging.getLogger().addHandler(handler)
+
+    def run(parsed_args):
+        yield record
+        logging.getLogger("airbyte").warning("log")
+        yield record
+
+    mocker.patch.object(AirbyteEntrypoint, "run", side_effect=run)
+    # The module is patched rather than sys.stdout, which pytest resets while it outputs the logs
+    stdout = mocker.patch.object(entrypoint_module, "sys").stdout
+    stdout.write.side_effect = lambda text: output.extend(text.splitlines())
+    try:
+        entrypoint_module.launch(MockSource(), ["spec"])
+    finally:
+        logging.getLogger().removeHandler(handler)
+
+    assert output == [record, "log", record]
+    assert not handler.filters
@@ -121,3 +121,31 @@ def test_secret_filtering():
     update_secrets([SECRET_STRING_VALUE, SECRET_STRING_2_VALUE])
     filtered = filter_secrets(sensitive_str)
     assert filtered == f"**** {NOT_SECRET_VALUE} **** ****"
+
+
+@pytest.mark.parametrize(
+    "secrets, string, expected",
+    [
+        pytest.param(["x", "xk"], "a xk b x", "a **** b ****", id="test_secret_prefix_of_another_secret"),
+        pytest.param(["xk", "x"], "a xk b x", "a **** b ****", id="test_secret_prefix_of_another_secret_in_any_order"),
+        pytest.param(["k", "xk"], "xk k", "**** ****", id="test_secret_suffix_of_another_secret"),
+        pytest.param(["abc", "bcd"], "abcd", "****d", id="test_overlapping_secrets"),
+        pytest.param(["a.b", "(c)"], "a.b axb (c) c", "**** axb **** c", id="test_secrets_with_regex_characters"),
+        pytest.param([12345, "secret"], "12345 secret", "**** ****", id="test_non_string_secret"),
+        pytest.param(["secret", "secret"], "secret", "****", id="test_duplicated_secrets"),
+        pytest.param(["secret", "another"], "no secret here", "no **** here", id="test_single_secret_found"),
+    ],
+)
+def test_secret_filtering_matches_longest_secret(secrets, string, expected):
+    update_secrets(secrets)
+    assert filter_secrets(string) == expected
+    update_secrets([])
+
+
+def test_secret_filtering_uses_updated_secrets():
+    update_secrets([SECRET_STRING_VALUE])
+    assert filter_secrets(f"{SECRET_STRING_VALUE} {SECRET_STRING_2_VALUE}") == f"**** {SECRET_STRING_2_VALUE}"
+
+    update_secrets([SECRET_STRING_2_VALUE])
+    assert filter_secrets(f"{SECRET_STRING_VALUE} {SECRET_STRING_2_VALUE}") == f"{SECRET_STRING_VALUE} ****"
+    update_secrets([])
@@ -3,6 +3,7 @@
 #
 
 import copy
+import itertools
 import logging
 from abc import ABC, abstractmethod
 from enum import Enum
@@ -115,10 +116,19 @@ class AsyncJob(ABC):
         :param batch: FB batch executor
         """
 
+    @property
+    @abstractmethod
+    def estimated_time_left(self) -> Optional[float]:
+        """Seconds left before the job completes, None if the job did not report its progress yet"""
+
     @abstractmethod
     def get_result(self) -> Iterator[Any]:
         """Retrieve result of the finished job."""
 
+    @abstractmethod
+    def fetch_result(self):
+        """Fetch the first page of the result of the finished job, so that the next get_result starts without waiting for a request"""
+
     @abstractmethod
     def split_job(self) -> List["AsyncJob"]:
         """Split existing job in few smaller ones"""
@@ -156,6 +166,13 @@ class ParentAsyncJob(AsyncJob):
         """Tell if any job previously failed"""
         return any(job.failed for job in self._jobs)
 
+    @property
+    def estimated_time_left(self) -> Optional[float]:
+        """The group completes with its slowest job"""
+        estimates = [job.estimated_time_left for job in self._jobs if not job.completed]
+        known_estimates = [estimate for estimate in estimates if estimate is not None]
+        return max(known_estimates) if known_estimates else None
+
     def update_job(self, batch: Optional[FacebookAdsApiBatch] = None):
         """Checks jobs status in advance."""
         update_in_batch(api=self._api, jobs=self._jobs)
@@ -165,6 +182,11 @@ class ParentAsyncJob(AsyncJob):
         for job in self._jobs:
             yield from job.get_result()
 
+    def fetch_result(self):
+        """Fetch the result of each job in the group."""
+        for job in self._jobs:
+            job.fetch_result()
+
     def split_job(self) -> List["AsyncJob"]:
         """Split existing job in few smaller ones."""
         new_jobs = []
@@ -211,6 +233,8 @@ class InsightAsyncJob(AsyncJob):
         self._start_time = None
         self._finish_time = None
         self._failed = False
+        # the first page of the result fetched in advance followed by the cursor of the next pages
+        self._result: Optional[Iterator[Any]] = None
 
     def split_job(self) -> List["AsyncJob"]:
         """Split existing job in few smaller ones grouped by ParentAsyncJob class."""
@@ -273,6 +297,7 @@ class InsightAsyncJob(AsyncJob):
         self._failed = False
         self._start_time = None
         self._finish_time = None
+        self._result = None
         self.start()
         logger.info(f"{self}: restarted.")
 
@@ -285,6 +310,16 @@ class InsightAsyncJob(AsyncJob):
         end_time = self._finish_time or pendulum.now()
         return end_time - self._start_time
 
+    @property
+    def estimated_time_left(self) -> Optional[float]:
+        """Extrapolate the time left from the elapsed time and the reported completion percentage"""
+        if not self._job or self.completed:
+            return None
+        percent = self._job.get("async_percent_completion") or 0
+        if percent <= 0:
+            return None
+        return self.elapsed_time.total_seconds() * (100 - percent) / percent
+
     @property
     def completed(self) -> bool:
         """Check job status and return True if it is completed, use failed/succeeded to check if it was successful
@@ -356,8 +391,21 @@ class InsightAsyncJob(AsyncJob):
         """Retrieve result of the finished job."""
         if not self._job or self.failed:
             raise RuntimeError(f"{self}: Incorrect usage of get_result - the job is not started or failed")
+        if self._result is not None:
+            # the result fetched in advance is returned once, as its cursor can only be read once
+            result, self._result = self._result, None
+            return result
         return self._job.get_result(params={"limit": self.page_size})
 
+    @backoff_policy
+    def fetch_result(self):
+        """Fetch the first page of the result of the finished job. The next pages are fetched when the result is read,
+        so that at most one page per job is held in memory before it is read.
+        """
+        cursor = iter(self.get_result())
+        first_page = list(itertools.islice(cursor, self.page_size))
+        self._result = itertools.chain(first_page, cursor)
+
     def __str__(self) -> str:
         """String representation of the job wrapper."""
         job_id = self._job["report_run_id"] if self._job else "<None>"
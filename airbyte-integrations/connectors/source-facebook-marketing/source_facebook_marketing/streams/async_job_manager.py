@@ -4,8 +4,11 @@
 
 import logging
 import time
-from typing import TYPE_CHECKING, Iterator, List
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Deque, Dict, Iterator, List, Optional
 
+import pendulum
 from source_facebook_marketing.streams.common import JobException
 
 from .async_job import AsyncJob, ParentAsyncJob, update_in_batch
@@ -20,14 +23,20 @@ class InsightAsyncJobManager:
     """
     Class for managing Ads Insights async jobs. Before running next job it
     checks current insight throttle value and if it greater than THROTTLE_LIMIT variable, no new jobs added.
-    To consume completed jobs use completed_job generator, jobs will be returned in the order they finished.
+    To consume completed jobs use completed_job generator, jobs will be returned in the order their results were fetched.
+    The first pages of the results of the completed jobs are fetched concurrently, while the status of the running jobs keeps being checked
+    as often as their progress suggests they could complete.
     """
 
     # When current insights throttle hit this value no new jobs added.
     THROTTLE_LIMIT = 70
     MAX_NUMBER_OF_ATTEMPTS = 20
-    # Time to wait before checking job status update again.
+    # Maximum time to wait before checking job status update again.
     JOB_STATUS_UPDATE_SLEEP_SECONDS = 30
+    # Minimum time to wait before checking job status update again, doubled while no job reports its progress.
+    MIN_JOB_STATUS_UPDATE_SLEEP_SECONDS = 5
+    # Maximum of completed jobs which results are fetched at the same time.
+    MAX_RESULT_FETCHING_WORKERS = 4
     # Maximum of concurrent jobs that could be scheduled. Since throttling
     # limit is not reliable indicator of async workload capability we still have to use this parameter.
     MAX_JOBS_IN_QUEUE = 100
@@ -66,20 +75,61 @@ class InsightAsyncJobManager:
         """Wait until job is ready and return it. If job
             failed try to restart it for FAILED_JOBS_RESTART_COUNT times. After job
             is completed new jobs added according to current throttling limit.
+            The first page of the result of a completed job is fetched before the job is returned.
 
         :yield: completed jobs
         """
         if not self._running_jobs:
             self._start_jobs()
 
-        while self._running_jobs:
-            completed_jobs = self._check_jobs_status_and_restart()
-            while not completed_jobs:
-                logger.info(f"No jobs ready to be consumed, wait for {self.JOB_STATUS_UPDATE_SLEEP_SECONDS} seconds")
-                time.sleep(self.JOB_STATUS_UPDATE_SLEEP_SECONDS)
-                completed_jobs = self._check_jobs_status_and_restart()
-            yield from completed_jobs
-            self._start_jobs()
+        completed_jobs: Deque[AsyncJob] = deque()
+        fetching_jobs: Dict[Future, AsyncJob] = {}
+        next_status_update: Optional[pendulum.DateTime] = None
+        status_updates_without_completion = 0
+        with ThreadPoolExecutor(max_workers=self.MAX_RESULT_FETCHING_WORKERS, thread_name_prefix="insight_job_result") as executor:
+            while self._running_jobs or completed_jobs or fetching_jobs:
+                if self._running_jobs and (next_status_update is None or pendulum.now() >= next_status_update):
+                    newly_completed_jobs = self._check_jobs_status_and_restart()
+                    if newly_completed_jobs:
+                        completed_jobs.extend(newly_completed_jobs)
+                        status_updates_without_completion = 0
+                        self._start_jobs()
+                    else:
+                        status_updates_without_completion += 1
+                    sleep_seconds = self._job_status_update_sleep_seconds(status_updates_without_completion)
+                    next_status_update = pendulum.now() + pendulum.duration(seconds=sleep_seconds)
+
+                while completed_jobs and len(fetching_jobs) < self.MAX_RESULT_FETCHING_WORKERS:
+                    job = completed_jobs.popleft()
+                    fetching_jobs[executor.submit(self._fetch_result, job)] = job
+
+                wait_seconds = max((next_status_update - pendulum.now()).total_seconds(), 0) if self._running_jobs else None
+                if fetching_jobs:
+                    fetched, _ = wait(fetching_jobs, timeout=wait_seconds, return_when=FIRST_COMPLETED)
+                    for future in fetched:
+                        yield fetching_jobs.pop(future)
+                elif self._running_jobs:
+                    logger.info(f"No jobs ready to be consumed, wait for {wait_seconds:.0f} seconds")
+                    time.sleep(wait_seconds)
+                    next_status_update = None
+
+    def _job_status_update_sleep_seconds(self, status_updates_without_completion: int) -> float:
+        """Time to wait until the first running job is expected to complete, as estimated from the progress reported by the jobs.
+        While some jobs did not report any progress, they are checked with an exponential backoff.
+        """
+        estimates = [job.estimated_time_left for job in self._running_jobs]
+        known_estimates = [estimate for estimate in estimates if estimate is not None]
+        if len(known_estimates) < len(estimates):
+            known_estimates.append(self.MIN_JOB_STATUS_UPDATE_SLEEP_SECONDS * 2 ** max(status_updates_without_completion - 1, 0))
+        return min(max(min(known_estimates, default=0), self.MIN_JOB_STATUS_UPDATE_SLEEP_SECONDS), self.JOB_STATUS_UPDATE_SLEEP_SECONDS)
+
+    @staticmethod
+    def _fetch_result(job: AsyncJob):
+        """Fetch the first page of the result of the job in advance, the job fetches it again when it is read if it failed here"""
+        try:
+            job.fetch_result()
+        except Exception as exc:
+            logger.warning(f"{job}: failed to fetch the result in advance, it will be fetched again when read: {exc}")
 
     def _check_jobs_status_and_restart(self) -> List[AsyncJob]:
         """Checks jobs status in advance and restart if some failed.
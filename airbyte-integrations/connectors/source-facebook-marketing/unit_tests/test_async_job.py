@@ -312,6 +312,44 @@ class TestInsightAsyncJob:
             # in case this is not retried, an error will be raised
             job.get_result()
 
+    def test_fetch_result(self, job, adreport, api):
+        job.start()
+        api.call().json.return_value = {"data": [{"some_data": 123}, {"some_data": 77}]}
+
+        job.fetch_result()
+        result = job.get_result()
+
+        adreport.get_result.assert_called_once()
+        assert [obj.export_all_data() for obj in result] == [{"some_data": 123}, {"some_data": 77}]
+
+        job.get_result()
+        assert adreport.get_result.call_count == 2, "the fetched result should be returned once"
+
+    def test_fetch_result_only_fetches_the_first_page(self, job, adreport, mocker):
+        job.start()
+        rows_read = []
+
+        def cursor():
+            for row in range(250):
+                rows_read.append(row)
+                yield row
+
+        mocker.patch.object(adreport, "get_result", return_value=cursor())
+        job.fetch_result()
+
+        assert len(rows_read) == job.page_size
+        assert list(job.get_result()) == list(range(250))
+
+    @pytest.mark.parametrize(("percent", "expected_time_left"), [(0, None), (25, 30), (50, 10)])
+    def test_estimated_time_left(self, started_job, adreport, mocker, percent, expected_time_left):
+        mocker.patch.object(InsightAsyncJob, "elapsed_time", pendulum.duration(seconds=10))
+        adreport["async_percent_completion"] = percent
+
+        assert started_job.estimated_time_left == expected_time_left
+
+    def test_estimated_time_left_of_completed_job(self, completed_job):
+        assert completed_job.estimated_time_left is None
+
     def test_get_result_when_job_is_not_started(self, job):
         with pytest.raises(RuntimeError, match=r"Incorrect usage of get_result - the job is not started or failed"):
             job.get_result()
@@ -421,6 +459,24 @@ class TestParentAsyncJob:
         assert isinstance(generator, Iterator)
         assert list(generator) == list(range(3, 8)) + list(range(4, 11))
 
+    def test_fetch_result(self, parent_job, grouped_jobs):
+        parent_job.fetch_result()
+
+        for job in grouped_jobs:
+            job.fetch_result.assert_called_once()
+
+    def test_estimated_time_left(self, parent_job, grouped_jobs):
+        for job in grouped_jobs:
+            job.estimated_time_left = None
+        assert parent_job.estimated_time_left is None
+
+        grouped_jobs[0].estimated_time_left = 20
+        grouped_jobs[1].estimated_time_left = 40
+        grouped_jobs[1].completed = True
+        grouped_jobs[2].estimated_time_left = 30
+
+        assert parent_job.estimated_time_left == 30
+
     def test_split_job(self, parent_job, grouped_jobs, mocker):
         grouped_jobs[0].failed = True
         grouped_jobs[0].split_job.return_value = [mocker.Mock(spec=InsightAsyncJob), mocker.Mock(spec=InsightAsyncJob)]
@@ -2,6 +2,8 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import threading
+
 import pytest
 from facebook_business.api import FacebookAdsApiBatch
 from source_facebook_marketing.api import MyFacebookAdsApi
@@ -38,8 +40,8 @@ class TestInsightAsyncManager:
     def test_jobs_completed_immediately(self, api, mocker, time_mock):
         """Manager should emmit jobs without waiting if they completed"""
         jobs = [
-            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False),
-            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False),
+            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, estimated_time_left=None),
+            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, estimated_time_left=None),
         ]
         manager = InsightAsyncJobManager(api=api, jobs=jobs)
         completed_jobs = list(manager.completed_jobs())
@@ -58,8 +60,8 @@ class TestInsightAsyncManager:
 
         update_job_mock.side_effect = update_job_behaviour()
         jobs = [
-            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=False),
-            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=False),
+            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=False, estimated_time_left=None),
+            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=False, estimated_time_left=None),
         ]
         manager = InsightAsyncJobManager(api=api, jobs=jobs)
 
@@ -69,11 +71,78 @@ class TestInsightAsyncManager:
 
         job = next(manager.completed_jobs(), None)
         assert job == jobs[0]
-        time_mock.sleep.assert_called_with(InsightAsyncJobManager.JOB_STATUS_UPDATE_SLEEP_SECONDS)
+        time_mock.sleep.assert_called_once()
+        assert time_mock.sleep.call_args[0][0] == pytest.approx(InsightAsyncJobManager.MIN_JOB_STATUS_UPDATE_SLEEP_SECONDS, abs=1)
 
         job = next(manager.completed_jobs(), None)
         assert job is None
 
+    @pytest.mark.parametrize(
+        ("estimated_time_left", "expected_sleep"),
+        [
+            (12, 12),
+            (1, InsightAsyncJobManager.MIN_JOB_STATUS_UPDATE_SLEEP_SECONDS),
+            (1000, InsightAsyncJobManager.JOB_STATUS_UPDATE_SLEEP_SECONDS),
+        ],
+    )
+    def test_jobs_wait_for_estimated_completion(self, api, mocker, time_mock, update_job_mock, estimated_time_left, expected_sleep):
+        """Manager should check the jobs again when they are expected to be completed"""
+
+        def update_job_behaviour():
+            yield
+            jobs[0].completed = True
+            yield
+
+        update_job_mock.side_effect = update_job_behaviour()
+        jobs = [
+            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=False, estimated_time_left=estimated_time_left),
+        ]
+        manager = InsightAsyncJobManager(api=api, jobs=jobs)
+
+        assert list(manager.completed_jobs()) == jobs
+        time_mock.sleep.assert_called_once()
+        assert time_mock.sleep.call_args[0][0] == pytest.approx(expected_sleep, abs=1)
+
+    def test_jobs_wait_with_backoff_without_progress(self, api, mocker, time_mock, update_job_mock):
+        """Manager should check the jobs less and less often while they do not report their progress"""
+
+        def update_job_behaviour():
+            yield
+            yield
+            yield
+            jobs[0].completed = True
+            yield
+
+        update_job_mock.side_effect = update_job_behaviour()
+        jobs = [mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=False, estimated_time_left=None)]
+        manager = InsightAsyncJobManager(api=api, jobs=jobs)
+
+        assert list(manager.completed_jobs()) == jobs
+        sleeps = [call[0][0] for call in time_mock.sleep.call_args_list]
+        assert sleeps == pytest.approx([5, 10, 20], abs=1)
+
+    def test_jobs_returned_when_their_result_is_fetched(self, api, mocker, time_mock):
+        """Manager should fetch the results of the completed jobs concurrently and return the jobs in the order their results were fetched"""
+        second_result_fetched = threading.Event()
+        jobs = [
+            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=True, estimated_time_left=None),
+            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=True, estimated_time_left=None),
+        ]
+        jobs[0].fetch_result.side_effect = lambda: second_result_fetched.wait(timeout=5)
+        jobs[1].fetch_result.side_effect = second_result_fetched.set
+        manager = InsightAsyncJobManager(api=api, jobs=jobs)
+
+        assert list(manager.completed_jobs()) == [jobs[1], jobs[0]]
+        time_mock.sleep.assert_not_called()
+
+    def test_job_returned_when_its_result_failed_to_be_fetched(self, api, mocker, time_mock):
+        """Manager should return the job whose result could not be fetched in advance, its result is fetched again when read"""
+        jobs = [mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=True, estimated_time_left=None)]
+        jobs[0].fetch_result.side_effect = RuntimeError("connection reset")
+        manager = InsightAsyncJobManager(api=api, jobs=jobs)
+
+        assert list(manager.completed_jobs()) == jobs
+
     def test_job_restarted(self, api, mocker, time_mock, update_job_mock):
         """Manager should restart failed jobs"""
 
@@ -86,8 +155,8 @@ class TestInsightAsyncManager:
 
         update_job_mock.side_effect = update_job_behaviour()
         jobs = [
-            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=True),
-            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=False),
+            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=True, estimated_time_left=None),
+            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=False, estimated_time_left=None),
         ]
         manager = InsightAsyncJobManager(api=api, jobs=jobs)
 
@@ -111,12 +180,12 @@ class TestInsightAsyncManager:
 
         update_job_mock.side_effect = update_job_behaviour()
         jobs = [
-            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=True),
-            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=False),
+            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=True, estimated_time_left=None),
+            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=False, estimated_time_left=None),
         ]
         sub_jobs = [
-            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=True),
-            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=True),
+            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=True, estimated_time_left=None),
+            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=True, estimated_time_left=None),
         ]
         sub_jobs[0].get_result.return_value = [1, 2]
         sub_jobs[1].get_result.return_value = [3, 4]
@@ -144,8 +213,8 @@ class TestInsightAsyncManager:
 
         update_job_mock.side_effect = update_job_behaviour()
         jobs = [
-            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=True),
-            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=False),
+            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=True, estimated_time_left=None),
+            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=False, estimated_time_left=None),
         ]
         manager = InsightAsyncJobManager(api=api, jobs=jobs)
 
@@ -163,12 +232,12 @@ class TestInsightAsyncManager:
 
         update_job_mock.side_effect = update_job_behaviour()
         sub_jobs = [
-            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=True),
-            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=False),
+            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=True, estimated_time_left=None),
+            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=False, estimated_time_left=None),
         ]
         jobs = [
-            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=True),
-            mocker.Mock(spec=ParentAsyncJob, _jobs=sub_jobs, attempt_number=1, failed=False, completed=False),
+            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=True, estimated_time_left=None),
+            mocker.Mock(spec=ParentAsyncJob, _jobs=sub_jobs, attempt_number=1, failed=False, completed=False, estimated_time_left=None),
         ]
         manager = InsightAsyncJobManager(api=api, jobs=jobs)
 
@@ -0,0 +1,96 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import json
+import logging
+import sqlite3
+import time
+import zlib
+from threading import Lock
+from typing import Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+logger = logging.getLogger("airbyte")
+
+# Headers replayed with the cached body, e.g. `Link` for the pagination
+REPLAYED_HEADERS = ["Content-Type", "ETag", "Link"]
+
+
+class ETagCache:
+    """
+    Cache of the responses of the GitHub API by URL, for conditional requests.
+
+    Requests to a cached URL send the ETag of the cached response in the `If-None-Match` header. GitHub answers with `304 Not Modified`
+    when the response did not change, which does not count against the rate limit, and the cached response is replayed instead.
+    Responses are stored in a SQLite database at `path`, which has to be on a volume kept between syncs for them to be reused by the next
+    syncs, or in memory if `path` is not set. The responses are not encrypted.
+    Responses which were not used for `max_age` seconds are dropped when the cache is opened.
+    """
+
+    DEFAULT_MAX_AGE = 30 * 24 * 3600
+
+    def __init__(self, path: Optional[str] = None, max_age: float = DEFAULT_MAX_AGE):
+        self._lock = Lock()
+        self._connection = self._connect(path)
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses WHERE used_at < ?", (time.time() - max_age,))
+
+    @staticmethod
+    def _connect(path: Optional[str]) -> sqlite3.Connection:
+        schema = "CREATE TABLE IF NOT EXISTS responses (url TEXT PRIMARY KEY, etag TEXT, headers TEXT, body BLOB, used_at REAL)"
+        if path:
+            try:
+                connection = sqlite3.connect(path, check_same_thread=False)
+                connection.execute(schema)
+                return connection
+            except sqlite3.Error as exc:
+                logger.warning(f"The ETag cache {path} could not be opened, responses are only cached for this sync: {exc}")
+        connection = sqlite3.connect(":memory:", check_same_thread=False)
+        connection.execute(schema)
+        return connection
+
+    def get_etag(self, url: str) -> Optional[str]:
+        with self._lock:
+            row = self._connection.execute("SELECT etag FROM responses WHERE url = ?", (url,)).fetchone()
+        return row[0] if row else None
+
+    def store(self, response: requests.Response) -> None:
+        etag = response.headers.get("ETag")
+        if response.status_code != requests.codes.OK or not etag:
+            return
+        headers = {name: response.headers[name] for name in REPLAYED_HEADERS if name in response.headers}
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (response.request.url, etag, json.dumps(headers), zlib.compress(response.content), time.time()),
+            )
+
+    def replay(self, response: requests.Response) -> requests.Response:
+        """
+        Return the cached response for the `304 Not Modified` response
+        """
+        with self._lock, self._connection:
+            row = self._connection.execute("SELECT headers, body FROM responses WHERE url = ?", (response.request.url,)).fetchone()
+            self._connection.execute("UPDATE responses SET used_at = ? WHERE url = ?", (time.time(), response.request.url))
+        if row is None:
+            raise ValueError(f"No cached response to replay for {response.request.url}")
+        headers, body = row
+        cached_response = requests.Response()
+        cached_response.status_code = requests.codes.OK
+        # The rate limit headers are the ones of the 304 response
+        cached_response.headers = CaseInsensitiveDict({**response.headers, **json.loads(headers)})
+        cached_response.headers.pop("Content-Length", None)
+        cached_response._content = zlib.decompress(body)
+        cached_response.encoding = get_encoding_from_headers(cached_response.headers)
+        cached_response.url = response.url
+        cached_response.request = response.request
+        cached_response.reason = "OK"
+        return cached_response
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
@@ -2,10 +2,11 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from typing import Any, Dict, List, Mapping, Set, Tuple
+import logging
+from typing import Any, Dict, Iterator, List, Mapping, MutableMapping, Optional, Set, Tuple, Union
 
 from airbyte_cdk import AirbyteLogger
-from airbyte_cdk.models import FailureType, SyncMode
+from airbyte_cdk.models import AirbyteMessage, AirbyteStateMessage, ConfiguredAirbyteCatalog, FailureType, SyncMode
 from airbyte_cdk.sources import AbstractSource
 from airbyte_cdk.sources.streams import Stream
 from airbyte_cdk.sources.streams.http.auth import MultipleTokenAuthenticator
@@ -13,6 +14,7 @@ from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 from source_github.utils import MultipleTokenAuthenticatorWithRateLimiter
 
 from . import constants
+from .etag_cache import ETagCache
 from .streams import (
     Assignees,
     Branches,
@@ -203,6 +205,25 @@ class SourceGithub(AbstractSource):
             user_message = self.user_friendly_error_message(message)
             return False, user_message or message
 
+    def read(
+        self,
+        logger: logging.Logger,
+        config: Mapping[str, Any],
+        catalog: ConfiguredAirbyteCatalog,
+        state: Optional[Union[List[AirbyteStateMessage], MutableMapping[str, Any]]] = None,
+    ) -> Iterator[AirbyteMessage]:
+        try:
+            yield from super().read(logger, config, catalog, state)
+        finally:
+            # the streams share one cache, which is closed once so that its pending writes are committed
+            etag_caches = {
+                id(stream.etag_cache): stream.etag_cache
+                for stream in self._stream_to_instance_map.values()
+                if getattr(stream, "etag_cache", None)
+            }
+            for etag_cache in etag_caches.values():
+                etag_cache.close()
+
     def streams(self, config: Mapping[str, Any]) -> List[Stream]:
         authenticator = self._get_authenticator(config)
         try:
@@ -242,19 +263,21 @@ class SourceGithub(AbstractSource):
             "access_token_type": access_token_type,
         }
         repository_args_with_start_date = {**repository_args, "start_date": config["start_date"]}
+        # The records of these full refresh streams rarely change, they are read with conditional requests if a cache path is configured
+        etag_cache = ETagCache(config["etag_cache_path"]) if config.get("etag_cache_path") else None
 
         default_branches, branches_to_pull = self._get_branches_data(config.get("branch", ""), repository_args)
         pull_requests_stream = PullRequests(**repository_args_with_start_date)
         projects_stream = Projects(**repository_args_with_start_date)
         project_columns_stream = ProjectColumns(projects_stream, **repository_args_with_start_date)
-        teams_stream = Teams(**organization_args)
+        teams_stream = Teams(**organization_args, etag_cache=etag_cache)
         team_members_stream = TeamMembers(parent=teams_stream, **repository_args)
         workflow_runs_stream = WorkflowRuns(**repository_args_with_start_date)
 
         return [
-            Assignees(**repository_args),
-            Branches(**repository_args),
-            Collaborators(**repository_args),
+            Assignees(**repository_args, etag_cache=etag_cache),
+            Branches(**repository_args, etag_cache=etag_cache),
+            Collaborators(**repository_args, etag_cache=etag_cache),
             Comments(**repository_args_with_start_date),
             CommitCommentReactions(**repository_args_with_start_date),
             CommitComments(**repository_args_with_start_date),
@@ -263,7 +286,7 @@ class SourceGithub(AbstractSource):
             Events(**repository_args_with_start_date),
             IssueCommentReactions(**repository_args_with_start_date),
             IssueEvents(**repository_args_with_start_date),
-            IssueLabels(**repository_args),
+            IssueLabels(**repository_args, etag_cache=etag_cache),
             IssueMilestones(**repository_args_with_start_date),
             IssueReactions(**repository_args_with_start_date),
             Issues(**repository_args_with_start_date),
@@ -280,7 +303,7 @@ class SourceGithub(AbstractSource):
             ReviewComments(**repository_args_with_start_date),
             Reviews(**repository_args_with_start_date),
             Stargazers(**repository_args_with_start_date),
-            Tags(**repository_args),
+            Tags(**repository_args, etag_cache=etag_cache),
             teams_stream,
             team_members_stream,
             Users(**organization_args),
@@ -16,6 +16,7 @@ from airbyte_cdk.sources.streams.http.exceptions import DefaultBackoffException
 from requests.exceptions import HTTPError
 
 from . import constants
+from .etag_cache import ETagCache
 from .graphql import CursorStorage, QueryReactions, get_query_issue_reactions, get_query_pull_requests, get_query_reviews
 from .utils import getter
 
@@ -30,10 +31,19 @@ class GithubStream(HttpStream, ABC):
 
     stream_base_params = {}
 
-    def __init__(self, repositories: List[str], page_size_for_large_streams: int, access_token_type: str = "", **kwargs):
+    def __init__(
+        self,
+        repositories: List[str],
+        page_size_for_large_streams: int,
+        access_token_type: str = "",
+        etag_cache: Optional[ETagCache] = None,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
         self.repositories = repositories
         self.access_token_type = access_token_type
+        # Only the full refresh streams whose records rarely change are given a cache, see `SourceGithub.streams`
+        self.etag_cache = etag_cache
 
         # GitHub pagination could be from 1 to 100.
         # This parameter is deprecated and in future will be used sane default, page_size: 10
@@ -62,6 +72,18 @@ class GithubStream(HttpStream, ABC):
             page = dict(parse.parse_qsl(parsed_link.query)).get("page")
             return {"page": page}
 
+    def _send(self, request: requests.PreparedRequest, request_kwargs: Mapping[str, Any]) -> requests.Response:
+        if not self.etag_cache:
+            return super()._send(request, request_kwargs)
+        etag = self.etag_cache.get_etag(request.url)
+        if etag:
+            request.headers["If-None-Match"] = etag
+        response = super()._send(request, request_kwargs)
+        if etag and response.status_code == requests.codes.NOT_MODIFIED:
+            return self.etag_cache.replay(response)
+        self.etag_cache.store(response)
+        return response
+
     def check_graphql_rate_limited(self, response_json) -> bool:
         errors = response_json.get("errors")
         if errors:
@@ -80,7 +102,8 @@ class GithubStream(HttpStream, ABC):
             (response.headers.get("X-RateLimit-Resource") == "graphql" and self.check_graphql_rate_limited(response.json()))
             # Rate limit HTTP headers
             # https://docs.github.com/en/rest/overview/resources-in-the-rest-api#rate-limit-http-headers
-            or (response.status_code != 200 and response.headers.get("X-RateLimit-Remaining") == "0")
+            # 304 responses to conditional requests are not rate limited
+            or (response.status_code not in (200, 304) and response.headers.get("X-RateLimit-Remaining") == "0")
             # Secondary rate limits
             # https://docs.github.com/en/rest/overview/resources-in-the-rest-api#secondary-rate-limits
             or "Retry-After" in response.headers
@@ -378,10 +401,11 @@ class Organizations(GithubStream):
     # GitHub pagination could be from 1 to 100.
     page_size = 100
 
-    def __init__(self, organizations: List[str], access_token_type: str = "", **kwargs):
+    def __init__(self, organizations: List[str], access_token_type: str = "", etag_cache: Optional[ETagCache] = None, **kwargs):
         super(GithubStream, self).__init__(**kwargs)
         self.organizations = organizations
         self.access_token_type = access_token_type
+        self.etag_cache = etag_cache
 
     def stream_slices(self, **kwargs) -> Iterable[Optional[Mapping[str, Any]]]:
         for organization in self.organizations:
@@ -3,15 +3,24 @@
 #
 
 import logging
+import re
 import time
-from itertools import cycle
+from functools import partial
+from threading import Lock
 from types import SimpleNamespace
-from typing import List
+from typing import Dict, List
+from urllib import parse
 
+import requests
 from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources.streams import Stream
 from airbyte_cdk.sources.streams.http.requests_native_auth.abstract_token import AbstractHeaderAuthenticator
 
+# https://docs.github.com/en/rest/rate-limit
+CORE_RESOURCE = "core"
+GRAPHQL_RESOURCE = "graphql"
+SEARCH_RESOURCE = "search"
+
 
 def getter(D: dict, key_or_keys, strict=True):
     if not isinstance(key_or_keys, list):
@@ -34,10 +43,13 @@ def read_full_refresh(stream_instance: Stream):
 
 class MultipleTokenAuthenticatorWithRateLimiter(AbstractHeaderAuthenticator):
     """
-    Each token in the cycle is checked against the rate limiter.
-    If a token exceeds the capacity limit, the system switches to another token.
-    If all tokens are exhausted, the system will enter a sleep state until
-    the first token becomes available again.
+    Each request is sent with the token which has the most requests left for the rate limit resource of the request:
+    `graphql` for the GraphQL API, `search` for the search API and `core` for the rest of the REST API.
+    The requests left start at `requests_per_hour` and are updated from the `X-RateLimit-*` headers of the responses,
+    so the requests used by other clients of a token are taken into account.
+    If all tokens are exhausted for the resource, the system will enter a sleep state until
+    the earliest reset of the tokens.
+    https://docs.github.com/en/rest/overview/resources-in-the-rest-api#rate-limit-http-headers
     """
 
     DURATION = 3600  # seconds
@@ -45,10 +57,10 @@ class MultipleTokenAuthenticatorWithRateLimiter(AbstractHeaderAuthenticator):
     def __init__(self, tokens: List[str], requests_per_hour: int, auth_method: str = "Bearer", auth_header: str = "Authorization"):
         self._auth_method = auth_method
         self._auth_header = auth_header
-        now = time.time()
         self._requests_per_hour = requests_per_hour
-        self._tokens = {t: SimpleNamespace(count=self._requests_per_hour, update_at=now) for t in tokens}
-        self._tokens_iter = cycle(self._tokens)
+        # token -> resource -> SimpleNamespace(count, reset_at)
+        self._tokens: Dict[str, Dict[str, SimpleNamespace]] = {t: {} for t in tokens}
+        self._lock = Lock()
 
     @property
     def auth_header(self) -> str:
@@ -56,33 +68,73 @@ class MultipleTokenAuthenticatorWithRateLimiter(AbstractHeaderAuthenticator):
 
     @property
     def token(self) -> str:
+        return f"{self._auth_method} {self._next_token(CORE_RESOURCE)}"
+
+    def __call__(self, request: requests.PreparedRequest) -> requests.PreparedRequest:
+        resource = self._resource(request.url)
+        token = self._next_token(resource)
+        request.headers[self.auth_header] = f"{self._auth_method} {token}"
+        request.register_hook("response", partial(self._update_from_headers, token, resource))
+        return request
+
+    @staticmethod
+    def _resource(url: str) -> str:
+        """rate limit resource of the request, GitHub Enterprise paths start with `/api`"""
+        path = re.sub(r"^/api(/v3)?", "", parse.urlparse(url).path)
+        if path.rstrip("/") == "/graphql":
+            return GRAPHQL_RESOURCE
+        if path.startswith("/search/"):
+            return SEARCH_RESOURCE
+        return CORE_RESOURCE
+
+    def _next_token(self, resource: str) -> str:
+        """take a request from the token with the most requests left"""
         while True:
-            token = next(self._tokens_iter)
-            if self._check_token(token):
-                return f"{self._auth_method} {token}"
-
-    def _check_token(self, token: str):
-        """check that token is not limited"""
-        self._refill()
-        if self._sleep():
-            self._refill()
-        if self._tokens[token].count > 0:
-            self._tokens[token].count -= 1
-            return True
-
-    def _refill(self):
-        """refill all needed tokens"""
-        now = time.time()
-        for token, ns in self._tokens.items():
-            if now - ns.update_at >= self.DURATION:
-                ns.update_at = now
-                ns.count = self._requests_per_hour
-
-    def _sleep(self):
-        """sleep only if all tokens is exhausted"""
-        now = time.time()
-        if sum([ns.count for ns in self._tokens.values()]) == 0:
-            sleep_time = self.DURATION - (now - min([ns.update_at for ns in self._tokens.values()]))
-            logging.warning("Sleeping for %.1f seconds to enforce the limit of %d requests per hour.", sleep_time, self._requests_per_hour)
-            time.sleep(sleep_time)
-            return True
+            with self._lock:
+                now = time.time()
+                budgets = {token: self._budget(token, resource, now) for token in self._tokens}
+                token = max(budgets, key=lambda t: budgets[t].count)
+                if budgets[token].count > 0:
+                    budgets[token].count -= 1
+                    return token
+                sleep_time = min(budget.reset_at for budget in budgets.values()) - now
+            # the lock is released while sleeping so that the responses being received can update the requests left
+            self._sleep(sleep_time, resource)
+
+    def _budget(self, token: str, resource: str, now: float) -> SimpleNamespace:
+        """requests left for the token and the resource, refilled after the reset"""
+        budget = self._tokens[token].get(resource)
+        if budget is None or now >= budget.reset_at:
+            budget = self._tokens[token][resource] = SimpleNamespace(count=self._requests_per_hour, reset_at=now + self.DURATION)
+        return budget
+
+    def _update_from_headers(self, token: str, resource: str, response: requests.Response, *args, **kwargs) -> None:
+        """response hook updating the requests left for the token from the rate limit headers"""
+        try:
+            remaining = int(response.headers["X-RateLimit-Remaining"])
+            reset_at = float(response.headers["X-RateLimit-Reset"])
+            limit = int(response.headers.get("X-RateLimit-Limit", remaining))
+        except (KeyError, ValueError):
+            return
+        resource = response.headers.get("X-RateLimit-Resource", resource)
+        # the requests already used in the window, by this sync or not, count towards `requests_per_hour`
+        left = max(0, min(remaining, self._requests_per_hour - (limit - remaining)))
+        with self._lock:
+            budget = self._budget(token, resource, time.time())
+            if reset_at > budget.reset_at:
+                # a new window started
+                budget.count = left
+            else:
+                budget.count = min(budget.count, left)
+            budget.reset_at = reset_at
+
+    def _sleep(self, sleep_time: float, resource: str):
+        """sleep until the earliest reset when all tokens are exhausted"""
+        sleep_time = max(sleep_time, 0)
+        logging.warning(
+            "Sleeping for %.1f seconds to enforce the limit of %d requests per hour for the `%s` resource.",
+            sleep_time,
+            self._requests_per_hour,
+            resource,
+        )
+        time.sleep(sleep_time)
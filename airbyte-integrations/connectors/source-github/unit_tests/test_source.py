@@ -7,8 +7,10 @@ import time
 from unittest.mock import MagicMock
 
 import pytest
+import requests
 import responses
 from airbyte_cdk.models import AirbyteConnectionStatus, Status
+from airbyte_cdk.sources import AbstractSource
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 from freezegun import freeze_time
 from source_github import constants
@@ -226,31 +228,96 @@ def test_multiple_token_authenticator_with_rate_limiter(monkeypatch):
     with freeze_time("2021-01-01 12:00:00") as frozen_time:
 
         authenticator = MultipleTokenAuthenticatorWithRateLimiter(tokens=["token1", "token2"], requests_per_hour=4)
-        authenticator._tokens["token1"].count = 2
-
         assert authenticator.token == "Bearer token1"
         frozen_time.tick(delta=datetime.timedelta(seconds=1))
+        authenticator._tokens["token1"]["core"].count = 1
+
+        # the token with the most requests left is used
         assert authenticator.token == "Bearer token2"
         frozen_time.tick(delta=datetime.timedelta(seconds=1))
-        assert authenticator.token == "Bearer token1"
-        frozen_time.tick(delta=datetime.timedelta(seconds=1))
         assert authenticator.token == "Bearer token2"
         frozen_time.tick(delta=datetime.timedelta(seconds=1))
-
-        # token1 is fully exhausted, token2 is still used
-        assert authenticator._tokens["token1"].count == 0
         assert authenticator.token == "Bearer token2"
         frozen_time.tick(delta=datetime.timedelta(seconds=1))
+        assert authenticator.token == "Bearer token1"
+        frozen_time.tick(delta=datetime.timedelta(seconds=1))
         assert authenticator.token == "Bearer token2"
         frozen_time.tick(delta=datetime.timedelta(seconds=1))
         assert called_args == []
 
-        # now we have to sleep because all tokens are exhausted
+        # now we have to sleep until the earliest reset because all tokens are exhausted
         assert authenticator.token == "Bearer token1"
         assert called_args == [3594.0]
 
-        assert authenticator._tokens["token1"].count == 3
-        assert authenticator._tokens["token2"].count == 4
+        assert authenticator._tokens["token1"]["core"].count == 3
+        assert authenticator._tokens["token2"]["core"].count == 4
+
+
+@responses.activate
+def test_multiple_token_authenticator_with_rate_limiter_reads_rate_limit_headers(monkeypatch):
+    called_args = []
+
+    def sleep_mock(seconds):
+        frozen_time.tick(delta=datetime.timedelta(seconds=seconds))
+        called_args.append(seconds)
+
+    monkeypatch.setattr(time, "sleep", sleep_mock)
+
+    with freeze_time("2021-01-01 12:00:00") as frozen_time:
+        now = int(time.time())
+        session = requests.Session()
+        session.auth = MultipleTokenAuthenticatorWithRateLimiter(tokens=["token1", "token2"], requests_per_hour=1000)
+
+        def rate_limit_headers(resource, remaining, reset_in, limit=5000):
+            return {
+                "X-RateLimit-Resource": resource,
+                "X-RateLimit-Limit": str(limit),
+                "X-RateLimit-Remaining": str(remaining),
+                "X-RateLimit-Reset": str(now + reset_in),
+            }
+
+        responses.get("https://api.github.com/repos/airbytehq/airbyte", headers=rate_limit_headers("core", 4700, 1200))
+        responses.get("https://api.github.com/repos/airbytehq/airbyte", headers=rate_limit_headers("core", 0, 600))
+        responses.get("https://api.github.com/repos/airbytehq/airbyte", headers=rate_limit_headers("core", 4699, 1200))
+        responses.post("https://api.github.com/graphql", headers=rate_limit_headers("graphql", 4999, 3000))
+
+        def send(method, url):
+            response = session.request(method, url)
+            return response.request.headers["Authorization"]
+
+        # token1 was used for 300 requests by another sync, so 700 requests are left for the limit of 1000 requests per hour
+        assert send("GET", "https://api.github.com/repos/airbytehq/airbyte") == "Bearer token1"
+        # token2 has the most requests left, its rate limit is exceeded
+        assert send("GET", "https://api.github.com/repos/airbytehq/airbyte") == "Bearer token2"
+        assert session.auth._tokens["token1"]["core"].count == 700
+        assert session.auth._tokens["token2"]["core"].count == 0
+        assert send("GET", "https://api.github.com/repos/airbytehq/airbyte") == "Bearer token1"
+
+        # the GraphQL API has its own rate limit
+        assert send("POST", "https://api.github.com/graphql") == "Bearer token1"
+        assert send("POST", "https://api.github.com/graphql") == "Bearer token2"
+        assert called_args == []
+
+        # when all tokens are exhausted, the sleep lasts until the earliest reset
+        session.auth._tokens["token1"]["core"].count = 0
+        assert send("GET", "https://api.github.com/repos/airbytehq/airbyte") == "Bearer token2"
+        assert called_args == [600.0]
+
+
+def test_multiple_token_authenticator_with_rate_limiter_sleeps_without_the_lock(monkeypatch):
+    authenticator = MultipleTokenAuthenticatorWithRateLimiter(tokens=["token1"], requests_per_hour=1)
+    locked_while_sleeping = []
+
+    def sleep_mock(seconds):
+        locked_while_sleeping.append(authenticator._lock.locked())
+        frozen_time.tick(delta=datetime.timedelta(seconds=seconds))
+
+    monkeypatch.setattr(time, "sleep", sleep_mock)
+
+    with freeze_time("2021-01-01 12:00:00") as frozen_time:
+        assert authenticator.token == "Bearer token1"
+        assert authenticator.token == "Bearer token1"
+    assert locked_while_sleeping == [False]
 
 
 @responses.activate
@@ -273,3 +340,36 @@ def test_streams_page_size():
             assert stream.page_size == constants.DEFAULT_PAGE_SIZE_FOR_LARGE_STREAM
         else:
             assert stream.page_size == constants.DEFAULT_PAGE_SIZE
+
+
+@responses.activate
+@pytest.mark.parametrize("etag_cache_path", [None, "etags.sqlite"])
+def test_streams_etag_cache_is_only_used_when_configured(tmp_path, etag_cache_path):
+    responses.get("https://api.github.com/repos/airbytehq/airbyte", json={"full_name": "airbytehq/airbyte", "default_branch": "master"})
+    responses.get("https://api.github.com/repos/airbytehq/airbyte/branches", json=[{"repository": "airbytehq/airbyte", "name": "master"}])
+    config = {"credentials": {"access_token": "access_token"}, "repository": "airbytehq/airbyte", "start_date": "1900-07-12T00:00:00Z"}
+    if etag_cache_path:
+        config["etag_cache_path"] = str(tmp_path / etag_cache_path)
+
+    streams = {stream.name: stream for stream in SourceGithub().streams(config)}
+
+    assert (streams["tags"].etag_cache is not None) == bool(etag_cache_path)
+    assert streams["pull_requests"].etag_cache is None
+    assert (tmp_path / "etags.sqlite").exists() == bool(etag_cache_path)
+
+
+def test_read_closes_the_etag_cache_once(mocker):
+    source = SourceGithub()
+    etag_cache = mocker.Mock()
+    streams = [mocker.Mock(etag_cache=etag_cache), mocker.Mock(etag_cache=etag_cache), mocker.Mock(etag_cache=None)]
+
+    def read(*args, **kwargs):
+        source._stream_to_instance_map = {str(index): stream for index, stream in enumerate(streams)}
+        yield from []
+        raise RuntimeError("sync failed")
+
+    mocker.patch.object(AbstractSource, "read", side_effect=read)
+    with pytest.raises(RuntimeError):
+        list(source.read(mocker.Mock(), {}, mocker.Mock()))
+
+    etag_cache.close.assert_called_once()
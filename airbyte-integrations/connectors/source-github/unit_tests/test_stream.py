@@ -14,6 +14,7 @@ from airbyte_cdk.sources.streams.http.exceptions import BaseBackoffException
 from requests import HTTPError
 from responses import matchers
 from source_github import constants
+from source_github.etag_cache import ETagCache
 from source_github.streams import (
     Branches,
     Collaborators,
@@ -1284,3 +1285,51 @@ def test_stream_pull_request_comment_reactions_read():
     ]
 
     assert stream_state == {"airbytehq/airbyte": {"created_at": "2022-01-02T00:00:01Z"}}
+
+
+@responses.activate
+def test_stream_tags_conditional_requests_replay_unchanged_pages(tmp_path):
+    cache_path = str(tmp_path / "etags.sqlite")
+    repository_args = {"repositories": ["organization/repository"], "page_size_for_large_streams": 100}
+    url = "https://api.github.com/repos/organization/repository/tags"
+    first_page_headers = {"ETag": '"etag-1"', "Link": f'<{url}?per_page=100&page=2>; rel="next"'}
+    responses.add("GET", url, json=[{"name": "v1"}], headers=first_page_headers, match=[matchers.query_param_matcher({"per_page": 100})])
+    responses.add(
+        "GET", url, json=[{"name": "v2"}], headers={"ETag": '"etag-2"'}, match=[matchers.query_param_matcher({"per_page": 100, "page": 2})]
+    )
+
+    stream = Tags(**repository_args, etag_cache=ETagCache(cache_path))
+    expected_records = [{"name": "v1", "repository": "organization/repository"}, {"name": "v2", "repository": "organization/repository"}]
+    assert list(read_full_refresh(stream)) == expected_records
+    assert [call.request.headers.get("If-None-Match") for call in responses.calls] == [None, None]
+
+    # The next sync, with a new cache instance, sends the ETags and replays the unchanged first page, then reads the changed second page
+    responses.reset()
+    responses.add(
+        "GET",
+        url,
+        status=304,
+        match=[matchers.query_param_matcher({"per_page": 100}), matchers.header_matcher({"If-None-Match": '"etag-1"'})],
+    )
+    responses.add(
+        "GET",
+        url,
+        json=[{"name": "v3"}],
+        headers={"ETag": '"etag-3"'},
+        match=[matchers.query_param_matcher({"per_page": 100, "page": 2}), matchers.header_matcher({"If-None-Match": '"etag-2"'})],
+    )
+
+    stream = Tags(**repository_args, etag_cache=ETagCache(cache_path))
+    assert list(read_full_refresh(stream)) == [expected_records[0], {"name": "v3", "repository": "organization/repository"}]
+    assert len(responses.calls) == 2
+    assert ETagCache(cache_path).get_etag(f"{url}?per_page=100&page=2") == '"etag-3"'
+
+
+@responses.activate
+def test_stream_teams_responses_without_etag_are_not_cached():
+    cache = ETagCache()
+    stream = Teams(organizations=["org"], etag_cache=cache)
+    responses.add("GET", "https://api.github.com/orgs/org/teams", json=[{"id": 1}])
+
+    assert list(read_full_refresh(stream)) == [{"id": 1, "organization": "org"}]
+    assert cache.get_etag("https://api.github.com/orgs/org/teams?per_page=100") is None
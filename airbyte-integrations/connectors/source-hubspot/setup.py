@@ -6,7 +6,7 @@
 from setuptools import find_packages, setup
 
 MAIN_REQUIREMENTS = [
-    "airbyte-cdk",
+    "airbyte-cdk>=0.52.0",
     "backoff==1.11.1",
     "pendulum==2.1.2",
     "requests==2.26.0",
@@ -5,10 +5,11 @@
 import logging
 from http import HTTPStatus
 from itertools import chain
-from typing import Any, List, Mapping, Optional, Tuple
+from typing import Any, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 import requests
 from airbyte_cdk.logger import AirbyteLogger
+from airbyte_cdk.models import AirbyteMessage, AirbyteStateMessage, ConfiguredAirbyteCatalog
 from airbyte_cdk.sources import AbstractSource
 from airbyte_cdk.sources.streams import Stream
 from requests import HTTPError
@@ -42,6 +43,7 @@ from source_hubspot.streams import (
     OwnersArchived,
     Products,
     PropertyHistory,
+    Stream as HubspotStream,
     SubscriptionChanges,
     TicketPipelines,
     Tickets,
@@ -94,6 +96,20 @@ class SourceHubspot(AbstractSource):
         api = self.get_api(config=config)
         return dict(api=api, start_date=start_date, credentials=credentials)
 
+    def read(
+        self,
+        logger: logging.Logger,
+        config: Mapping[str, Any],
+        catalog: ConfiguredAirbyteCatalog,
+        state: Optional[Union[List[AirbyteStateMessage], MutableMapping[str, Any]]] = None,
+    ) -> Iterator[AirbyteMessage]:
+        try:
+            yield from super().read(logger, config, catalog, state)
+        finally:
+            for stream in self._stream_to_instance_map.values():
+                if isinstance(stream, HubspotStream):
+                    stream.log_discarded_properties()
+
     def streams(self, config: Mapping[str, Any]) -> List[Stream]:
         credentials = config.get("credentials", {})
         common_params = self.get_common_params(config=config)
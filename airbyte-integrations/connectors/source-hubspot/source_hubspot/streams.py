@@ -7,10 +7,10 @@ import logging
 import sys
 import time
 from abc import ABC, abstractmethod
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
 from functools import cached_property, lru_cache
 from http import HTTPStatus
-from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Set, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional, Set, Tuple, Union
 
 import backoff
 import pendulum as pendulum
@@ -25,6 +25,7 @@ from airbyte_cdk.sources.streams.core import StreamData
 from airbyte_cdk.sources.streams.http import HttpStream
 from airbyte_cdk.sources.streams.http.availability_strategy import HttpAvailabilityStrategy
 from airbyte_cdk.sources.streams.http.requests_native_auth import Oauth2Authenticator, TokenAuthenticator
+from airbyte_cdk.sources.utils.property_chunks import fetch_property_chunks
 from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
 from airbyte_cdk.utils import AirbyteTracedException
 from requests import HTTPError, codes
@@ -64,6 +65,20 @@ CUSTOM_FIELD_TYPE_TO_VALUE = {
 CUSTOM_FIELD_VALUE_TO_TYPE = {v: k for k, v in CUSTOM_FIELD_TYPE_TO_VALUE.items()}
 
 
+def parse_datetime(value: Any) -> datetime:
+    """
+    Parse ISO 8601 strings with `datetime.fromisoformat`, which is much faster than pendulum, and fallback to pendulum for the other formats.
+    Like pendulum, datetimes without timezone are in UTC.
+    """
+    if isinstance(value, str):
+        try:
+            dt = datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+            return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+        except ValueError:
+            pass
+    return pendulum.parse(value)
+
+
 def retry_token_expired_handler(**kwargs):
     """Retry helper when token expired"""
 
@@ -292,6 +307,7 @@ class Stream(HttpStream, ABC):
     denormalize_records: bool = False  # one record from API response can result in multiple records emitted
     granted_scopes: Set = None
     properties_scopes: Set = None
+    property_chunk_concurrency_limit = 4  # requests of the chunks of properties of a page sent at once
 
     @property
     @abstractmethod
@@ -344,6 +360,8 @@ class Stream(HttpStream, ABC):
         creds_title = self._credentials["credentials_title"]
         if creds_title in (OAUTH_CREDENTIALS, PRIVATE_APP_CREDENTIALS):
             self._authenticator = api.get_authenticator()
+        # properties of the records missing from the properties schema, logged once at the end of the sync
+        self._discarded_properties: Set[str] = set()
 
     def should_retry(self, response: requests.Response) -> bool:
         if response.status_code == HTTPStatus.UNAUTHORIZED:
@@ -420,12 +438,20 @@ class Stream(HttpStream, ABC):
         post_processor: IRecordPostProcessor = GroupByKey(self.primary_key) if group_by_pk else StoreAsIs()
         response = None
 
-        properties = self._property_wrapper
-        for chunk in properties.split():
-            response = self.handle_request(
-                stream_slice=stream_slice, stream_state=stream_state, next_page_token=next_page_token, properties=chunk
+        def fetch_chunk(chunk_index: int) -> Tuple[List, requests.Response]:
+            chunk_response = self.handle_request(
+                stream_slice=stream_slice, stream_state=stream_state, next_page_token=next_page_token, properties=chunks[chunk_index]
             )
-            for record in self._transform(self.parse_response(response, stream_state=stream_state)):
+            return list(self._transform(self.parse_response(chunk_response, stream_state=stream_state))), chunk_response
+
+        chunks = list(self._property_wrapper.split())
+        # The cassette of the cache is not thread-safe
+        max_workers = 1 if self.use_cache else self.property_chunk_concurrency_limit
+        fetched_chunks = dict(fetch_property_chunks(range(len(chunks)), fetch_chunk, max_workers))
+        # The chunks are merged in their order, so that the records and the last response do not depend on which request was the fastest
+        for chunk_index in range(len(chunks)):
+            records, response = fetched_chunks.pop(chunk_index)
+            for record in records:
                 post_processor.add_record(record)
 
         return post_processor.flat, response
@@ -491,35 +517,63 @@ class Stream(HttpStream, ABC):
         return super().parse_response_error_message(response)
 
     @staticmethod
-    def _convert_datetime_to_string(dt: pendulum.datetime, declared_format: str = None) -> str:
+    def _convert_datetime_to_string(dt: datetime, declared_format: str = None) -> str:
         if declared_format == "date":
-            return dt.to_date_string()
+            return dt.date().isoformat()
         elif declared_format == "date-time":
-            return dt.to_rfc3339_string()
+            return dt.isoformat()
 
     @classmethod
     def _cast_datetime(cls, field_name: str, field_value: Any, declared_format: str = None) -> Any:
         """
         If format is date/date-time, but actual value is timestamp, convert timestamp to date/date-time string.
         """
-        if not field_value:
-            return field_value
+        return cls._compile_datetime_caster(field_name, declared_format=declared_format)(field_value)
 
-        try:
-            dt = pendulum.parse(field_value)
-            return cls._convert_datetime_to_string(dt, declared_format=declared_format)
-        except (ValueError, TypeError) as ex:
-            logger.warning(
-                f"Couldn't parse date/datetime string in {field_name}, trying to parse timestamp... Field value: {field_value}. Ex: {ex}"
-            )
+    @classmethod
+    def _compile_datetime_caster(cls, field_name: str, declared_format: str = None) -> Callable[[Any], Any]:
+        """
+        Return the function casting the values of a date/date-time field, see `_cast_datetime`.
+        The values of a field share their format: once a value was a timestamp, the next values are parsed as timestamps first.
+        """
+        values_are_timestamps = False
 
-        try:
-            dt = pendulum.from_timestamp(int(field_value) / 1000)
+        def parse_timestamp(field_value: Any) -> datetime:
+            return datetime.fromtimestamp(int(field_value) / 1000, tz=timezone.utc)
+
+        def cast_datetime(field_value: Any) -> Any:
+            nonlocal values_are_timestamps
+            if not field_value:
+                return field_value
+
+            if values_are_timestamps:
+                try:
+                    return cls._convert_datetime_to_string(parse_timestamp(field_value), declared_format=declared_format)
+                except (ValueError, TypeError):
+                    pass
+
+            try:
+                dt = parse_datetime(field_value)
+                return cls._convert_datetime_to_string(dt, declared_format=declared_format)
+            except (ValueError, TypeError) as ex:
+                if values_are_timestamps:
+                    logger.warning(
+                        f"Couldn't parse date/datetime string or timestamp in {field_name}. Field value: {field_value}. Ex: {ex}"
+                    )
+                    return field_value
+                logger.warning(
+                    f"Couldn't parse date/datetime string in {field_name}, trying to parse timestamp... Field value: {field_value}. Ex: {ex}"
+                )
+
+            try:
+                dt = parse_timestamp(field_value)
+            except (ValueError, TypeError) as ex:
+                logger.warning(f"Couldn't parse timestamp in {field_name}. Field value: {field_value}. Ex: {ex}")
+                return field_value
+            values_are_timestamps = True
             return cls._convert_datetime_to_string(dt, declared_format=declared_format)
-        except (ValueError, TypeError) as ex:
-            logger.warning(f"Couldn't parse timestamp in {field_name}. Field value: {field_value}. Ex: {ex}")
 
-        return field_value
+        return cast_datetime
 
     @classmethod
     def _cast_value(cls, declared_field_types: List, field_name: str, field_value: Any, declared_format: str = None) -> Any:
@@ -531,74 +585,96 @@ class Stream(HttpStream, ABC):
         :param declared_format format field value from catalog schema
         :return Converted value for record
         """
+        return cls._compile_field_caster(declared_field_types, field_name, declared_format=declared_format)(field_value)
 
-        if "null" in declared_field_types:
-            if field_value is None:
+    @classmethod
+    def _compile_field_caster(cls, declared_field_types: List, field_name: str, declared_format: str = None) -> Callable[[Any], Any]:
+        """
+        Return the function casting the values of a field, see `_cast_value`.
+        Everything depending only on the declared schema of the field is resolved once, rather than for every value.
+        """
+        nullable = "null" in declared_field_types
+        cast_datetime = cls._compile_datetime_caster(field_name, declared_format) if declared_format in ["date", "date-time"] else None
+        declared_types = {field_type for field_type, type_name in CUSTOM_FIELD_TYPE_TO_VALUE.items() if type_name in declared_field_types}
+        target_type_name = next(filter(lambda t: t != "null", declared_field_types), None)
+        target_type = CUSTOM_FIELD_VALUE_TO_TYPE.get(target_type_name)
+
+        def cast_value(field_value: Any) -> Any:
+            if nullable:
+                if field_value is None:
+                    return field_value
+                # Sometime hubspot output empty string on field with format set.
+                # Set it to null to avoid errors on destination' normalization stage.
+                if declared_format and field_value == "":
+                    return None
+
+            if cast_datetime:
+                field_value = cast_datetime(field_value)
+
+            if type(field_value) in declared_types:
                 return field_value
-            # Sometime hubspot output empty string on field with format set.
-            # Set it to null to avoid errors on destination' normalization stage.
-            if declared_format and field_value == "":
-                return None
 
-        if declared_format in ["date", "date-time"]:
-            field_value = cls._cast_datetime(field_name, field_value, declared_format=declared_format)
+            if target_type_name == "boolean" and type(field_value) is str:
+                # do not cast string with bool function to prevent : bool("false") = True
+                if field_value.lower() in ["true", "false"]:
+                    return field_value.lower() == "true"
 
-        actual_field_type = type(field_value)
-        actual_field_type_name = CUSTOM_FIELD_TYPE_TO_VALUE.get(actual_field_type)
-        if actual_field_type_name in declared_field_types:
-            return field_value
+            value_type = target_type
+            if target_type_name == "number":
+                # do not cast numeric IDs into float, use integer instead
+                value_type = int if field_value.isnumeric() else target_type
+                field_value = field_value.replace(",", "")
 
-        target_type_name = next(filter(lambda t: t != "null", declared_field_types))
-        target_type = CUSTOM_FIELD_VALUE_TO_TYPE.get(target_type_name)
+            if target_type_name != "string" and field_value == "":
+                # do not cast empty strings, return None instead to be properly casted.
+                return None
 
-        if target_type_name == "boolean" and actual_field_type_name == "string":
-            # do not cast string with bool function to prevent : bool("false") = True
-            if str(field_value).lower() in ["true", "false"]:
-                field_value = str(field_value).lower() == "true"
+            try:
+                return value_type(field_value)
+            except ValueError:
+                logger.exception(f"Could not cast in stream `{cls.__name__}` `{field_name}` {field_value=} to `{value_type}`")
                 return field_value
 
-        if target_type_name == "number":
-            # do not cast numeric IDs into float, use integer instead
-            target_type = int if field_value.isnumeric() else target_type
-            field_value = field_value.replace(",", "")
-
-        if target_type_name != "string" and field_value == "":
-            # do not cast empty strings, return None instead to be properly casted.
-            field_value = None
-            return field_value
+        return cast_value
 
-        try:
-            casted_value = target_type(field_value)
-        except ValueError:
-            logger.exception(f"Could not cast in stream `{cls.__name__}` `{field_name}` {field_value=} to `{target_type}`")
-            return field_value
+    @classmethod
+    def _compile_field_casters(cls, properties: Mapping[str, Any]) -> Mapping[str, Callable[[Any], Any]]:
+        casters = {}
+        for field_name, field_schema in properties.items():
+            declared_field_types = field_schema.get("type", [])
+            if isinstance(declared_field_types, str):
+                declared_field_types = [declared_field_types]
+            casters[field_name] = cls._compile_field_caster(declared_field_types, field_name, declared_format=field_schema.get("format"))
+        return casters
 
-        return casted_value
+    @cached_property
+    def _field_casters(self) -> Mapping[str, Callable[[Any], Any]]:
+        """The casters of the properties of the records, compiled once from the properties schema"""
+        return self._compile_field_casters(self.properties)
 
     def _cast_record_fields_if_needed(self, record: Mapping, properties: Mapping[str, Any] = None) -> Mapping:
         if not self.entity or not record.get("properties"):
             return record
 
-        properties = properties or self.properties
-
-        for field_name, field_value in record["properties"].items():
-            if field_name not in properties:
-                self.logger.info(
-                    "Property discarded: not maching with properties schema: record id:{}, property_value: {}".format(
-                        record.get("id"), field_name
-                    )
-                )
+        field_casters = self._compile_field_casters(properties) if properties else self._field_casters
+        record_properties = record["properties"]
+        for field_name, field_value in record_properties.items():
+            cast = field_casters.get(field_name)
+            if cast is None:
+                self._discarded_properties.add(field_name)
                 continue
-            declared_field_types = properties[field_name].get("type", [])
-            if not isinstance(declared_field_types, Iterable):
-                declared_field_types = [declared_field_types]
-            format = properties[field_name].get("format")
-            record["properties"][field_name] = self._cast_value(
-                declared_field_types=declared_field_types, field_name=field_name, field_value=field_value, declared_format=format
-            )
+            record_properties[field_name] = cast(field_value)
 
         return record
 
+    def log_discarded_properties(self):
+        """Log the properties which were discarded from the records during the sync because they are missing from the properties schema"""
+        if self._discarded_properties:
+            self.logger.info(
+                f"Properties discarded: not matching with properties schema of {self.name}: {', '.join(sorted(self._discarded_properties))}"
+            )
+            self._discarded_properties.clear()
+
     def _transform(self, records: Iterable) -> Iterable:
         """Preprocess record before emitting"""
         for record in records:
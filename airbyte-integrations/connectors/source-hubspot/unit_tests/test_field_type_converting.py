@@ -100,8 +100,19 @@ def test_cast_type_if_needed(declared_field_types, field_name, field_value, form
         (None, "date", None),
         ("2022-02-23 09:27:45", "date", "2022-02-23"),
         ("2022-05-28", "date-time", "2022-05-28T00:00:00+00:00"),
+        ("2022-02-23T09:27:45.123Z", "date-time", "2022-02-23T09:27:45.123000+00:00"),
+        ("2022-02-23T09:27:45+02:00", "date-time", "2022-02-23T09:27:45+02:00"),
+        ("2022-02-23T23:27:45-02:00", "date", "2022-02-23"),
     ],
 )
 def test_cast_timestamp_to_date(field_value, declared_format, expected_casted_value):
     casted_value = Stream._cast_datetime("hs_recurring_billing_end_date", field_value, declared_format=declared_format)
     assert casted_value == expected_casted_value
+
+
+def test_compiled_datetime_caster_remembers_timestamps(caplog):
+    cast_datetime = Stream._compile_datetime_caster("hs_recurring_billing_end_date", declared_format="date")
+
+    assert [cast_datetime(value) for value in ["1653696000000", "1645608465000", "2022-05-28"]] == ["2022-05-28", "2022-02-23", "2022-05-28"]
+    assert len([record for record in caplog.records if "trying to parse timestamp" in record.message]) == 1
+
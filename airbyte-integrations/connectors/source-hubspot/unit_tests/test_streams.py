@@ -450,3 +450,15 @@ def test_get_custom_objects_metadata_success(requests_mock, custom_object_schema
         assert entity == "animals"
         assert fully_qualified_name == "p19936848_Animal"
         assert schema == expected_custom_object_json_schema
+
+
+def test_discarded_properties_are_logged_once(common_params, caplog):
+    stream = Deals(**common_params)
+    properties = {"amount": {"type": ["null", "number"]}}
+    records = [{"id": record_id, "properties": {"amount": "1,000.5", "unknown": "value"}} for record_id in range(3)]
+
+    records = [stream._cast_record_fields_if_needed(record, properties=properties) for record in records]
+    stream.log_discarded_properties()
+
+    assert [record["properties"] for record in records] == [{"amount": 1000.5, "unknown": "value"}] * 3
+    assert len([record for record in caplog.records if "Properties discarded" in record.message]) == 1
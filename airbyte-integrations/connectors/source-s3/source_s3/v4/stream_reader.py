@@ -3,9 +3,13 @@
 #
 
 import logging
+import re
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from contextlib import contextmanager
+from functools import lru_cache
 from io import IOBase
-from typing import Iterable, List, Optional, Set
+from typing import Any, Deque, Dict, Iterable, List, Mapping, Optional, Set, Tuple
 
 import boto3.session
 import pytz
@@ -16,9 +20,16 @@ from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from botocore.client import BaseClient
 from botocore.client import Config as ClientConfig
 from source_s3.v4.config import Config
+from wcmatch.fnmatch import DOTMATCH, fnmatch
+
+# Characters from which a glob is no longer a literal path
+_GLOB_SPECIAL_CHARACTERS = re.compile(r"[*?[\\]")
 
 
 class SourceS3StreamReader(AbstractFileBasedStreamReader):
+    # boto3 clients keep a pool of 10 connections by default
+    MAX_CONCURRENT_LIST_REQUESTS = 10
+
     def __init__(self):
         super().__init__()
         self._s3_client = None
@@ -62,21 +73,23 @@ class SourceS3StreamReader(AbstractFileBasedStreamReader):
     def get_matching_files(self, globs: List[str], prefix: Optional[str], logger: logging.Logger) -> Iterable[RemoteFile]:
         """
         Get all files matching the specified glob patterns.
+
+        The bucket is listed folder by folder, starting from the literal prefixes of the globs, so that folders which cannot contain
+        matching files are never listed and so that folders are listed concurrently. Files are returned as soon as they are listed.
         """
         s3 = self.s3_client
-        prefixes = [prefix] if prefix else self.get_prefixes_from_globs(globs)
+        prefixes = [prefix] if prefix else self._get_listing_prefixes(globs)
         seen = set()
         total_n_keys = 0
 
         try:
-            if prefixes:
-                for prefix in prefixes:
-                    for remote_file in self._page(s3, globs, self.config.bucket, prefix, seen, logger):
-                        total_n_keys += 1
-                        yield remote_file
-            else:
-                for remote_file in self._page(s3, globs, self.config.bucket, None, seen, logger):
-                    total_n_keys += 1
+            for file in self._list_objects(s3, globs, self.config.bucket, prefixes, logger):
+                total_n_keys += 1
+                if self._is_folder(file):
+                    continue
+                remote_file = RemoteFile(uri=file["Key"], last_modified=file["LastModified"].astimezone(pytz.utc).replace(tzinfo=None))
+                if self.file_matches_globs(remote_file, globs) and remote_file.uri not in seen:
+                    seen.add(remote_file.uri)
                     yield remote_file
 
             logger.info(f"Finished listing objects from S3. Found {total_n_keys} objects total ({len(seen)} unique objects).")
@@ -114,36 +127,74 @@ class SourceS3StreamReader(AbstractFileBasedStreamReader):
     def _is_folder(file) -> bool:
         return file["Key"].endswith("/")
 
-    def _page(
-        self, s3: BaseClient, globs: List[str], bucket: str, prefix: Optional[str], seen: Set[str], logger: logging.Logger
-    ) -> Iterable[RemoteFile]:
+    def _list_objects(
+        self, s3: BaseClient, globs: List[str], bucket: str, prefixes: Iterable[str], logger: logging.Logger
+    ) -> Iterable[Mapping[str, Any]]:
         """
-        Page through lists of S3 objects.
+        List the objects under the prefixes, folder by folder. The pages of up to MAX_CONCURRENT_LIST_REQUESTS folders are requested at
+        once and subfolders are only listed if files within them could match the globs.
         """
-        total_n_keys_for_prefix = 0
-        kwargs = {"Bucket": bucket}
-        while True:
-            response = s3.list_objects_v2(Prefix=prefix, **kwargs) if prefix else s3.list_objects_v2(**kwargs)
-            key_count = response.get("KeyCount")
-            total_n_keys_for_prefix += key_count
-            logger.info(f"Received {key_count} objects from S3 for prefix '{prefix}'.")
-
-            if "Contents" in response:
-                for file in response["Contents"]:
-                    if self._is_folder(file):
-                        continue
-                    remote_file = RemoteFile(uri=file["Key"], last_modified=file["LastModified"].astimezone(pytz.utc).replace(tzinfo=None))
-                    if self.file_matches_globs(remote_file, globs) and remote_file.uri not in seen:
-                        seen.add(remote_file.uri)
-                        yield remote_file
-            else:
-                logger.warning(f"Invalid response from S3; missing 'Contents' key. kwargs={kwargs}.")
+        glob_segments = [tuple(glob.split("/")) for glob in globs]
+        pending: Deque[Tuple[str, Optional[str]]] = deque((prefix, None) for prefix in prefixes)
+        in_progress: Set["Future[Tuple[str, Dict[str, Any]]]"] = set()
+        with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_LIST_REQUESTS, thread_name_prefix="s3_listing") as executor:
+            try:
+                while pending or in_progress:
+                    while pending and len(in_progress) < self.MAX_CONCURRENT_LIST_REQUESTS:
+                        prefix, continuation_token = pending.popleft()
+                        in_progress.add(executor.submit(self._list_page, s3, bucket, prefix, continuation_token))
+                    done, in_progress = wait(in_progress, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        prefix, response = future.result()
+                        logger.debug(f"Received {response.get('KeyCount')} objects and folders from S3 for prefix '{prefix}'.")
+                        if next_token := response.get("NextContinuationToken"):
+                            # Finish listing a folder before moving on to the next ones
+                            pending.appendleft((prefix, next_token))
+                        for common_prefix in response.get("CommonPrefixes", []):
+                            folder = common_prefix["Prefix"]
+                            # globmatch collapses consecutive slashes, hence the empty folder names are dropped
+                            folder_names = tuple(name for name in folder.split("/") if name)
+                            if any(_folder_may_contain_matches(folder_names, segments) for segments in glob_segments):
+                                pending.append((folder, None))
+                        yield from response.get("Contents", [])
+            finally:
+                for future in in_progress:
+                    future.cancel()
 
-            if next_token := response.get("NextContinuationToken"):
-                kwargs["ContinuationToken"] = next_token
-            else:
-                logger.info(f"Finished listing objects from S3 for prefix={prefix}. Found {total_n_keys_for_prefix} objects.")
-                break
+    @staticmethod
+    def _list_page(s3: BaseClient, bucket: str, prefix: str, continuation_token: Optional[str]) -> Tuple[str, Dict[str, Any]]:
+        kwargs = {"Bucket": bucket, "Prefix": prefix, "Delimiter": "/"}
+        if continuation_token:
+            kwargs["ContinuationToken"] = continuation_token
+        return prefix, s3.list_objects_v2(**kwargs)
+
+    @staticmethod
+    def _get_listing_prefixes(globs: List[str]) -> List[str]:
+        """
+        :return: the literal prefixes of the globs, without the prefixes which are covered by a shorter one
+        """
+        prefixes: List[str] = []
+        for prefix in sorted({_GLOB_SPECIAL_CHARACTERS.split(glob, maxsplit=1)[0] for glob in globs}):
+            # Sorted prefixes starting with a given prefix directly follow it
+            if not prefixes or not prefix.startswith(prefixes[-1]):
+                prefixes.append(prefix)
+        return prefixes
+
+
+@lru_cache(maxsize=4096)
+def _folder_may_contain_matches(folder: Tuple[str, ...], glob: Tuple[str, ...]) -> bool:
+    """
+    Whether files within the folder can match the glob, i.e. whether the folders of the path match the first segments of the glob. This
+    errs on the side of listing: hidden folders are matched by wildcards, which `globmatch` does not do.
+    """
+    if not folder:
+        # The file name still has to match a segment of the glob
+        return bool(glob)
+    if not glob:
+        return False
+    if glob[0] == "**":
+        return _folder_may_contain_matches(folder, glob[1:]) or _folder_may_contain_matches(folder[1:], glob)
+    return fnmatch(folder[0], glob[0], flags=DOTMATCH) and _folder_may_contain_matches(folder[1:], glob[1:])
 
 
 def _get_s3_compatible_client_args(config: Config) -> dict:
@@ -5,6 +5,7 @@
 
 import io
 import logging
+import threading
 from datetime import datetime
 from itertools import product
 from typing import Any, Dict, List, Optional, Set
@@ -149,6 +150,135 @@ def test_given_multiple_pages_when_get_matching_files_then_pass_continuation_tok
     assert "ContinuationToken" in boto3_client_mock.return_value.list_objects_v2.call_args_list[1].kwargs
 
 
+class FakeS3Listing:
+    """
+    Lists keys like S3 does when a delimiter is given: objects directly under the prefix are contents, deeper ones are grouped into common
+    prefixes.
+    """
+
+    def __init__(self, keys: List[str], page_size: int = 2, barrier: Optional[threading.Barrier] = None):
+        self._keys = sorted(keys)
+        self._page_size = page_size
+        self._barrier = barrier
+        self.listed_prefixes: List[str] = []
+
+    def list_objects_v2(self, Bucket: str, Prefix: str = "", Delimiter: str = "/", ContinuationToken: Optional[str] = None) -> Dict[str, Any]:
+        self.listed_prefixes.append(Prefix)
+        if self._barrier and Prefix:
+            self._barrier.wait()
+        entries = []
+        for key in self._keys:
+            if not key.startswith(Prefix):
+                continue
+            rest = key[len(Prefix):]
+            entry = {"Prefix": Prefix + rest[: rest.index(Delimiter) + 1]} if Delimiter in rest else {"Key": key, "LastModified": datetime.now()}
+            if entry not in entries:
+                entries.append(entry)
+        start = int(ContinuationToken or 0)
+        page = entries[start:start + self._page_size]
+        response = {
+            "KeyCount": len(page),
+            "Contents": [entry for entry in page if "Key" in entry],
+            "CommonPrefixes": [entry for entry in page if "Prefix" in entry],
+        }
+        if start + self._page_size < len(entries):
+            response["NextContinuationToken"] = str(start + self._page_size)
+        return response
+
+
+PARTITIONED_KEYS = [
+    "data/year=2022/month=01/file1.csv",
+    "data/year=2022/month=02/file2.csv",
+    "data/year=2023/month=01/file3.csv",
+    "data/year=2023/month=01/file4.jsonl",
+    "data/year=2023/month=02/file5.csv",
+    "data/year=2023/month=02/nested/file6.csv",
+    "data/year=2023/readme.md",
+    "logs/file7.csv",
+    "file8.csv",
+]
+
+
+@pytest.mark.parametrize(
+    "globs,expected_uris,expected_listed_prefixes",
+    [
+        pytest.param(
+            ["data/year=2023/*/*.csv"],
+            {"data/year=2023/month=01/file3.csv", "data/year=2023/month=02/file5.csv"},
+            {"data/year=2023/", "data/year=2023/month=01/", "data/year=2023/month=02/"},
+            id="folders-which-cannot-contain-matches-are-not-listed",
+        ),
+        pytest.param(
+            ["data/year=202?/month=01/*"],
+            {"data/year=2022/month=01/file1.csv", "data/year=2023/month=01/file3.csv", "data/year=2023/month=01/file4.jsonl"},
+            {"data/year=202", "data/year=2022/", "data/year=2023/", "data/year=2022/month=01/", "data/year=2023/month=01/"},
+            id="prefix-stops-at-any-wildcard",
+        ),
+        pytest.param(
+            ["*.csv"],
+            {"file8.csv"},
+            {""},
+            id="glob-without-folders-only-lists-the-root",
+        ),
+        pytest.param(
+            ["**/file[67].csv", "data/**/file6.csv"],
+            {"data/year=2023/month=02/nested/file6.csv", "logs/file7.csv"},
+            {
+                "",
+                "data/",
+                "logs/",
+                "data/year=2022/",
+                "data/year=2023/",
+                "data/year=2022/month=01/",
+                "data/year=2022/month=02/",
+                "data/year=2023/month=01/",
+                "data/year=2023/month=02/",
+                "data/year=2023/month=02/nested/",
+            },
+            id="globstar-lists-every-folder-once",
+        ),
+    ],
+)
+@patch("boto3.client")
+def test_get_matching_files_lists_folders_from_the_glob_prefixes(boto3_client_mock, globs, expected_uris, expected_listed_prefixes):
+    listing = FakeS3Listing(PARTITIONED_KEYS)
+    boto3_client_mock.return_value.list_objects_v2.side_effect = listing.list_objects_v2
+    reader = SourceS3StreamReader()
+    reader.config = Config(bucket="test", aws_access_key_id="test", aws_secret_access_key="test", streams=[])
+
+    files = list(reader.get_matching_files(globs, None, logger))
+
+    assert sorted(f.uri for f in files) == sorted(expected_uris)
+    assert set(listing.listed_prefixes) == expected_listed_prefixes
+
+
+@patch("boto3.client")
+def test_get_matching_files_lists_folders_concurrently(boto3_client_mock):
+    # Each of the three folders waits for the two others to be listed at the same time
+    listing = FakeS3Listing(["a/1.csv", "b/2.csv", "c/3.csv"], page_size=10, barrier=threading.Barrier(3, timeout=5))
+    boto3_client_mock.return_value.list_objects_v2.side_effect = listing.list_objects_v2
+    reader = SourceS3StreamReader()
+    reader.config = Config(bucket="test", aws_access_key_id="test", aws_secret_access_key="test", streams=[])
+
+    files = list(reader.get_matching_files(["**"], None, logger))
+
+    assert sorted(f.uri for f in files) == ["a/1.csv", "b/2.csv", "c/3.csv"]
+
+
+@pytest.mark.parametrize(
+    "globs,expected_prefixes",
+    [
+        pytest.param(["a/b/*.csv"], ["a/b/"], id="literal-folders"),
+        pytest.param(["a/b*/c/*.csv", "a/?/*.csv", "a/[bc]/*.csv"], ["a/"], id="shortest-prefix-covers-the-others"),
+        pytest.param(["*.csv", "a/*.csv"], [""], id="glob-starting-with-wildcard-lists-the-whole-bucket"),
+        pytest.param(["a/*.csv", "ab/*.csv", "b/c.csv"], ["a/", "ab/", "b/c.csv"], id="disjoint-prefixes"),
+        pytest.param([], [], id="no-globs"),
+    ],
+)
+def test_get_listing_prefixes(globs, expected_prefixes):
+    assert SourceS3StreamReader._get_listing_prefixes(globs) == expected_prefixes
+
+
 def test_get_matching_files_exception():
     reader = SourceS3StreamReader()
     reader.config = Config(bucket="test", aws_access_key_id="test", aws_secret_access_key="test", streams=[])
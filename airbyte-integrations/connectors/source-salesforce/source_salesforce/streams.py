@@ -2,33 +2,35 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import codecs
 import csv
 import ctypes
 import math
-import os
 import time
 import urllib.parse
 from abc import ABC
 from contextlib import closing
-from typing import Any, Callable, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Type, Union
+from itertools import zip_longest
+from queue import Full, Queue
+from threading import Event, Thread
+from typing import Any, Callable, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Type, Union
 
-import pandas as pd
 import pendulum
 import requests  # type: ignore[import]
 from airbyte_cdk.models import ConfiguredAirbyteCatalog, FailureType, SyncMode
 from airbyte_cdk.sources.streams.availability_strategy import AvailabilityStrategy
 from airbyte_cdk.sources.streams.core import Stream, StreamData
 from airbyte_cdk.sources.streams.http import HttpStream
+from airbyte_cdk.sources.utils.property_chunks import PropertyChunkMerger, fetch_property_chunks
 from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
 from airbyte_cdk.utils import AirbyteTracedException
-from numpy import nan
 from pendulum import DateTime  # type: ignore[attr-defined]
 from requests import codes, exceptions
 from requests.models import PreparedRequest
 
 from .api import UNSUPPORTED_FILTERING_STREAMS, Salesforce
 from .availability_strategy import SalesforceAvailabilityStrategy
-from .exceptions import SalesforceException, TmpFileIOError
+from .exceptions import SalesforceException
 from .rate_limiting import default_backoff_handler
 
 # https://stackoverflow.com/a/54517228
@@ -110,7 +112,23 @@ class PropertyChunk:
         self.next_page = None
 
 
+class SubmittedJob:
+    """
+    Bulk job created ahead of the reading of its stream slice, so that Salesforce processes it while the previous slices are read.
+    """
+
+    url: str
+    submitted_at: float
+
+    def __init__(self, url: str):
+        self.url = url
+        self.submitted_at = time.monotonic()
+
+
 class RestSalesforceStream(SalesforceStream):
+    # number of chunks of properties fetched at once for the objects with too many properties for a single query
+    property_chunk_concurrency_limit = 4
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         assert self.primary_key or not self.too_many_properties
@@ -175,10 +193,11 @@ class RestSalesforceStream(SalesforceStream):
             yield local_properties
 
     @staticmethod
-    def _next_chunk_id(property_chunks: Mapping[int, PropertyChunk]) -> Optional[int]:
+    def _next_chunk_ids(property_chunks: Mapping[int, PropertyChunk]) -> List[int]:
         """
-        Figure out which chunk is going to be read next.
-        It should be the one with the least number of records read by the moment.
+        Figure out which chunks are going to be read next.
+        These are the chunks with fewer records read by the moment than the others, or all of them when they read as many records,
+        so that the pages of the chunks stay aligned.
         """
         non_exhausted_chunks = {
             # We skip chunks that have already attempted a sync before and do not have a next page
@@ -187,62 +206,50 @@ class RestSalesforceStream(SalesforceStream):
             if property_chunk.first_time or property_chunk.next_page
         }
         if not non_exhausted_chunks:
-            return None
-        return min(non_exhausted_chunks, key=non_exhausted_chunks.get)
+            return []
+        max_record_counter = max(non_exhausted_chunks.values())
+        lagging_chunks = [chunk_id for chunk_id, record_counter in non_exhausted_chunks.items() if record_counter < max_record_counter]
+        return lagging_chunks or list(non_exhausted_chunks)
 
     def _read_pages(
         self,
         records_generator_fn: Callable[
-            [requests.PreparedRequest, requests.Response, Mapping[str, Any], Mapping[str, Any]], Iterable[StreamData]
+            [requests.PreparedRequest, requests.Response, Mapping[str, Any], Mapping[str, Any]],
+            Iterable[StreamData],
         ],
         stream_slice: Mapping[str, Any] = None,
         stream_state: Mapping[str, Any] = None,
     ) -> Iterable[StreamData]:
         stream_state = stream_state or {}
-        records_by_primary_key = {}
         property_chunks: Mapping[int, PropertyChunk] = {
             index: PropertyChunk(properties=properties) for index, properties in enumerate(self.chunk_properties())
         }
+        # stick together different parts of records by their primary key and emit a record as soon as it is complete
+        # when a stream has no primary key (it is allowed when properties length does not exceed the maximum value)
+        # there is a single chunk, therefore the records are emitted immediately
+        merger = PropertyChunkMerger(chunk_count=len(property_chunks), primary_key=lambda record: record[self.primary_key])
+
+        def fetch_chunk(chunk_id: int) -> Tuple[requests.PreparedRequest, requests.Response]:
+            property_chunk = property_chunks[chunk_id]
+            return self._fetch_next_page_for_chunk(stream_slice, stream_state, property_chunk.next_page, property_chunk.properties)
+
         while True:
-            chunk_id = self._next_chunk_id(property_chunks)
-            if chunk_id is None:
+            chunk_ids = self._next_chunk_ids(property_chunks)
+            if not chunk_ids:
                 # pagination complete
                 break
 
-            property_chunk = property_chunks[chunk_id]
-            request, response = self._fetch_next_page_for_chunk(
-                stream_slice, stream_state, property_chunk.next_page, property_chunk.properties
-            )
-
-            # When this is the first time we're getting a chunk's records, we set this to False to be used when deciding the next chunk
-            if property_chunk.first_time:
+            # the next pages of the chunks are fetched concurrently
+            for chunk_id, (request, response) in fetch_property_chunks(chunk_ids, fetch_chunk, self.property_chunk_concurrency_limit):
+                property_chunk = property_chunks[chunk_id]
+                # When this is the first time we're getting a chunk's records, we set this to False to be used when deciding the next chunks
                 property_chunk.first_time = False
-            property_chunk.next_page = self.next_page_token(response)
-            chunk_page_records = records_generator_fn(request, response, stream_state, stream_slice)
-            if not self.too_many_properties:
-                # this is the case when a stream has no primary key
-                # (it is allowed when properties length does not exceed the maximum value)
-                # so there would be a single chunk, therefore we may and should yield records immediately
-                for record in chunk_page_records:
+                property_chunk.next_page = self.next_page_token(response)
+                for record in records_generator_fn(request, response, stream_state, stream_slice):
                     property_chunk.record_counter += 1
-                    yield record
-                continue
-
-            # stick together different parts of records by their primary key and emit if a record is complete
-            for record in chunk_page_records:
-                property_chunk.record_counter += 1
-                record_id = record[self.primary_key]
-                if record_id not in records_by_primary_key:
-                    records_by_primary_key[record_id] = (record, 1)
-                    continue
-                partial_record, counter = records_by_primary_key[record_id]
-                partial_record.update(record)
-                counter += 1
-                if counter == len(property_chunks):
-                    yield partial_record  # now it's complete
-                    records_by_primary_key.pop(record_id)
-                else:
-                    records_by_primary_key[record_id] = (partial_record, counter)
+                    complete_record = merger.add(record)
+                    if complete_record is not None:
+                        yield complete_record
 
         # Process what's left.
         # Because we make multiple calls to query N records (each call to fetch X properties of all the N records),
@@ -252,7 +259,7 @@ class RestSalesforceStream(SalesforceStream):
         # Select 'c', 'd' from table order by pk -> returns records with ids `1`, `3`
         # Then records `2` and `3` would be incomplete.
         # This may result in data inconsistency. We skip such records for now and log a warning message.
-        incomplete_record_ids = ",".join([str(key) for key in records_by_primary_key])
+        incomplete_record_ids = ",".join([str(key) for key in merger.incomplete_keys])
         if incomplete_record_ids:
             self.logger.warning(f"Inconsistent record(s) with primary keys {incomplete_record_ids} found. Skipping them.")
 
@@ -285,6 +292,16 @@ class BulkSalesforceStream(SalesforceStream):
     DEFAULT_WAIT_TIMEOUT_SECONDS = 86400  # 24-hour bulk job running time
     MAX_CHECK_INTERVAL_SECONDS = 2.0
     MAX_RETRY_NUMBER = 3
+    RESULTS_CHUNK_SIZE = 1024 * 1024
+    RESULTS_BUFFERED_CHUNKS = 8
+    # number of the next slices for which jobs are created while a slice is read
+    MAX_JOBS_AHEAD = 3
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._upcoming_slices: List[Mapping[str, Any]] = []
+        # the jobs created ahead by query
+        self._submitted_jobs: MutableMapping[str, SubmittedJob] = {}
 
     def path(self, next_page_token: Mapping[str, Any] = None, **kwargs: Any) -> str:
         return f"/services/data/{self.sf_api.version}/jobs/query"
@@ -372,7 +389,8 @@ class BulkSalesforceStream(SalesforceStream):
         job_info = None
         # minimal starting delay is 0.5 seconds.
         # this value was received empirically
-        time.sleep(0.5)
+        submitted_at = next((job.submitted_at for job in self._submitted_jobs.values() if job.url == url), time.monotonic())
+        time.sleep(max(0.0, 0.5 - (time.monotonic() - submitted_at)))
         while pendulum.now() < expiration_time:
             try:
                 job_info = self._send_http_request("GET", url=url).json()
@@ -413,14 +431,24 @@ class BulkSalesforceStream(SalesforceStream):
         self.logger.warning(f"Not wait the {self.name} data for {self.DEFAULT_WAIT_TIMEOUT_SECONDS} seconds, data: {job_info}!!")
         return job_status
 
-    def execute_job(self, query: str, url: str) -> Tuple[Optional[str], Optional[str]]:
+    def execute_job(self, query: str, url: str, queries_ahead: List[str] = None) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Runs the job of the query, or waits for the job created ahead for it, and creates the jobs of `queries_ahead` meanwhile
+        """
         job_status = "Failed"
         for i in range(0, self.MAX_RETRY_NUMBER):
-            job_id = self.create_stream_job(query=query, url=url)
-            if not job_id:
-                return None, job_status
-            job_full_url = f"{url}/{job_id}"
+            submitted_job = self._submitted_jobs.get(query) if i == 0 else None
+            if submitted_job:
+                job_full_url = submitted_job.url
+            else:
+                job_id = self.create_stream_job(query=query, url=url)
+                if not job_id:
+                    return None, job_status
+                job_full_url = f"{url}/{job_id}"
+            if i == 0:
+                self.submit_jobs_ahead(queries_ahead or [], url=url)
             job_status = self.wait_for_job(url=job_full_url)
+            self._submitted_jobs.pop(query, None)
             if job_status not in ["UploadComplete", "InProgress"]:
                 break
             self.logger.error(f"Waiting error. Try to run this job again {i + 1}/{self.MAX_RETRY_NUMBER}...")
@@ -432,6 +460,37 @@ class BulkSalesforceStream(SalesforceStream):
             return None, job_status
         return job_full_url, job_status
 
+    def submit_jobs_ahead(self, queries: List[str], url: str) -> None:
+        """
+        Creates the jobs of the next slices, which Salesforce runs in parallel, so that their results are ready when the slices are read.
+        The slices are still read in order. A job which can't be created is created again, with the usual error handling,
+        when its slice is read.
+        """
+        for query in queries[: self.MAX_JOBS_AHEAD]:
+            if query in self._submitted_jobs:
+                continue
+            try:
+                job_id = self.create_stream_job(query=query, url=url)
+            except Exception as error:
+                self.logger.info(f"The job of the next slice of stream '{self.name}' could not be created ahead: {error}")
+                job_id = None
+            if not job_id:
+                return
+            self._submitted_jobs[query] = SubmittedJob(f"{url}/{job_id}")
+
+    def delete_submitted_jobs(self) -> None:
+        """
+        Aborts and deletes the jobs created ahead for slices which were not read
+        """
+        for job in self._submitted_jobs.values():
+            # The cleanup is best effort: a job which could not be aborted, e.g. because it completed, is still deleted
+            for method, json in (("PATCH", {"state": "Aborted"}), ("DELETE", None)):
+                try:
+                    self._send_http_request(method, job.url, json=json)
+                except Exception as error:
+                    self.logger.warning(f"The job {job.url} created ahead could not be deleted, {method} failed: {error}")
+        self._submitted_jobs.clear()
+
     def filter_null_bytes(self, b: bytes):
         """
         https://github.com/airbytehq/airbyte/issues/8300
@@ -460,50 +519,112 @@ class BulkSalesforceStream(SalesforceStream):
 
         return self.encoding
 
-    def download_data(self, url: str, chunk_size: int = 1024) -> tuple[str, str, dict]:
+    def download_results(self, job_full_url: str, chunks: "Queue[Any]", stopped: Event) -> None:
         """
-        Retrieves binary data result from successfully `executed_job`, using chunks, to avoid local memory limitations.
-        @ url: string - the url of the `executed_job`
-        @ chunk_size: int - the buffer size for each chunk to fetch from stream, in bytes, default: 1024 bytes
-        Return the tuple containing string with file path of downloaded binary data (Saved temporarily) and file encoding.
+        Downloads the result pages of the `executed_job`, following the `Sforce-Locator` header, and puts them in `chunks` for `read_results`:
+        the encoding of each page, the chunks of binary data of the page, `b""` at the end of each page and `None` after the last page.
+        Runs in a background thread: an exception is put in `chunks` instead and the download stops when `stopped` is set.
         """
-        # set filepath for binary data from response
-        tmp_file = os.path.realpath(os.path.basename(url))
-        with closing(self._send_http_request("GET", url, headers={"Accept-Encoding": "gzip"}, stream=True)) as response, open(
-            tmp_file, "wb"
-        ) as data_file:
-            response_headers = response.headers
-            response_encoding = self.get_response_encoding(response_headers)
-            for chunk in response.iter_content(chunk_size=chunk_size):
-                data_file.write(self.filter_null_bytes(chunk))
-        # check the file exists
-        if os.path.isfile(tmp_file):
-            return tmp_file, response_encoding, response_headers
-        else:
-            raise TmpFileIOError(f"The IO/Error occured while verifying binary data. Stream: {self.name}, file {tmp_file} doesn't exist.")
-
-    def read_with_chunks(self, path: str, file_encoding: str, chunk_size: int = 100) -> Iterable[Tuple[int, Mapping[str, Any]]]:
+
+        def put(item: Any) -> bool:
+            while not stopped.is_set():
+                try:
+                    chunks.put(item, timeout=0.1)
+                    return True
+                except Full:
+                    continue
+            return False
+
+        try:
+            salesforce_bulk_api_locator = None
+            while True:
+                req = PreparedRequest()
+                req.prepare_url(f"{job_full_url}/results", {"locator": salesforce_bulk_api_locator})
+                with closing(self._send_http_request("GET", req.url, headers={"Accept-Encoding": "gzip"}, stream=True)) as response:
+                    if not put(self.get_response_encoding(response.headers)):
+                        return
+                    for chunk in response.iter_content(chunk_size=self.RESULTS_CHUNK_SIZE):
+                        chunk = self.filter_null_bytes(chunk)
+                        if chunk and not put(chunk):
+                            return
+                    salesforce_bulk_api_locator = response.headers.get("Sforce-Locator", "null")
+                if not put(b""):
+                    return
+                if salesforce_bulk_api_locator == "null":
+                    break
+            put(None)
+        except Exception as error:
+            put(error)
+
+    def read_results(self, job_full_url: str) -> Iterable[Mapping[str, Any]]:
         """
-        Reads the downloaded binary data, using lines chunks, set by `chunk_size`.
-        @ path: string - the path to the downloaded temporarily binary data.
-        @ file_encoding: string - encoding for binary data file according to Standard Encodings from codecs module
-        @ chunk_size: int - the number of lines to read at a time, default: 100 lines / time.
+        Reads the records of the `executed_job` while its result pages are downloaded in a background thread,
+        so that the data is parsed as it arrives, without saving it to a temporary file.
+        At most `RESULTS_BUFFERED_CHUNKS` chunks of `RESULTS_CHUNK_SIZE` bytes are downloaded ahead of the parsing.
         """
+        chunks: "Queue[Any]" = Queue(maxsize=self.RESULTS_BUFFERED_CHUNKS)
+        stopped = Event()
+        Thread(target=self.download_results, args=(job_full_url, chunks, stopped), name=f"{self.name}-results", daemon=True).start()
+
+        def next_item() -> Any:
+            item = chunks.get()
+            if isinstance(item, Exception):
+                raise item
+            return item
+
+        def page_chunks() -> Iterator[bytes]:
+            chunk = next_item()
+            while chunk:
+                yield chunk
+                chunk = next_item()
+
         try:
-            with open(path, "r", encoding=file_encoding) as data:
-                chunks = pd.read_csv(data, chunksize=chunk_size, iterator=True, dialect="unix", dtype=object)
-                for chunk in chunks:
-                    chunk = chunk.replace({nan: None}).to_dict(orient="records")
-                    for row in chunk:
-                        yield row
-        except pd.errors.EmptyDataError as e:
-            self.logger.info(f"Empty data received. {e}")
-            yield from []
-        except IOError as ioe:
-            raise TmpFileIOError(f"The IO/Error occured while reading tmp data. Called: {path}. Stream: {self.name}", ioe)
+            page_encoding = next_item()
+            while page_encoding is not None:
+                yield from self.read_csv_records(page_chunks(), page_encoding)
+                page_encoding = next_item()
         finally:
-            # remove binary tmp file, after data is read
-            os.remove(path)
+            stopped.set()
+
+    def read_csv_records(self, chunks: Iterable[bytes], encoding: str) -> Iterable[Mapping[str, Any]]:
+        """
+        Decodes and parses the CSV data of a result page incrementally, as the chunks of binary data are received.
+        @ chunks: the chunks of binary data of the page
+        @ encoding: encoding of the binary data according to Standard Encodings from codecs module
+        """
+        reader = csv.reader(self._decode_lines(chunks, encoding), dialect="unix")
+        header = next(reader, None)
+        if header is None:
+            self.logger.info("Empty data received.")
+            return
+        for row in reader:
+            if not row:
+                continue
+            # the leading values of the rows with more values than the header are an index, as with `pandas.read_csv`
+            values = row[-len(header) :] if len(row) > len(header) else row
+            # empty values and missing values are nulls, other values such as `NA` or `null` are kept as strings unlike with pandas
+            yield {name: value or None for name, value in zip_longest(header, values)}
+
+    @staticmethod
+    def _decode_lines(chunks: Iterable[bytes], encoding: str) -> Iterator[str]:
+        """
+        Decodes the chunks of binary data and splits them into lines, with the `\n` line endings of the `unix` CSV dialect
+        """
+        decoder = codecs.getincrementaldecoder(encoding)()
+        pending = ""
+        for chunk in chunks:
+            text = pending + decoder.decode(chunk)
+            # the lines are sliced one by one so that only the text of the chunk is held in memory
+            start = 0
+            end = text.find("\n") + 1
+            while end:
+                yield text[start:end]
+                start = end
+                end = text.find("\n", start) + 1
+            pending = text[start:]
+        pending += decoder.decode(b"", final=True)
+        if pending:
+            yield pending
 
     def abort_job(self, url: str):
         data = {"state": "Aborted"}
@@ -555,7 +676,11 @@ class BulkSalesforceStream(SalesforceStream):
 
         params = self.request_params(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
         path = self.path(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
-        job_full_url, job_status = self.execute_job(query=params["q"], url=f"{self.url_base}{path}")
+        queries_ahead = [
+            self.request_params(stream_state=stream_state, stream_slice=upcoming_slice)["q"]
+            for upcoming_slice in self._upcoming_slices[: self.MAX_JOBS_AHEAD]
+        ]
+        job_full_url, job_status = self.execute_job(query=params["q"], url=f"{self.url_base}{path}", queries_ahead=queries_ahead)
         if not job_full_url:
             if job_status == "Failed":
                 # As rule as BULK logic returns unhandled error. For instance:
@@ -573,17 +698,7 @@ class BulkSalesforceStream(SalesforceStream):
                 )
                 return
             raise SalesforceException(f"Job for {self.name} stream using BULK API was failed.")
-        salesforce_bulk_api_locator = None
-        while True:
-            req = PreparedRequest()
-            req.prepare_url(f"{job_full_url}/results", {"locator": salesforce_bulk_api_locator})
-            tmp_file, response_encoding, response_headers = self.download_data(url=req.url)
-            for record in self.read_with_chunks(tmp_file, response_encoding):
-                yield record
-
-            if response_headers.get("Sforce-Locator", "null") == "null":
-                break
-            salesforce_bulk_api_locator = response_headers.get("Sforce-Locator")
+        yield from self.read_results(job_full_url)
         self.delete_job(url=job_full_url)
 
     def get_standard_instance(self) -> SalesforceStream:
@@ -706,6 +821,22 @@ class IncrementalRestSalesforceStream(RestSalesforceStream, ABC):
 class BulkIncrementalSalesforceStream(BulkSalesforceStream, IncrementalRestSalesforceStream):
     state_checkpoint_interval = None
 
+    def stream_slices(
+        self, *, sync_mode: SyncMode, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None
+    ) -> Iterable[Optional[Mapping[str, Any]]]:
+        """
+        The next slices are known while a slice is read, so that their jobs are created ahead, see `BulkSalesforceStream.submit_jobs_ahead`
+        """
+        stream_slices = list(super().stream_slices(sync_mode=sync_mode, cursor_field=cursor_field, stream_state=stream_state))
+        try:
+            for index, stream_slice in enumerate(stream_slices):
+                self._slice = stream_slice
+                self._upcoming_slices = stream_slices[index + 1 :]
+                yield stream_slice
+        finally:
+            self._upcoming_slices = []
+            self.delete_submitted_jobs()
+
     def request_params(
         self, stream_state: Mapping[str, Any], stream_slice: Mapping[str, Any] = None, next_page_token: Mapping[str, Any] = None
     ) -> MutableMapping[str, Any]:
@@ -7,6 +7,8 @@ import csv
 import io
 import logging
 import re
+import threading
+import urllib.parse
 from datetime import datetime
 from unittest.mock import Mock
 
@@ -232,68 +234,93 @@ def test_stream_start_datetime_format_should_not_changed(stream_config, stream_a
     assert stream.start_date == "2010-01-18T21:18:20Z"
 
 
-def test_download_data_filter_null_bytes(stream_config, stream_api):
-    job_full_url_results: str = "https://fase-account.salesforce.com/services/data/v57.0/jobs/query/7504W00000bkgnpQAA/results"
+def test_read_results_filter_null_bytes(stream_config, stream_api):
+    job_full_url: str = "https://fase-account.salesforce.com/services/data/v57.0/jobs/query/7504W00000bkgnpQAA"
     stream: BulkIncrementalSalesforceStream = generate_stream("Account", stream_config, stream_api)
 
     with requests_mock.Mocker() as m:
-        m.register_uri("GET", job_full_url_results, content=b"\x00")
-        tmp_file, response_encoding, _ = stream.download_data(url=job_full_url_results)
-        res = list(stream.read_with_chunks(tmp_file, response_encoding))
+        m.register_uri("GET", f"{job_full_url}/results", content=b"\x00")
+        res = list(stream.read_results(job_full_url))
         assert res == []
 
-        m.register_uri("GET", job_full_url_results, content=b'"Id","IsDeleted"\n\x00"0014W000027f6UwQAI","false"\n\x00\x00')
-        tmp_file, response_encoding, _ = stream.download_data(url=job_full_url_results)
-        res = list(stream.read_with_chunks(tmp_file, response_encoding))
+        m.register_uri("GET", f"{job_full_url}/results", content=b'"Id","IsDeleted"\n\x00"0014W000027f6UwQAI","false"\n\x00\x00')
+        res = list(stream.read_results(job_full_url))
         assert res == [{"Id": "0014W000027f6UwQAI", "IsDeleted": "false"}]
 
 
-def test_read_with_chunks_should_return_only_object_data_type(stream_config, stream_api):
-    job_full_url_results: str = "https://fase-account.salesforce.com/services/data/v57.0/jobs/query/7504W00000bkgnpQAA/results"
+def test_read_results_should_return_only_object_data_type(stream_config, stream_api):
+    job_full_url: str = "https://fase-account.salesforce.com/services/data/v57.0/jobs/query/7504W00000bkgnpQAA"
     stream: BulkIncrementalSalesforceStream = generate_stream("Account", stream_config, stream_api)
 
     with requests_mock.Mocker() as m:
-        m.register_uri("GET", job_full_url_results, content=b'"IsDeleted","Age"\n"false",24\n')
-        tmp_file, response_encoding, _ = stream.download_data(url=job_full_url_results)
-        res = list(stream.read_with_chunks(tmp_file, response_encoding))
+        m.register_uri("GET", f"{job_full_url}/results", content=b'"IsDeleted","Age"\n"false",24\n')
+        res = list(stream.read_results(job_full_url))
         assert res == [{"IsDeleted": "false", "Age": "24"}]
 
 
-def test_read_with_chunks_should_return_a_string_when_a_string_with_only_digits_is_provided(stream_config, stream_api):
-    job_full_url_results: str = "https://fase-account.salesforce.com/services/data/v57.0/jobs/query/7504W00000bkgnpQAA/results"
+def test_read_results_should_return_a_string_when_a_string_with_only_digits_is_provided(stream_config, stream_api):
+    job_full_url: str = "https://fase-account.salesforce.com/services/data/v57.0/jobs/query/7504W00000bkgnpQAA"
     stream: BulkIncrementalSalesforceStream = generate_stream("Account", stream_config, stream_api)
 
     with requests_mock.Mocker() as m:
-        m.register_uri("GET", job_full_url_results, content=b'"ZipCode"\n"01234"\n')
-        tmp_file, response_encoding, _ = stream.download_data(url=job_full_url_results)
-        res = list(stream.read_with_chunks(tmp_file, response_encoding))
+        m.register_uri("GET", f"{job_full_url}/results", content=b'"ZipCode"\n"01234"\n')
+        res = list(stream.read_results(job_full_url))
         assert res == [{"ZipCode": "01234"}]
 
 
-def test_read_with_chunks_should_return_null_value_when_no_data_is_provided(stream_config, stream_api):
-    job_full_url_results: str = "https://fase-account.salesforce.com/services/data/v57.0/jobs/query/7504W00000bkgnpQAA/results"
+def test_read_results_should_return_null_value_when_no_data_is_provided(stream_config, stream_api):
+    job_full_url: str = "https://fase-account.salesforce.com/services/data/v57.0/jobs/query/7504W00000bkgnpQAA"
     stream: BulkIncrementalSalesforceStream = generate_stream("Account", stream_config, stream_api)
 
     with requests_mock.Mocker() as m:
-        m.register_uri("GET", job_full_url_results, content=b'"IsDeleted","Age","Name"\n"false",,"Airbyte"\n')
-        tmp_file, response_encoding, _ = stream.download_data(url=job_full_url_results)
-        res = list(stream.read_with_chunks(tmp_file, response_encoding))
+        m.register_uri("GET", f"{job_full_url}/results", content=b'"IsDeleted","Age","Name"\n"false",,"Airbyte"\n')
+        res = list(stream.read_results(job_full_url))
         assert res == [{"IsDeleted": "false", "Age": None, "Name": "Airbyte"}]
 
 
+def test_read_results_keeps_null_like_strings(stream_config, stream_api):
+    job_full_url: str = "https://fase-account.salesforce.com/services/data/v57.0/jobs/query/7504W00000bkgnpQAA"
+    stream: BulkIncrementalSalesforceStream = generate_stream("Account", stream_config, stream_api)
+
+    with requests_mock.Mocker() as m:
+        m.register_uri("GET", f"{job_full_url}/results", content=b'"Code","Name","Note"\n"NA","null","N/A"\n')
+        res = list(stream.read_results(job_full_url))
+        assert res == [{"Code": "NA", "Name": "null", "Note": "N/A"}]
+
+
+def test_read_results_follows_the_locator_and_stops_the_download_when_closed(stream_config, stream_api):
+    job_full_url: str = "https://fase-account.salesforce.com/services/data/v57.0/jobs/query/7504W00000bkgnpQAA"
+    stream: BulkIncrementalSalesforceStream = generate_stream("Account", stream_config, stream_api)
+    stream.RESULTS_BUFFERED_CHUNKS = 1
+
+    with requests_mock.Mocker() as m:
+        m.register_uri("GET", f"{job_full_url}/results", content=b'"Id"\n"1"\n"2"\n', headers={"Sforce-Locator": "page_2"})
+        m.register_uri("GET", f"{job_full_url}/results?locator=page_2", content=b'"Id"\n"3"\n', headers={"Sforce-Locator": "null"})
+        assert list(stream.read_results(job_full_url)) == [{"Id": "1"}, {"Id": "2"}, {"Id": "3"}]
+
+        records = stream.read_results(job_full_url)
+        assert next(records) == {"Id": "1"}
+        records.close()
+        downloaders = [thread for thread in threading.enumerate() if thread.name == f"{stream.name}-results"]
+        for downloader in downloaders:
+            downloader.join(timeout=5)
+            assert not downloader.is_alive()
+
+
 @pytest.mark.parametrize(
     "chunk_size, content_type_header, content, expected_result",
     encoding_symbols_parameters(),
     ids=[f"charset: {x[1]}, chunk_size: {x[0]}" for x in encoding_symbols_parameters()],
 )
 def test_encoding_symbols(stream_config, stream_api, chunk_size, content_type_header, content, expected_result):
-    job_full_url_results: str = "https://fase-account.salesforce.com/services/data/v57.0/jobs/query/7504W00000bkgnpQAA/results"
+    job_full_url: str = "https://fase-account.salesforce.com/services/data/v57.0/jobs/query/7504W00000bkgnpQAA"
     stream: BulkIncrementalSalesforceStream = generate_stream("Account", stream_config, stream_api)
+    # the multi-byte characters are split across the chunks
+    stream.RESULTS_CHUNK_SIZE = chunk_size
 
     with requests_mock.Mocker() as m:
-        m.register_uri("GET", job_full_url_results, headers=content_type_header, content=content)
-        tmp_file, response_encoding, _ = stream.download_data(url=job_full_url_results)
-        res = list(stream.read_with_chunks(tmp_file, response_encoding))
+        m.register_uri("GET", f"{job_full_url}/results", headers=content_type_header, content=content)
+        res = list(stream.read_results(job_full_url))
         assert res == expected_result
 
 
@@ -505,7 +532,7 @@ def test_pagination_rest(stream_config, stream_api):
 
 def test_csv_reader_dialect_unix():
     stream: BulkSalesforceStream = BulkSalesforceStream(stream_name=None, sf_api=None, pk=None)
-    url_results = "https://fake-account.salesforce.com/services/data/v57.0/jobs/query/7504W00000bkgnpQAA/results"
+    job_full_url = "https://fake-account.salesforce.com/services/data/v57.0/jobs/query/7504W00000bkgnpQAA"
 
     data = [
         {"Id": "1", "Name": '"first_name" "last_name"'},
@@ -521,9 +548,8 @@ def test_csv_reader_dialect_unix():
         text = csvfile.getvalue()
 
     with requests_mock.Mocker() as m:
-        m.register_uri("GET", url_results, text=text)
-        tmp_file, response_encoding, _ = stream.download_data(url=url_results)
-        result = [i for i in stream.read_with_chunks(tmp_file, response_encoding)]
+        m.register_uri("GET", f"{job_full_url}/results", text=text)
+        result = [i for i in stream.read_results(job_full_url)]
         assert result == data
 
 
@@ -643,6 +669,8 @@ def test_too_many_properties(stream_config, stream_api_v2_pk_too_many_properties
     assert stream.too_many_properties
     assert stream.primary_key
     assert type(stream) == RestSalesforceStream
+    # the responses are returned in the order of the requests, which are sent one by one
+    stream.property_chunk_concurrency_limit = 1
     url = next_page_url = "https://fase-account.salesforce.com/services/data/v57.0/queryAll"
     requests_mock.get(
         url,
@@ -676,6 +704,24 @@ def test_too_many_properties(stream_config, stream_api_v2_pk_too_many_properties
         assert len(call.url) < Salesforce.REQUEST_SIZE_LIMITS
 
 
+def test_too_many_properties_chunks_are_fetched_concurrently(stream_config, stream_api_v2_pk_too_many_properties, requests_mock):
+    stream = generate_stream("Account", stream_config, stream_api_v2_pk_too_many_properties)
+    chunks_len = len(list(stream.chunk_properties()))
+    assert chunks_len > stream.property_chunk_concurrency_limit > 1
+
+    def chunk_records(request, context):
+        # the chunk is identified by its first property after the primary key
+        chunk_property = urllib.parse.parse_qs(urllib.parse.urlparse(request.url).query)["q"][0].split(",")[1]
+        return {"records": [{"Id": record_id, chunk_property: record_id} for record_id in (1, 2)]}
+
+    requests_mock.get("https://fase-account.salesforce.com/services/data/v57.0/queryAll", json=chunk_records)
+    records = list(stream.read_records(sync_mode=SyncMode.full_refresh))
+
+    assert [record["Id"] for record in records] == [1, 2]
+    assert all(len(record) == chunks_len + 1 for record in records)
+    assert requests_mock.call_count == chunks_len
+
+
 def test_stream_with_no_records_in_response(stream_config, stream_api_v2_pk_too_many_properties, requests_mock):
     stream = generate_stream("Account", stream_config, stream_api_v2_pk_too_many_properties)
     chunks = list(stream.chunk_properties())
@@ -760,6 +806,77 @@ def test_bulk_stream_slices(stream_config_date_format, stream_api):
     assert expected_slices == stream_slices
 
 
+def _mock_jobs_of_slices(requests_mock, stream, job_ids):
+    for job_id in job_ids:
+        requests_mock.register_uri("GET", stream.path() + f"/{job_id}", json={"state": "JobComplete"})
+        requests_mock.register_uri("GET", stream.path() + f"/{job_id}/results", text=f"Field1,LastModifiedDate,ID\ntest,2023-01-15,{job_id}")
+        requests_mock.register_uri("PATCH", stream.path() + f"/{job_id}")
+        requests_mock.register_uri("DELETE", stream.path() + f"/{job_id}")
+    requests_mock.register_uri("POST", stream.path(), [{"json": {"id": job_id}} for job_id in job_ids])
+
+
+@freezegun.freeze_time("2023-04-01")
+def test_bulk_stream_creates_the_jobs_of_the_next_slices_ahead(stream_config_date_format, stream_api, requests_mock):
+    stream_config_date_format.update({"start_date": "2023-01-01"})
+    stream: BulkIncrementalSalesforceStream = generate_stream("Account", stream_config_date_format, stream_api)
+    _mock_jobs_of_slices(requests_mock, stream, ["fake_job_1", "fake_job_2", "fake_job_3"])
+
+    records = []
+    for stream_slice in stream.stream_slices(sync_mode=SyncMode.incremental):
+        records.extend(stream.read_records(sync_mode=SyncMode.incremental, stream_slice=stream_slice))
+
+    # the jobs of the three slices are created before the first job is checked, the results are read in the order of the slices
+    assert [request.method for request in requests_mock.request_history[:4]] == ["POST", "POST", "POST", "GET"]
+    assert [record["ID"] for record in records] == ["fake_job_1", "fake_job_2", "fake_job_3"]
+    assert not stream._submitted_jobs
+
+
+@freezegun.freeze_time("2023-04-01")
+def test_bulk_stream_deletes_the_jobs_created_ahead_when_the_read_stops(stream_config_date_format, stream_api, requests_mock):
+    stream_config_date_format.update({"start_date": "2023-01-01"})
+    stream: BulkIncrementalSalesforceStream = generate_stream("Account", stream_config_date_format, stream_api)
+    _mock_jobs_of_slices(requests_mock, stream, ["fake_job_1", "fake_job_2", "fake_job_3"])
+
+    stream_slices = stream.stream_slices(sync_mode=SyncMode.incremental)
+    assert len(list(stream.read_records(sync_mode=SyncMode.incremental, stream_slice=next(stream_slices)))) == 1
+    stream_slices.close()
+
+    deleted_jobs = [request.url.rsplit("/", 1)[-1] for request in requests_mock.request_history if request.method == "DELETE"]
+    assert deleted_jobs == ["fake_job_1", "fake_job_2", "fake_job_3"]
+    assert not stream._submitted_jobs
+
+
+@freezegun.freeze_time("2023-04-01")
+def test_bulk_stream_deletes_the_jobs_created_ahead_even_if_they_cannot_be_aborted(
+    stream_config_date_format, stream_api, requests_mock, caplog
+):
+    stream_config_date_format.update({"start_date": "2023-01-01"})
+    stream: BulkIncrementalSalesforceStream = generate_stream("Account", stream_config_date_format, stream_api)
+    _mock_jobs_of_slices(requests_mock, stream, ["fake_job_1", "fake_job_2", "fake_job_3"])
+    requests_mock.register_uri("PATCH", stream.path() + "/fake_job_2", status_code=400, json=[{"errorCode": "INVALIDJOBSTATE"}])
+    requests_mock.register_uri("DELETE", stream.path() + "/fake_job_2", status_code=404, json=[{"errorCode": "NOT_FOUND"}])
+
+    stream_slices = stream.stream_slices(sync_mode=SyncMode.incremental)
+    list(stream.read_records(sync_mode=SyncMode.incremental, stream_slice=next(stream_slices)))
+    stream_slices.close()
+
+    requests = [
+        (request.method, request.url.rsplit("/", 1)[-1])
+        for request in requests_mock.request_history
+        if request.method in ("PATCH", "DELETE")
+    ]
+    assert requests == [
+        ("DELETE", "fake_job_1"),
+        ("PATCH", "fake_job_2"),
+        ("DELETE", "fake_job_2"),
+        ("PATCH", "fake_job_3"),
+        ("DELETE", "fake_job_3"),
+    ]
+    assert "fake_job_2 created ahead could not be deleted, PATCH failed: 400 Client Error" in caplog.text
+    assert "fake_job_2 created ahead could not be deleted, DELETE failed: 404 Client Error" in caplog.text
+    assert not stream._submitted_jobs
+
+
 @freezegun.freeze_time("2023-04-01")
 def test_bulk_stream_request_params_states(stream_config_date_format, stream_api, bulk_catalog, requests_mock):
     """Check that request params ignore records cursor and use start date from slice ONLY"""
@@ -26,18 +26,17 @@ from source_salesforce.streams import BulkIncrementalSalesforceStream
         "200k records",
     ],
 )
-def test_memory_download_data(stream_config, stream_api, n_records, first_size, first_peak):
-    job_full_url_results: str = "https://fase-account.salesforce.com/services/data/v57.0/jobs/query/7504W00000bkgnpQAA/results"
+def test_memory_read_results(stream_config, stream_api, n_records, first_size, first_peak):
+    job_full_url: str = "https://fase-account.salesforce.com/services/data/v57.0/jobs/query/7504W00000bkgnpQAA"
     stream: BulkIncrementalSalesforceStream = generate_stream("Account", stream_config, stream_api)
     content = b'"Id","IsDeleted"'
     for _ in range(n_records):
         content += b'"0014W000027f6UwQAI","false"\n'
 
     with requests_mock.Mocker() as m:
-        m.register_uri("GET", job_full_url_results, content=content)
+        m.register_uri("GET", f"{job_full_url}/results", content=content)
         tracemalloc.start()
-        tmp_file, response_encoding, _ = stream.download_data(url=job_full_url_results)
-        for x in stream.read_with_chunks(tmp_file, response_encoding):
+        for x in stream.read_results(job_full_url):
             pass
         fs, fp = tracemalloc.get_traced_memory()
         first_size_in_mb, first_peak_in_mb = fs / 1024**2, fp / 1024**2